@@ -8,28 +8,84 @@ from typing import TYPE_CHECKING
 from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 if TYPE_CHECKING:
+    from flext_oracle_wms._utilities.async_client import (
+        FlextOracleWmsUtilitiesAsyncClient as FlextOracleWmsUtilitiesAsyncClient,
+    )
     from flext_oracle_wms._utilities.auth import (
         FlextOracleWmsUtilitiesAuth as FlextOracleWmsUtilitiesAuth,
     )
+    from flext_oracle_wms._utilities.cache import (
+        FlextOracleWmsUtilitiesCache as FlextOracleWmsUtilitiesCache,
+    )
     from flext_oracle_wms._utilities.client import (
         FlextOracleWmsUtilitiesClient as FlextOracleWmsUtilitiesClient,
     )
+    from flext_oracle_wms._utilities.columnar import (
+        FlextOracleWmsUtilitiesColumnar as FlextOracleWmsUtilitiesColumnar,
+    )
     from flext_oracle_wms._utilities.discovery import (
         FlextOracleWmsUtilitiesDiscovery as FlextOracleWmsUtilitiesDiscovery,
     )
+    from flext_oracle_wms._utilities.expressions import (
+        FlextOracleWmsUtilitiesExpressions as FlextOracleWmsUtilitiesExpressions,
+    )
     from flext_oracle_wms._utilities.filtering import (
         FlextOracleWmsUtilitiesFiltering as FlextOracleWmsUtilitiesFiltering,
     )
+    from flext_oracle_wms._utilities.grouping import (
+        FlextOracleWmsUtilitiesGrouping as FlextOracleWmsUtilitiesGrouping,
+    )
     from flext_oracle_wms._utilities.http_client import (
         FlextOracleWmsUtilitiesHttpClient as FlextOracleWmsUtilitiesHttpClient,
     )
+    from flext_oracle_wms._utilities.indexing import (
+        FlextOracleWmsUtilitiesIndexing as FlextOracleWmsUtilitiesIndexing,
+    )
+    from flext_oracle_wms._utilities.parallel import (
+        FlextOracleWmsUtilitiesParallel as FlextOracleWmsUtilitiesParallel,
+    )
+    from flext_oracle_wms._utilities.resilience import (
+        FlextOracleWmsUtilitiesResilience as FlextOracleWmsUtilitiesResilience,
+    )
+    from flext_oracle_wms._utilities.rows import (
+        FlextOracleWmsUtilitiesRows as FlextOracleWmsUtilitiesRows,
+    )
+    from flext_oracle_wms._utilities.sorting import (
+        FlextOracleWmsUtilitiesSorting as FlextOracleWmsUtilitiesSorting,
+    )
+    from flext_oracle_wms._utilities.streaming import (
+        FlextOracleWmsUtilitiesStreaming as FlextOracleWmsUtilitiesStreaming,
+    )
+    from flext_oracle_wms._utilities.transport import (
+        FlextOracleWmsUtilitiesTransport as FlextOracleWmsUtilitiesTransport,
+    )
+    from flext_oracle_wms._utilities.validators import (
+        FlextOracleWmsUtilitiesValidators as FlextOracleWmsUtilitiesValidators,
+    )
+    from flext_oracle_wms._utilities.vectorized import (
+        FlextOracleWmsUtilitiesVectorized as FlextOracleWmsUtilitiesVectorized,
+    )
 _LAZY_IMPORTS = build_lazy_import_map(
     {
+        ".async_client": ("FlextOracleWmsUtilitiesAsyncClient",),
         ".auth": ("FlextOracleWmsUtilitiesAuth",),
+        ".cache": ("FlextOracleWmsUtilitiesCache",),
         ".client": ("FlextOracleWmsUtilitiesClient",),
+        ".columnar": ("FlextOracleWmsUtilitiesColumnar",),
         ".discovery": ("FlextOracleWmsUtilitiesDiscovery",),
+        ".expressions": ("FlextOracleWmsUtilitiesExpressions",),
         ".filtering": ("FlextOracleWmsUtilitiesFiltering",),
+        ".grouping": ("FlextOracleWmsUtilitiesGrouping",),
         ".http_client": ("FlextOracleWmsUtilitiesHttpClient",),
+        ".indexing": ("FlextOracleWmsUtilitiesIndexing",),
+        ".parallel": ("FlextOracleWmsUtilitiesParallel",),
+        ".resilience": ("FlextOracleWmsUtilitiesResilience",),
+        ".rows": ("FlextOracleWmsUtilitiesRows",),
+        ".sorting": ("FlextOracleWmsUtilitiesSorting",),
+        ".streaming": ("FlextOracleWmsUtilitiesStreaming",),
+        ".transport": ("FlextOracleWmsUtilitiesTransport",),
+        ".validators": ("FlextOracleWmsUtilitiesValidators",),
+        ".vectorized": ("FlextOracleWmsUtilitiesVectorized",),
     },
 )
 
@@ -0,0 +1,255 @@
+"""Oracle WMS asyncio Client utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
+
+from flext_oracle_wms import FlextOracleWmsSettings, c, e, m, p, t
+from flext_oracle_wms._utilities.client import FlextOracleWmsUtilitiesClient
+from flext_oracle_wms._utilities.expressions import FilterEntry
+from flext_oracle_wms.errors import FlextOracleWmsError
+
+
+class FlextOracleWmsUtilitiesAsyncClient:
+    """Asyncio client utilities for Oracle WMS -- u.OracleWms.AsyncClient.*."""
+
+    class AsyncClient:
+        """Thread-offload wrapper giving ``Client`` an ``async`` surface.
+
+        This is not a native asyncio transport: ``FlextApi`` only exposes a
+        blocking request call, so every call runs the wrapped ``Client`` on a
+        thread of a dedicated executor and holds that thread until the
+        response is decoded. The event loop never blocks on I/O, but each
+        in-flight request costs one thread and at most ``max_workers`` calls
+        run at once. ``max_workers`` is independent of
+        ``connection_pool_size``; workers beyond the pooled keep-alive
+        connections of a host wait up to ``POOL_ACQUIRE_TIMEOUT`` for a lease.
+        """
+
+        def __init__(
+            self,
+            settings: FlextOracleWmsSettings | None = None,
+            *,
+            client: FlextOracleWmsUtilitiesClient.Client | None = None,
+            max_workers: int = c.OracleWms.Transport.ASYNC_MAX_WORKERS,
+        ) -> None:
+            """Initialize the async client around a new or existing sync client.
+
+            Raises:
+                e.BaseError: When ``max_workers`` is not positive.
+
+            """
+            if max_workers <= 0:
+                error_message = "Invalid max_workers"
+                raise e.BaseError(error_message)
+            self._client: FlextOracleWmsUtilitiesClient.Client = (
+                client
+                if client is not None
+                else FlextOracleWmsUtilitiesClient.Client(settings)
+            )
+            self.settings: FlextOracleWmsSettings = self._client.settings
+            self.max_workers: int = max_workers
+            self._executor: ThreadPoolExecutor | None = None
+
+        async def __aenter__(self) -> Self:
+            """Async context manager entry."""
+            return self
+
+        async def __aexit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+        ) -> None:
+            """Async context manager exit."""
+            await self.aclose()
+
+        async def aclose(self) -> None:
+            """Stop the wrapped client and release the request executor."""
+            if self._executor is not None:
+                _ = await self._run(self._client.stop)
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            else:
+                _ = self._client.stop()
+
+        async def create_lpn(
+            self, lpn_nbr: str, qty: int
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Create LPN (License Plate Number)."""
+            return await self._run(self._client.create_lpn, lpn_nbr, qty)
+
+        async def delete(
+            self,
+            path: str,
+            *,
+            headers: t.StrMapping | None = None,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Make DELETE request to Oracle WMS API."""
+            return await self._run(self._client.delete, path, headers=headers)
+
+        async def discover_entities(self) -> p.Result[t.StrSequence]:
+            """Discover available Oracle WMS entities."""
+            return await self._run(self._client.discover_entities)
+
+        async def gather_entities(
+            self,
+            entity_names: Sequence[str],
+            *,
+            limit: int | None = None,
+            filters: t.ConfigurationMapping | None = None,
+            concurrency: int | None = None,
+        ) -> Mapping[str, p.Result[t.SequenceOf[t.StrMapping]]]:
+            """Fetch several entities with at most ``concurrency`` requests in flight.
+
+            ``concurrency`` defaults to ``max_workers``; a larger value only
+            queues the extra requests on the executor.
+            """
+            semaphore = asyncio.Semaphore(
+                concurrency if concurrency is not None else self.max_workers
+            )
+
+            async def fetch(
+                entity_name: str,
+            ) -> tuple[str, p.Result[t.SequenceOf[t.StrMapping]]]:
+                async with semaphore:
+                    return entity_name, await self.get_entity_data(
+                        entity_name,
+                        limit,
+                        filters,
+                    )
+
+            results = await asyncio.gather(*(fetch(name) for name in entity_names))
+            return dict(results)
+
+        async def get(
+            self,
+            path: str,
+            *,
+            headers: t.StrMapping | None = None,
+            params: t.Api.WebParams | None = None,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Make GET request to Oracle WMS API."""
+            return await self._run(
+                self._client.get, path, headers=headers, params=params
+            )
+
+        async def get_entity_data(
+            self,
+            entity_name: str,
+            limit: int | None = None,
+            filters: t.ConfigurationMapping | None = None,
+            *,
+            validation: c.OracleWms.PayloadValidation | None = None,
+            conditions: t.MappingKV[str, FilterEntry] | None = None,
+        ) -> p.Result[t.SequenceOf[t.StrMapping]]:
+            """Get data for a specific Oracle WMS entity."""
+            return await self._run(
+                self._client.get_entity_data,
+                entity_name,
+                limit,
+                filters,
+                validation=validation,
+                conditions=conditions,
+            )
+
+        async def health_check(self) -> p.Result[m.Api.HttpResponse]:
+            """Check Oracle WMS API health."""
+            return await self._run(self._client.health_check)
+
+        async def iter_entity_data(
+            self,
+            entity_name: str,
+            *,
+            page_size: int = c.OracleWms.WmsProcessing.DEFAULT_PAGE_SIZE,
+            filters: t.ConfigurationMapping | None = None,
+            validation: c.OracleWms.PayloadValidation | None = None,
+        ) -> AsyncIterator[t.StrMapping]:
+            """Yield entity records page by page without blocking the event loop.
+
+            Each page is fetched by ``next`` on the wrapped ``Client`` page
+            iterator, so a page request occupies one executor thread.
+
+            Raises:
+                FlextOracleWmsError: When a page request or decode fails.
+
+            """
+            pages = self._client.iter_entity_pages(
+                entity_name,
+                page_size=page_size,
+                filters=filters,
+                validation=validation,
+            )
+            try:
+                while (page_result := await self._run(next, pages, None)) is not None:
+                    if page_result.failure:
+                        error_message = (
+                            page_result.error or "Entity page request failed"
+                        )
+                        raise FlextOracleWmsError(error_message)
+                    for record in page_result.value:
+                        yield record
+            finally:
+                pages.close()
+
+        async def post(
+            self,
+            path: str,
+            *,
+            headers: t.StrMapping | None = None,
+            body: t.Api.RequestBody | None = None,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Make POST request to Oracle WMS API."""
+            return await self._run(self._client.post, path, headers=headers, body=body)
+
+        async def put(
+            self,
+            path: str,
+            *,
+            headers: t.StrMapping | None = None,
+            body: t.Api.RequestBody | None = None,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Make PUT request to Oracle WMS API."""
+            return await self._run(self._client.put, path, headers=headers, body=body)
+
+        async def update_oblpn_tracking_number(
+            self,
+            oblpn_id: str,
+            tracking_number: str,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Update OBLPN tracking number."""
+            return await self._run(
+                self._client.update_oblpn_tracking_number,
+                oblpn_id,
+                tracking_number,
+            )
+
+        async def _run[**P, R](
+            self,
+            func: Callable[P, R],
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> R:
+            """Run a blocking client call on the request executor."""
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="oracle-wms-async",
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **kwargs),
+            )
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesAsyncClient"]
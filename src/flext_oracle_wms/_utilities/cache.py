@@ -0,0 +1,355 @@
+"""Oracle WMS Cache utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from flext_oracle_wms import c, m, t
+
+
+class FlextOracleWmsUtilitiesCache:
+    """Cache utilities for Oracle WMS -- u.OracleWms.Cache.*."""
+
+    class ConditionalCache[V]:
+        """Bounded LRU of per-URL validators and the value they validate.
+
+        Responses carrying ``ETag`` or ``Last-Modified`` are remembered so the
+        next GET of the same URL can be sent conditionally; a 304 then reuses
+        the stored value instead of transferring and decoding it again. Both
+        the number of URLs and the estimated size of their response bodies
+        are bounded, least recently used entries are evicted first.
+        """
+
+        def __init__(
+            self,
+            *,
+            max_entries: int = c.OracleWms.Cache.MAX_CONDITIONAL_ENTRIES,
+            max_bytes: int = c.OracleWms.Cache.MAX_CONDITIONAL_BYTES,
+        ) -> None:
+            """Initialize cache holding at most ``max_entries`` URLs."""
+            self.max_entries: int = max_entries
+            self.max_bytes: int = max_bytes
+            self._lock = threading.Lock()
+            self._entries: OrderedDict[str, tuple[str | None, str | None, int, V]] = (
+                OrderedDict()
+            )
+            self._size = 0
+
+        @property
+        def size_bytes(self) -> int:
+            """Estimated size of every remembered response body."""
+            with self._lock:
+                return self._size
+
+        def clear(self) -> None:
+            """Forget every remembered validator."""
+            with self._lock:
+                self._entries.clear()
+                self._size = 0
+
+        def lookup(self, key: str) -> V | None:
+            """Return the value validated by the last response for ``key``."""
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+                self._entries.move_to_end(key)
+                return entry[3]
+
+        def remember(
+            self,
+            key: str,
+            response: m.Api.HttpResponse,
+            value: V,
+        ) -> None:
+            """Store ``value`` when ``response`` carries cache validators.
+
+            Responses whose body alone exceeds ``max_bytes`` are not kept.
+            """
+            response_cache = FlextOracleWmsUtilitiesCache.ResponseCache
+            etag = response_cache.header(response, "ETag")
+            last_modified = response_cache.header(response, "Last-Modified")
+            size = (
+                response_cache.estimate_size(response)
+                if etag is not None or last_modified is not None
+                else 0
+            )
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._size -= previous[2]
+                if (etag is None and last_modified is None) or size > self.max_bytes:
+                    return
+                self._entries[key] = (etag, last_modified, size, value)
+                self._size += size
+                while (
+                    len(self._entries) > self.max_entries or self._size > self.max_bytes
+                ):
+                    _, (_, _, evicted_size, _) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+
+        def validators(self, key: str) -> t.StrMapping:
+            """Return ``If-None-Match`` / ``If-Modified-Since`` headers for key."""
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            etag, last_modified, _, _ = entry
+            headers: t.MutableStrMapping = {}
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+            return headers
+
+    class DiskCache:
+        """Persistent SQLite cache shared by worker processes on one host.
+
+        Bodies are stored once per SHA-256 digest and referenced by key, so
+        identical payloads (e.g. the same category listing for two tenants)
+        share storage. Entries carry their ``ETag`` / ``Last-Modified``
+        validators so stale entries can be revalidated instead of refetched.
+        Derived artifacts such as entity schemas can be stored under their own
+        keys with the same API.
+        """
+
+        def __init__(
+            self,
+            directory: str | Path,
+            *,
+            ttl: float,
+            clock: Callable[[], float] = time.time,
+        ) -> None:
+            """Initialize cache rooted at ``directory`` with entry lifetime."""
+            self.path: Path = Path(directory) / c.OracleWms.Cache.DISK_FILENAME
+            self.ttl: float = ttl
+            self._clock = clock
+            self._lock = threading.Lock()
+            self._connection: sqlite3.Connection | None = None
+
+        def close(self) -> None:
+            """Close the SQLite connection; it reopens on next use."""
+            with self._lock:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+
+        def load(self, key: str) -> m.OracleWms.CachedDocument | None:
+            """Return the stored document for ``key``, fresh or stale."""
+            with self._lock:
+                row = (
+                    self
+                    ._connect()
+                    .execute(
+                        "SELECT b.body, e.etag, e.last_modified, e.expires_at "
+                        "FROM entries e JOIN blobs b ON b.digest = e.digest "
+                        "WHERE e.key = ?",
+                        (key,),
+                    )
+                    .fetchone()
+                )
+            if row is None:
+                return None
+            body, etag, last_modified, expires_at = row
+            return m.OracleWms.CachedDocument(
+                body=bytes(body),
+                etag=etag,
+                last_modified=last_modified,
+                fresh=self._clock() < expires_at,
+            )
+
+        def store(
+            self,
+            key: str,
+            body: bytes,
+            *,
+            etag: str | None = None,
+            last_modified: str | None = None,
+        ) -> None:
+            """Store ``body`` under ``key`` with validators and a fresh TTL."""
+            digest = hashlib.sha256(body).hexdigest()
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    _ = connection.execute(
+                        "INSERT OR IGNORE INTO blobs (digest, body) VALUES (?, ?)",
+                        (digest, body),
+                    )
+                    _ = connection.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(key, digest, etag, last_modified, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, digest, etag, last_modified, self._clock() + self.ttl),
+                    )
+                    _ = connection.execute(
+                        "DELETE FROM blobs WHERE digest NOT IN "
+                        "(SELECT digest FROM entries)",
+                    )
+
+        def touch(self, key: str) -> None:
+            """Renew the TTL of ``key`` after a successful revalidation."""
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    _ = connection.execute(
+                        "UPDATE entries SET expires_at = ? WHERE key = ?",
+                        (self._clock() + self.ttl, key),
+                    )
+
+        def _connect(self) -> sqlite3.Connection:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    self.path,
+                    timeout=c.OracleWms.Cache.DISK_BUSY_TIMEOUT,
+                    check_same_thread=False,
+                )
+                _ = connection.execute("PRAGMA journal_mode=WAL")
+                _ = connection.execute(
+                    "CREATE TABLE IF NOT EXISTS blobs "
+                    "(digest TEXT PRIMARY KEY, body BLOB NOT NULL)",
+                )
+                _ = connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+                    "digest TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                    "expires_at REAL NOT NULL)",
+                )
+                connection.commit()
+                self._connection = connection
+            return self._connection
+
+    class ResponseCache:
+        """Thread-safe TTL cache of GET responses with a byte-bounded LRU.
+
+        Entries expire ``ttl`` seconds after insertion. When the estimated
+        size of all bodies exceeds ``max_bytes``, least recently used entries
+        are evicted first.
+        """
+
+        def __init__(
+            self,
+            *,
+            ttl: float,
+            max_bytes: int = c.OracleWms.Cache.MAX_BYTES,
+            clock: Callable[[], float] = time.monotonic,
+        ) -> None:
+            """Initialize cache with entry lifetime and byte budget."""
+            self.ttl: float = ttl
+            self.max_bytes: int = max_bytes
+            self._clock = clock
+            self._lock = threading.Lock()
+            self._entries: OrderedDict[str, tuple[float, int, m.Api.HttpResponse]] = (
+                OrderedDict()
+            )
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+        @staticmethod
+        def header(response: m.Api.HttpResponse, name: str) -> str | None:
+            """Return a response header value by case-insensitive name."""
+            headers = getattr(response, "headers", None)
+            if not isinstance(headers, Mapping):
+                return None
+            wanted = name.lower()
+            return next(
+                (
+                    str(value)
+                    for key, value in headers.items()
+                    if str(key).lower() == wanted
+                ),
+                None,
+            )
+
+        @staticmethod
+        def make_key(
+            path: str,
+            params: t.Api.WebParams | None,
+            identity: str,
+        ) -> str:
+            """Build a key from path, sorted query params and auth identity."""
+            query = "&".join(
+                f"{name}={value}" for name, value in sorted((params or {}).items())
+            )
+            digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+            return f"{digest}|{path}?{query}"
+
+        @staticmethod
+        def estimate_size(response: m.Api.HttpResponse) -> int:
+            """Estimate the in-memory cost of a response body in bytes."""
+            match response.body:
+                case bytes() as raw:
+                    return len(raw)
+                case str() as text:
+                    return len(text.encode())
+                case None:
+                    return 0
+                case body:
+                    return len(json.dumps(body, default=str))
+
+        def clear(self) -> None:
+            """Drop every cached response."""
+            with self._lock:
+                self._entries.clear()
+                self._size = 0
+
+        def get(self, key: str) -> m.Api.HttpResponse | None:
+            """Return a fresh cached response and mark it recently used."""
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._misses += 1
+                    return None
+                expires_at, size, response = entry
+                if self._clock() >= expires_at:
+                    del self._entries[key]
+                    self._size -= size
+                    self._misses += 1
+                    return None
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return response
+
+        def put(self, key: str, response: m.Api.HttpResponse) -> None:
+            """Store ``response`` unless it alone exceeds the byte budget."""
+            if self.ttl <= 0:
+                return
+            size = self.estimate_size(response)
+            if size > self.max_bytes:
+                return
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._size -= previous[1]
+                self._entries[key] = (self._clock() + self.ttl, size, response)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+                    self._evictions += 1
+
+        def stats(self) -> m.OracleWms.CacheStats:
+            """Return a snapshot of cache hit, miss and size counters."""
+            with self._lock:
+                return m.OracleWms.CacheStats(
+                    hits=self._hits,
+                    misses=self._misses,
+                    evictions=self._evictions,
+                    entries=len(self._entries),
+                    size_bytes=self._size,
+                )
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesCache"]
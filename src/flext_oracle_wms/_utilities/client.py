@@ -6,10 +6,28 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from flext_api import FlextApi, FlextApiSettings, u
+import json
+from collections import deque
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flext_api import FlextApi, FlextApiSettings
 
 from flext_oracle_wms import FlextOracleWmsSettings, c, m, p, r, t
 from flext_oracle_wms._utilities.auth import FlextOracleWmsUtilitiesAuth
+from flext_oracle_wms._utilities.cache import FlextOracleWmsUtilitiesCache
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
+from flext_oracle_wms._utilities.expressions import (
+    FilterEntry,
+    FlextOracleWmsUtilitiesExpressions,
+)
+from flext_oracle_wms._utilities.filtering import FlextOracleWmsUtilitiesFiltering
+from flext_oracle_wms._utilities.resilience import FlextOracleWmsUtilitiesResilience
+from flext_oracle_wms._utilities.rows import FlextOracleWmsUtilitiesRows
+from flext_oracle_wms._utilities.streaming import FlextOracleWmsUtilitiesStreaming
+from flext_oracle_wms._utilities.transport import FlextOracleWmsUtilitiesTransport
+from flext_oracle_wms._utilities.validators import FlextOracleWmsUtilitiesValidators
+from flext_oracle_wms.errors import FlextOracleWmsError
 
 
 class FlextOracleWmsUtilitiesClient:
@@ -40,14 +58,36 @@ class FlextOracleWmsUtilitiesClient:
             resolved_settings = FlextOracleWmsSettings.model_validate({
                 "base_url": base_settings.base_url,
                 "timeout": base_settings.timeout,
+                "connection_pool_size": base_settings.connection_pool_size,
+                "retry_attempts": base_settings.retry_attempts,
+                "retry_budget": base_settings.retry_budget,
+                "rate_limit": base_settings.rate_limit,
+                "cache_duration": base_settings.cache_duration,
+                "cache_max_bytes": base_settings.cache_max_bytes,
+                "reference_entities": base_settings.reference_entities,
+                "payload_validation": base_settings.payload_validation,
+                "persistent_cache_dir": base_settings.persistent_cache_dir,
+                "persistent_cache_duration": base_settings.persistent_cache_duration,
+                "circuit_failure_rate": base_settings.circuit_failure_rate,
+                "circuit_window_size": base_settings.circuit_window_size,
+                "circuit_open_seconds": base_settings.circuit_open_seconds,
                 "username": auth_settings.username or base_settings.username,
                 "password": auth_settings.password or base_settings.password,
                 "auth_method": auth_settings.normalized_method,
             })
             return r[FlextOracleWmsUtilitiesClient.Client].ok(cls(resolved_settings))
 
-        def __init__(self, settings: FlextOracleWmsSettings | None = None) -> None:
-            """Initialize client with strict settings resolution."""
+        def __init__(
+            self,
+            settings: FlextOracleWmsSettings | None = None,
+            *,
+            rate_limiter: FlextOracleWmsUtilitiesResilience.RateLimiter | None = None,
+        ) -> None:
+            """Initialize client with strict settings resolution.
+
+            ``rate_limiter`` lets several clients share one adaptive limiter;
+            otherwise one is created when ``settings.rate_limit`` is positive.
+            """
             resolved_config = (
                 settings
                 if settings is not None
@@ -61,7 +101,55 @@ class FlextOracleWmsUtilitiesClient:
                 "headers": default_headers,
                 "default_headers": default_headers,
             })
-            self._client: FlextApi | None = self._create_api_client()
+            self._client: FlextOracleWmsUtilitiesTransport.ConnectionPool | None = (
+                self._create_api_client()
+            )
+            self._retry_policy = FlextOracleWmsUtilitiesResilience.RetryPolicy(
+                max_retries=self.settings.retry_attempts,
+                budget=self.settings.retry_budget,
+            )
+            self._rate_limiter: FlextOracleWmsUtilitiesResilience.RateLimiter | None = (
+                rate_limiter
+                if rate_limiter is not None
+                else FlextOracleWmsUtilitiesResilience.RateLimiter(
+                    rate=self.settings.rate_limit
+                )
+                if self.settings.rate_limit > 0
+                else None
+            )
+            self._circuit_breakers = (
+                FlextOracleWmsUtilitiesResilience.CircuitBreakerRegistry(
+                    window_size=self.settings.circuit_window_size,
+                    failure_rate_threshold=self.settings.circuit_failure_rate,
+                    open_seconds=self.settings.circuit_open_seconds,
+                )
+            )
+            self._response_cache: FlextOracleWmsUtilitiesCache.ResponseCache | None = (
+                FlextOracleWmsUtilitiesCache.ResponseCache(
+                    ttl=self.settings.cache_duration,
+                    max_bytes=self.settings.cache_max_bytes,
+                )
+                if self.settings.cache_duration > 0
+                else None
+            )
+            self._conditional_cache: FlextOracleWmsUtilitiesCache.ConditionalCache[
+                m.Api.HttpResponse
+            ] = FlextOracleWmsUtilitiesCache.ConditionalCache()
+            self._disk_cache: FlextOracleWmsUtilitiesCache.DiskCache | None = (
+                FlextOracleWmsUtilitiesCache.DiskCache(
+                    self.settings.persistent_cache_dir,
+                    ttl=self.settings.persistent_cache_duration,
+                )
+                if self.settings.persistent_cache_dir
+                else None
+            )
+            self._cache_identity = (
+                f"{self.settings.base_url}|{self.settings.username}"
+                f"|{self.settings.auth_method}"
+            )
+            self._row_factories: dict[
+                str, FlextOracleWmsUtilitiesRows.RowFactory[str]
+            ] = {}
             self._discovered_entities: t.StrSequence = []
             self._started = False
 
@@ -95,33 +183,428 @@ class FlextOracleWmsUtilitiesClient:
                 raise ValueError(error_message)
             return auth_headers.value
 
-        def _create_api_client(self) -> FlextApi:
-            """Create a configured API client for Oracle WMS requests."""
-            return FlextApi(settings=self._api_config)
+        def _create_api_client(
+            self,
+        ) -> FlextOracleWmsUtilitiesTransport.ConnectionPool:
+            """Create the pooled keep-alive transport for Oracle WMS requests."""
+            return FlextOracleWmsUtilitiesTransport.ConnectionPool(
+                lambda: FlextApi(settings=self._api_config),
+                max_size=self.settings.connection_pool_size,
+            )
 
         @staticmethod
         def _decode_response_model[T: m.BaseModel](
             payload: t.Api.ResponseBody | t.JsonValue,
             model_type: type[T],
         ) -> p.Result[T]:
-            if isinstance(payload, dict):
-                return u.try_(
-                    lambda: model_type.model_validate(payload),
-                    catch=c.ValidationError,
-                ).map_error(lambda exc: f"Invalid response payload: {exc}")
-            if isinstance(payload, str):
-                return u.try_(
-                    lambda: model_type.model_validate_json(payload),
-                    catch=c.ValidationError,
-                ).map_error(lambda exc: f"Invalid JSON payload: {exc}")
-            if isinstance(payload, bytes):
-                return u.try_(
-                    lambda: model_type.model_validate_json(payload),
-                    catch=c.ValidationError,
-                ).map_error(lambda exc: f"Invalid JSON payload: {exc}")
-            if payload is None:
-                return r[T].fail("Empty response payload")
-            return r[T].fail("Unsupported response type")
+            return FlextOracleWmsUtilitiesValidators.Registry.decoder(
+                model_type
+            ).decode(payload)
+
+        @staticmethod
+        def _entity_params(
+            filters: t.ConfigurationMapping | None,
+            *,
+            limit: int | None = None,
+            page: int | None = None,
+            page_size: int | None = None,
+        ) -> t.Api.WebParams:
+            """Build entity query parameters from limit, paging and filters."""
+            params_dict: dict[str, str] = {}
+            if limit is not None:
+                params_dict["limit"] = str(limit)
+            if page is not None:
+                params_dict["page"] = str(page)
+            if page_size is not None:
+                params_dict["page_size"] = str(page_size)
+            if filters:
+                params_dict |= {key: str(value) for key, value in filters.items()}
+            params: t.Api.WebParams = params_dict
+            return params
+
+        def _cached_get(
+            self,
+            path: str,
+            params: t.Api.WebParams | None = None,
+            *,
+            headers: t.StrMapping | None = None,
+            revalidating: bool = False,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """GET through the TTL response cache when caching is enabled."""
+            cache = self._response_cache
+            if cache is None:
+                return self._get(
+                    path, headers=headers, params=params, revalidating=revalidating
+                )
+            key = cache.make_key(path, params, self._cache_identity)
+            cached = cache.get(key)
+            if cached is not None:
+                return r[m.Api.HttpResponse].ok(cached)
+            result = self._get(
+                path, headers=headers, params=params, revalidating=revalidating
+            )
+            if (
+                result.success
+                and result.value.status_code
+                != c.OracleWms.Cache.NOT_MODIFIED_STATUS_CODE
+            ):
+                cache.put(key, result.value)
+            return result
+
+        def _get(
+            self,
+            path: str,
+            *,
+            headers: t.StrMapping | None = None,
+            params: t.Api.WebParams | None = None,
+            revalidating: bool = False,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Run ``get``; ``revalidating`` callers receive their 304 as is.
+
+            Only callers that hold the body named by their own validators (the
+            disk cache) may set ``revalidating``.
+            """
+            conditional = self._conditional_cache
+            key = FlextOracleWmsUtilitiesCache.ResponseCache.make_key(
+                path, params, self._cache_identity
+            )
+            caller_headers: t.StrMapping = headers or {}
+            caller_validated = any(
+                name.lower() in c.OracleWms.Cache.VALIDATOR_HEADERS
+                for name in caller_headers
+            )
+            result = self._request(
+                c.Api.Method.GET,
+                path,
+                headers=(
+                    caller_headers
+                    if caller_validated
+                    else {**conditional.validators(key), **caller_headers}
+                ),
+                params=params,
+            )
+            if result.failure or (caller_validated and revalidating):
+                return result
+            if result.value.status_code == c.OracleWms.Cache.NOT_MODIFIED_STATUS_CODE:
+                cached = None if caller_validated else conditional.lookup(key)
+                if cached is not None:
+                    return r[m.Api.HttpResponse].ok(cached)
+                result = self._request(
+                    c.Api.Method.GET,
+                    path,
+                    headers={
+                        name: value
+                        for name, value in caller_headers.items()
+                        if name.lower() not in c.OracleWms.Cache.VALIDATOR_HEADERS
+                    },
+                    params=params,
+                )
+                if result.failure:
+                    return result
+                if (
+                    result.value.status_code
+                    == c.OracleWms.Cache.NOT_MODIFIED_STATUS_CODE
+                ):
+                    return r[m.Api.HttpResponse].fail(
+                        f"GET {path} returned HTTP 304 to an unconditional request",
+                    )
+            conditional.remember(key, result.value, result.value)
+            return result
+
+        def _page_get(
+            self,
+            path: str,
+            params: t.Api.WebParams | None,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """GET one entity data page without the conditional cache.
+
+            Entity pages are rarely requested twice and can be large, so their
+            validators and bodies are not remembered the way discovery and
+            reference resources are.
+            """
+            return self._request(c.Api.Method.GET, path, params=params)
+
+        def _discovery_body(self, path: str) -> p.Result[t.Api.ResponseBody]:
+            """Fetch a discovery body from memory, then disk, then the network.
+
+            Stale disk entries are revalidated with ``If-None-Match`` /
+            ``If-Modified-Since``; a 304 renews them without a new download.
+            """
+            disk = self._disk_cache
+            if disk is None:
+                result = self._cached_get(path)
+                if result.failure:
+                    return r[t.Api.ResponseBody].fail(result.error)
+                return r[t.Api.ResponseBody].ok(result.value.body)
+            key = FlextOracleWmsUtilitiesCache.ResponseCache.make_key(
+                path, None, self._cache_identity
+            )
+            document = disk.load(key)
+            if document is not None and document.fresh:
+                return r[t.Api.ResponseBody].ok(document.body)
+            validators: t.MutableStrMapping = {}
+            if document is not None and document.etag:
+                validators["If-None-Match"] = document.etag
+            if document is not None and document.last_modified:
+                validators["If-Modified-Since"] = document.last_modified
+            result = self._cached_get(path, headers=validators, revalidating=True)
+            if result.failure:
+                return r[t.Api.ResponseBody].fail(result.error)
+            response = result.value
+            if (
+                document is not None
+                and response.status_code == c.OracleWms.Cache.NOT_MODIFIED_STATUS_CODE
+            ):
+                disk.touch(key)
+                return r[t.Api.ResponseBody].ok(document.body)
+            match response.body:
+                case bytes() as raw:
+                    body_bytes = raw
+                case str() as text:
+                    body_bytes = text.encode()
+                case body:
+                    body_bytes = json.dumps(body).encode()
+            header = FlextOracleWmsUtilitiesCache.ResponseCache.header
+            disk.store(
+                key,
+                body_bytes,
+                etag=header(response, "ETag"),
+                last_modified=header(response, "Last-Modified"),
+            )
+            return r[t.Api.ResponseBody].ok(response.body)
+
+        def _fetch_entity_page(
+            self,
+            path: str,
+            params: t.Api.WebParams | None,
+            *,
+            cacheable: bool = False,
+            validation: c.OracleWms.PayloadValidation = (
+                c.OracleWms.PayloadValidation.FULL
+            ),
+        ) -> p.Result[m.OracleWms.EntityDataResponse]:
+            """GET one entity page and decode it into ``EntityDataResponse``."""
+            result = (
+                self._cached_get(path, params)
+                if cacheable
+                else self._page_get(path, params)
+            )
+            if result.failure:
+                return r[m.OracleWms.EntityDataResponse].fail(result.error)
+            return self._decode_entity_page(result.value.body, validation)
+
+        @staticmethod
+        def _decode_entity_page(
+            payload: t.Api.ResponseBody,
+            validation: c.OracleWms.PayloadValidation,
+        ) -> p.Result[m.OracleWms.EntityDataResponse]:
+            """Decode an entity page with the requested validation depth.
+
+            ``full`` validates every record. ``shape`` validates the envelope
+            and only checks that ``data`` is a list of objects. ``none``
+            constructs the model from the parsed body without any checks.
+            """
+            model = m.OracleWms.EntityDataResponse
+            decoder = FlextOracleWmsUtilitiesValidators.Registry.decoder(model)
+            if validation == c.OracleWms.PayloadValidation.FULL:
+                return decoder.decode(payload)
+            match payload:
+                case bytes() | str() as raw:
+                    try:
+                        parsed = json.loads(raw)
+                    except ValueError as exc:
+                        return r[model].fail(f"Invalid JSON payload: {exc}")
+                case parsed:
+                    pass
+            if not isinstance(parsed, dict):
+                return r[model].fail("Invalid response payload: expected an object")
+            if validation == c.OracleWms.PayloadValidation.NONE:
+                return r[model].ok(
+                    model.model_construct(**{
+                        name: parsed[name]
+                        for name in model.model_fields
+                        if name in parsed
+                    })
+                )
+            data = parsed.get("data", [])
+            if not isinstance(data, list) or not all(
+                isinstance(record, dict) for record in data
+            ):
+                return r[model].fail("Invalid response payload: data is not a list")
+            envelope = decoder.decode({
+                name: value for name, value in parsed.items() if name != "data"
+            })
+            return envelope.map(lambda page: page.model_copy(update={"data": data}))
+
+        @staticmethod
+        def _has_next_page(
+            record_count: int,
+            page_count: int | None,
+            page: int,
+            page_size: int,
+        ) -> bool:
+            """Return whether numbered pagination continues after ``page``."""
+            if not record_count:
+                return False
+            if page_count is not None:
+                return page < page_count
+            return record_count >= page_size
+
+        @staticmethod
+        def _entity_record(
+            item: t.JsonValue,
+            validation: c.OracleWms.PayloadValidation,
+        ) -> t.StrMapping:
+            """Check one streamed record against the ``EntityDataResponse`` shape.
+
+            Below ``full`` validation only the record's object shape is checked.
+
+            Raises:
+                FlextOracleWmsError: When the record is not a string mapping.
+
+            """
+            if isinstance(item, dict) and (
+                validation != c.OracleWms.PayloadValidation.FULL
+                or all(
+                    isinstance(key, str) and isinstance(value, str)
+                    for key, value in item.items()
+                )
+            ):
+                return item
+            error_message = f"Invalid entity record: {item!r}"
+            raise FlextOracleWmsError(error_message)
+
+        def _row_factory(
+            self, entity_name: str
+        ) -> FlextOracleWmsUtilitiesRows.RowFactory[str]:
+            """Return the row factory sharing key tables for ``entity_name``."""
+            factory = self._row_factories.get(entity_name)
+            if factory is None:
+                factory = self._row_factories.setdefault(
+                    entity_name, FlextOracleWmsUtilitiesRows.RowFactory()
+                )
+            return factory
+
+        @staticmethod
+        def _pushdown(
+            filters: t.ConfigurationMapping | None,
+            conditions: t.MappingKV[str, FilterEntry] | None,
+        ) -> p.Result[
+            tuple[
+                t.ConfigurationMapping | None,
+                FlextOracleWmsUtilitiesExpressions.CompiledFilter | None,
+            ]
+        ]:
+            """Merge pushable ``conditions`` into ``filters``; compile the rest.
+
+            A pushed-down parameter that ``filters`` already sets is rejected
+            rather than silently overriding the caller's value.
+            """
+            result_type = r[
+                tuple[
+                    t.ConfigurationMapping | None,
+                    FlextOracleWmsUtilitiesExpressions.CompiledFilter | None,
+                ]
+            ]
+            if not conditions:
+                return result_type.ok((filters, None))
+            engine = FlextOracleWmsUtilitiesFiltering.Filter()
+            pushdown_result = engine.pushdown(conditions)
+            if pushdown_result.failure:
+                return result_type.fail(pushdown_result.error)
+            pushdown = pushdown_result.value
+            if collisions := sorted(set(filters or {}) & set(pushdown.params)):
+                return result_type.fail(
+                    f"Query parameters set by both filters and conditions: "
+                    f"{', '.join(collisions)}"
+                )
+            return result_type.ok((
+                {**(filters or {}), **pushdown.params},
+                engine.compile(pushdown.residual) if pushdown.residual else None,
+            ))
+
+        def _iter_entity_pages_prefetched(
+            self,
+            path: str,
+            *,
+            page_size: int,
+            filters: t.ConfigurationMapping | None,
+            depth: int,
+            validation: c.OracleWms.PayloadValidation,
+        ) -> Iterator[p.Result[t.SequenceOf[t.StrMapping]]]:
+            """Yield entity pages in order while keeping ``depth`` requests in flight.
+
+            Numbered pages are fetched speculatively ahead of the consumer;
+            ``next_page`` cursors can only be followed one page ahead. Closing
+            the generator cancels every page that has not started yet.
+            """
+            executor = ThreadPoolExecutor(
+                max_workers=depth,
+                thread_name_prefix="oracle-wms-prefetch",
+            )
+            pending: deque[Future[p.Result[m.OracleWms.EntityDataResponse]]] = deque()
+            page = 1
+            next_submit = 2
+            try:
+                current = self._fetch_entity_page(
+                    path,
+                    self._entity_params(filters, page=page, page_size=page_size),
+                    validation=validation,
+                )
+                while True:
+                    if current.failure:
+                        yield r[t.SequenceOf[t.StrMapping]].fail(current.error)
+                        return
+                    payload = current.value
+                    if payload.data and payload.next_page:
+                        for future in pending:
+                            _ = future.cancel()
+                        pending.clear()
+                        pending.append(
+                            executor.submit(
+                                self._fetch_entity_page,
+                                payload.next_page,
+                                None,
+                                validation=validation,
+                            )
+                        )
+                    elif self._has_next_page(
+                        len(payload.data), payload.page_count, page, page_size
+                    ):
+                        last_page = payload.page_count
+                        while len(pending) < depth and (
+                            last_page is None or next_submit <= last_page
+                        ):
+                            pending.append(
+                                executor.submit(
+                                    self._fetch_entity_page,
+                                    path,
+                                    self._entity_params(
+                                        filters, page=next_submit, page_size=page_size
+                                    ),
+                                    validation=validation,
+                                )
+                            )
+                            next_submit += 1
+                    else:
+                        for future in pending:
+                            _ = future.cancel()
+                        pending.clear()
+                    yield r[t.SequenceOf[t.StrMapping]].ok(payload.data)
+                    if not pending:
+                        return
+                    current = pending.popleft().result()
+                    page += 1
+            finally:
+                for future in pending:
+                    _ = future.cancel()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        def cache_stats(self) -> m.OracleWms.CacheStats:
+            """Return response cache hit, miss and size counters."""
+            if self._response_cache is None:
+                return m.OracleWms.CacheStats()
+            return self._response_cache.stats()
 
         def call_api(
             self,
@@ -138,6 +621,10 @@ class FlextOracleWmsUtilitiesClient:
             payload: t.Api.RequestBody = {"lpn_nbr": lpn_nbr, "qty": qty}
             return self.post("/lpn", body=payload)
 
+        def circuit_states(self) -> Mapping[str, c.OracleWms.CircuitState]:
+            """Return the circuit state of every endpoint called so far."""
+            return self._circuit_breakers.states()
+
         def delete(
             self,
             path: str,
@@ -149,11 +636,11 @@ class FlextOracleWmsUtilitiesClient:
 
         def discover_entities(self) -> p.Result[t.StrSequence]:
             """Discover available Oracle WMS entities."""
-            result = self.get("/entities")
-            if result.failure:
-                return r[t.StrSequence].fail(result.error)
+            body_result = self._discovery_body("/entities")
+            if body_result.failure:
+                return r[t.StrSequence].fail(body_result.error)
             payload_result = self._decode_response_model(
-                result.value.body,
+                body_result.value,
                 m.OracleWms.EntitiesResponse,
             )
             if payload_result.failure:
@@ -168,23 +655,25 @@ class FlextOracleWmsUtilitiesClient:
             headers: t.StrMapping | None = None,
             params: t.Api.WebParams | None = None,
         ) -> p.Result[m.Api.HttpResponse]:
-            """Make GET request to Oracle WMS API."""
-            return self._request(
-                c.Api.Method.GET,
-                path,
-                headers=headers,
-                params=params,
-            )
+            """Make GET request to Oracle WMS API.
+
+            Repeat GETs of a URL that returned ``ETag`` / ``Last-Modified`` are
+            sent conditionally; a 304 returns the previously received response.
+            Callers may pass their own validators instead. A 304 that no
+            remembered response backs (evicted meanwhile, or validators this
+            cache never issued) is followed by one unconditional GET.
+            """
+            return self._get(path, headers=headers, params=params)
 
         def get_apis_by_category(
             self, category: str
         ) -> p.Result[t.SequenceOf[t.StrMapping]]:
             """Get Oracle WMS APIs by category."""
-            result = self.get(f"/apis/category/{category}")
-            if result.failure:
-                return r[t.SequenceOf[t.StrMapping]].fail(result.error)
+            body_result = self._discovery_body(f"/apis/category/{category}")
+            if body_result.failure:
+                return r[t.SequenceOf[t.StrMapping]].fail(body_result.error)
             payload_result = self._decode_response_model(
-                result.value.body,
+                body_result.value,
                 m.OracleWms.ApiCategoryResponse,
             )
             if payload_result.failure:
@@ -196,28 +685,245 @@ class FlextOracleWmsUtilitiesClient:
             entity_name: str,
             limit: int | None = None,
             filters: t.ConfigurationMapping | None = None,
+            *,
+            validation: c.OracleWms.PayloadValidation | None = None,
+            compact_rows: bool = False,
+            conditions: t.MappingKV[str, FilterEntry] | None = None,
         ) -> p.Result[t.SequenceOf[t.StrMapping]]:
-            """Get data for a specific Oracle WMS entity."""
-            params_dict: dict[str, str] = {}
-            if limit is not None:
-                params_dict["limit"] = str(limit)
-            if filters:
-                params_dict |= {key: str(value) for key, value in filters.items()}
-            params: t.Api.WebParams = params_dict
-            result = self.get(f"/entities/{entity_name}", params=params)
+            """Get data for a specific Oracle WMS entity.
+
+            ``validation`` overrides ``settings.payload_validation`` for this call.
+            With ``compact_rows`` records are tuple-backed ``Row`` mappings that
+            share one interned key table per entity. ``conditions`` use
+            ``Filter`` syntax: supported ones are sent as WMS query parameters,
+            the rest are applied to the response. When some conditions stay
+            client-side, ``limit`` counts matching records: pages are streamed
+            until ``limit`` matches are found.
+            """
+            pushdown_result = self._pushdown(filters, conditions)
+            if pushdown_result.failure:
+                return r[t.SequenceOf[t.StrMapping]].fail(pushdown_result.error)
+            filters, residual = pushdown_result.value
+            records: t.SequenceOf[t.StrMapping]
+            if residual is not None and limit is not None:
+                pages = self.iter_entity_data(
+                    entity_name,
+                    page_size=max(limit, c.OracleWms.WmsProcessing.DEFAULT_PAGE_SIZE),
+                    filters=filters,
+                    validation=validation,
+                )
+                try:
+                    records = tuple(residual.stream(pages, limit))
+                except FlextOracleWmsError as exc:
+                    return r[t.SequenceOf[t.StrMapping]].fail(str(exc))
+            else:
+                params = self._entity_params(filters, limit=limit)
+                payload_result = self._fetch_entity_page(
+                    f"/entities/{entity_name}",
+                    params,
+                    cacheable=entity_name in self.settings.reference_entities,
+                    validation=validation or self.settings.payload_validation,
+                )
+                if payload_result.failure:
+                    return r[t.SequenceOf[t.StrMapping]].fail(payload_result.error)
+                records = payload_result.value.data
+                if residual is not None:
+                    records = tuple(filter(residual, records))
+            if compact_rows:
+                make_row = self._row_factory(entity_name)
+                records = tuple(make_row(record) for record in records)
+            return r[t.SequenceOf[t.StrMapping]].ok(records)
+
+        def get_entity_data_columnar(
+            self,
+            entity_name: str,
+            limit: int | None = None,
+            filters: t.ConfigurationMapping | None = None,
+            *,
+            validation: c.OracleWms.PayloadValidation | None = None,
+        ) -> p.Result[FlextOracleWmsUtilitiesColumnar.RecordBatch]:
+            """Get entity data as a columnar ``RecordBatch``.
+
+            Records are streamed from the response body straight into columns,
+            so no per-row dict outlives its decode.
+            """
+            params = self._entity_params(filters, limit=limit)
+            path = f"/entities/{entity_name}"
+            result = (
+                self._cached_get(path, params)
+                if entity_name in self.settings.reference_entities
+                else self._page_get(path, params)
+            )
             if result.failure:
-                return r[t.SequenceOf[t.StrMapping]].fail(result.error)
-            payload_result = self._decode_response_model(
-                result.value.body,
-                m.OracleWms.EntityDataResponse,
+                return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].fail(result.error)
+            mode = validation or self.settings.payload_validation
+            decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder("data")
+            try:
+                batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(
+                    self._entity_record(item, mode)
+                    for item in decoder.iter_items(result.value.body)
+                )
+            except FlextOracleWmsError as exc:
+                return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].fail(str(exc))
+            return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].ok(batch)
+
+        def iter_entity_data(
+            self,
+            entity_name: str,
+            *,
+            page_size: int = c.OracleWms.WmsProcessing.DEFAULT_PAGE_SIZE,
+            filters: t.ConfigurationMapping | None = None,
+            prefetch: int = 0,
+            validation: c.OracleWms.PayloadValidation | None = None,
+            compact_rows: bool = False,
+            conditions: t.MappingKV[str, FilterEntry] | None = None,
+        ) -> Iterator[t.StrMapping]:
+            """Yield entity records lazily, fetching one page at a time.
+
+            Without ``prefetch`` each page body is decoded incrementally, so a
+            record is yielded as soon as it is parsed and peak memory tracks a
+            single record rather than the decoded page. ``compact_rows`` yields
+            tuple-backed ``Row`` mappings sharing interned keys per entity.
+            ``conditions`` are pushed down like in ``get_entity_data``.
+
+            Raises:
+                FlextOracleWmsError: When a page request or decode fails, or
+                    ``conditions`` are invalid.
+
+            """
+            pushdown_result = self._pushdown(filters, conditions)
+            if pushdown_result.failure:
+                error_message = pushdown_result.error or "Invalid filter conditions"
+                raise FlextOracleWmsError(error_message)
+            filters, residual = pushdown_result.value
+            make_row = self._row_factory(entity_name)
+            if prefetch > 0:
+                for page_result in self.iter_entity_pages(
+                    entity_name,
+                    page_size=page_size,
+                    filters=filters,
+                    prefetch=prefetch,
+                    validation=validation,
+                ):
+                    if page_result.failure:
+                        error_message = (
+                            page_result.error or "Entity page request failed"
+                        )
+                        raise FlextOracleWmsError(error_message)
+                    page_records = page_result.value
+                    if residual is not None:
+                        page_records = filter(residual, page_records)
+                    if compact_rows:
+                        yield from map(make_row, page_records)
+                    else:
+                        yield from page_records
+                return
+            mode = validation or self.settings.payload_validation
+            path = f"/entities/{entity_name}"
+            page = 1
+            params: t.Api.WebParams | None = self._entity_params(
+                filters, page=page, page_size=page_size
             )
-            if payload_result.failure:
-                return r[t.SequenceOf[t.StrMapping]].fail(payload_result.error)
-            return r[t.SequenceOf[t.StrMapping]].ok(payload_result.value.data)
+            while True:
+                result = self._page_get(path, params)
+                if result.failure:
+                    error_message = result.error or "Entity page request failed"
+                    raise FlextOracleWmsError(error_message)
+                decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder("data")
+                record_count = 0
+                for item in decoder.iter_items(result.value.body):
+                    record = self._entity_record(item, mode)
+                    record_count += 1
+                    if residual is not None and not residual(record):
+                        continue
+                    yield make_row(record) if compact_rows else record
+                envelope = self._decode_response_model(
+                    decoder.fields,
+                    m.OracleWms.EntityDataResponse,
+                )
+                if envelope.failure:
+                    error_message = envelope.error or "Invalid entity page"
+                    raise FlextOracleWmsError(error_message)
+                if record_count and envelope.value.next_page:
+                    path, params = envelope.value.next_page, None
+                elif self._has_next_page(
+                    record_count, envelope.value.page_count, page, page_size
+                ):
+                    params = self._entity_params(
+                        filters, page=page + 1, page_size=page_size
+                    )
+                else:
+                    return
+                page += 1
+
+        def iter_entity_pages(
+            self,
+            entity_name: str,
+            *,
+            page_size: int = c.OracleWms.WmsProcessing.DEFAULT_PAGE_SIZE,
+            filters: t.ConfigurationMapping | None = None,
+            prefetch: int = 0,
+            validation: c.OracleWms.PayloadValidation | None = None,
+        ) -> Iterator[p.Result[t.SequenceOf[t.StrMapping]]]:
+            """Yield one result per entity page, following the WMS pagination cursor.
+
+            Uses ``next_page`` when the server returns it, otherwise advances
+            ``page`` until ``page_count`` is reached or a short page arrives.
+            Iteration stops after the first failed page. With ``prefetch`` > 0,
+            up to that many following pages are requested concurrently while
+            pages are still yielded in order.
+            """
+            mode = validation or self.settings.payload_validation
+            path = f"/entities/{entity_name}"
+            if prefetch > 0:
+                yield from self._iter_entity_pages_prefetched(
+                    path,
+                    page_size=page_size,
+                    filters=filters,
+                    depth=min(prefetch, c.OracleWms.WmsProcessing.MAX_PREFETCH_DEPTH),
+                    validation=mode,
+                )
+                return
+            page = 1
+            params: t.Api.WebParams | None = self._entity_params(
+                filters, page=page, page_size=page_size
+            )
+            while True:
+                payload_result = self._fetch_entity_page(path, params, validation=mode)
+                if payload_result.failure:
+                    yield r[t.SequenceOf[t.StrMapping]].fail(payload_result.error)
+                    return
+                payload = payload_result.value
+                yield r[t.SequenceOf[t.StrMapping]].ok(payload.data)
+                if not payload.data:
+                    return
+                if payload.next_page:
+                    path, params = payload.next_page, None
+                elif self._has_next_page(
+                    len(payload.data), payload.page_count, page, page_size
+                ):
+                    params = self._entity_params(
+                        filters, page=page + 1, page_size=page_size
+                    )
+                else:
+                    return
+                page += 1
 
         def health_check(self) -> p.Result[m.Api.HttpResponse]:
             """Check Oracle WMS API health."""
-            return self.get("/health")
+            return self._cached_get("/health")
+
+        def pool_stats(self) -> m.OracleWms.PoolStats:
+            """Return connection pool hit, miss and wait counters."""
+            if self._client is None:
+                return m.OracleWms.PoolStats()
+            return self._client.stats()
+
+        def rate_limiter_stats(self) -> m.OracleWms.RateLimiterStats:
+            """Return the adaptive limiter's current rate and counters."""
+            if self._rate_limiter is None:
+                return m.OracleWms.RateLimiterStats()
+            return self._rate_limiter.stats()
 
         def post(
             self,
@@ -257,12 +963,12 @@ class FlextOracleWmsUtilitiesClient:
             return r[bool].ok(True)
 
         def stop(self) -> p.Result[bool]:
-            """Stop the Oracle WMS client and release the delegated API client."""
+            """Stop the Oracle WMS client and close every pooled connection."""
             if self._client is not None:
-                close_fn = getattr(self._client, "close", None)
-                if callable(close_fn):
-                    _ = close_fn()
+                self._client.close()
                 self._client = None
+            if self._disk_cache is not None:
+                self._disk_cache.close()
             self._started = False
             return r[bool].ok(True)
 
@@ -297,7 +1003,26 @@ class FlextOracleWmsUtilitiesClient:
                 "query_params": params or {},
                 "body": body or {},
             })
-            result = self._client.request(request)
+            client = self._client
+            limiter = self._rate_limiter
+            endpoint, breaker = self._circuit_breakers.breaker_for(method, path)
+
+            def send() -> p.Result[m.Api.HttpResponse]:
+                if not breaker.allow():
+                    return r[m.Api.HttpResponse].fail(f"Circuit open for {endpoint}")
+                if limiter is not None:
+                    limiter.acquire()
+                try:
+                    attempt = client.request(request)
+                except Exception:
+                    breaker.record_failure()
+                    raise
+                breaker.record(attempt)
+                if limiter is not None:
+                    limiter.record(attempt)
+                return attempt
+
+            result = self._retry_policy.execute(method, send)
             if result.failure:
                 return r[m.Api.HttpResponse].fail(
                     f"{method} {path} failed: {result.error}",
@@ -307,6 +1032,9 @@ class FlextOracleWmsUtilitiesClient:
                 return r[m.Api.HttpResponse].fail(
                     f"{method} {path} returned HTTP {response.status_code}",
                 )
+            if method != c.Api.Method.GET and self._response_cache is not None:
+                # Writes may change cached reference data; drop it wholesale.
+                self._response_cache.clear()
             return r[m.Api.HttpResponse].ok(response)
 
 
@@ -0,0 +1,242 @@
+"""Oracle WMS Columnar utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import overload, override
+
+from flext_oracle_wms import e, t
+
+
+class FlextOracleWmsUtilitiesColumnar:
+    """Columnar record utilities for Oracle WMS -- u.OracleWms.Columnar.*."""
+
+    class ColumnView(Sequence[t.JsonValue]):
+        """Read-only window over one column list without copying it."""
+
+        __slots__ = ("_start", "_stop", "_values")
+
+        def __init__(self, values: list[t.JsonValue], start: int, stop: int) -> None:
+            """Initialize view of ``values[start:stop]``."""
+            self._values = values
+            self._start = start
+            self._stop = stop
+
+        @overload
+        def __getitem__(self, index: int) -> t.JsonValue: ...
+
+        @overload
+        def __getitem__(self, index: slice) -> Sequence[t.JsonValue]: ...
+
+        @override
+        def __getitem__(
+            self, index: int | slice
+        ) -> t.JsonValue | Sequence[t.JsonValue]:
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self))
+                if step == 1:
+                    return FlextOracleWmsUtilitiesColumnar.ColumnView(
+                        self._values,
+                        self._start + start,
+                        self._start + max(start, stop),
+                    )
+                return [self[position] for position in range(start, stop, step)]
+            size = len(self)
+            if not -size <= index < size:
+                error_message = "Column index out of range"
+                raise IndexError(error_message)
+            return self._values[self._start + index % size]
+
+        @override
+        def __iter__(self) -> Iterator[t.JsonValue]:
+            values = self._values
+            for position in range(self._start, self._stop):
+                yield values[position]
+
+        @override
+        def __len__(self) -> int:
+            return self._stop - self._start
+
+    class RowView(Mapping[str, t.JsonValue]):
+        """Mapping view of one batch row; ``None`` cells are treated as absent."""
+
+        __slots__ = ("_batch", "_position")
+
+        def __init__(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            position: int,
+        ) -> None:
+            """Initialize view of the row at absolute ``position`` in ``batch``."""
+            self._batch = batch
+            self._position = position
+
+        @override
+        def __getitem__(self, key: str) -> t.JsonValue:
+            column = self._batch.field_index.get(key)
+            if column is None:
+                raise KeyError(key)
+            value = self._batch.columns[column][self._position]
+            if value is None:
+                raise KeyError(key)
+            return value
+
+        @override
+        def __iter__(self) -> Iterator[str]:
+            position = self._position
+            for name, values in zip(
+                self._batch.fields, self._batch.columns, strict=True
+            ):
+                if values[position] is not None:
+                    yield name
+
+        @override
+        def __len__(self) -> int:
+            return sum(1 for _ in self)
+
+    class RecordBatch(Sequence[Mapping[str, t.JsonValue]]):
+        """Columnar batch of entity records sharing one interned field table.
+
+        Each field is stored once in ``fields`` and every column is a plain
+        list, so a batch costs one slot per cell instead of one dict per row.
+        Contiguous slices share the parent columns; indexing yields row views.
+        Missing fields and JSON nulls are both stored as ``None``.
+        """
+
+        __slots__ = ("_start", "_stop", "columns", "field_index", "fields")
+
+        def __init__(
+            self,
+            fields: Sequence[str],
+            columns: Sequence[list[t.JsonValue]],
+            *,
+            start: int = 0,
+            stop: int | None = None,
+        ) -> None:
+            """Initialize batch over ``columns[i][start:stop]`` for each field."""
+            lengths = {len(values) for values in columns}
+            if len(fields) != len(columns) or len(lengths) > 1:
+                error_message = "Invalid RecordBatch columns"
+                raise e.BaseError(error_message)
+            size = lengths.pop() if lengths else 0
+            self.fields: tuple[str, ...] = tuple(sys.intern(name) for name in fields)
+            self.columns: tuple[list[t.JsonValue], ...] = tuple(columns)
+            self.field_index: Mapping[str, int] = {
+                name: position for position, name in enumerate(self.fields)
+            }
+            self._start = start
+            self._stop = size if stop is None else stop
+
+        @classmethod
+        def from_records(
+            cls,
+            records: Iterable[Mapping[str, t.JsonValue]],
+        ) -> FlextOracleWmsUtilitiesColumnar.RecordBatch:
+            """Build a batch from row mappings, consuming them one at a time."""
+            fields: list[str] = []
+            columns: list[list[t.JsonValue]] = []
+            field_index: dict[str, int] = {}
+            size = 0
+            for record in records:
+                for name, value in record.items():
+                    position = field_index.get(name)
+                    if position is None:
+                        position = len(fields)
+                        field_index[name] = position
+                        fields.append(sys.intern(name))
+                        columns.append([None] * size)
+                    column = columns[position]
+                    if len(column) < size:
+                        column.extend([None] * (size - len(column)))
+                    column.append(value)
+                size += 1
+            for column in columns:
+                if len(column) < size:
+                    column.extend([None] * (size - len(column)))
+            return cls(fields, columns)
+
+        @overload
+        def __getitem__(
+            self, index: int
+        ) -> FlextOracleWmsUtilitiesColumnar.RowView: ...
+
+        @overload
+        def __getitem__(
+            self, index: slice
+        ) -> FlextOracleWmsUtilitiesColumnar.RecordBatch: ...
+
+        @override
+        def __getitem__(
+            self, index: int | slice
+        ) -> (
+            FlextOracleWmsUtilitiesColumnar.RowView
+            | FlextOracleWmsUtilitiesColumnar.RecordBatch
+        ):
+            if isinstance(index, slice):
+                start, stop, step = index.indices(len(self))
+                if step == 1:
+                    return FlextOracleWmsUtilitiesColumnar.RecordBatch(
+                        self.fields,
+                        self.columns,
+                        start=self._start + start,
+                        stop=self._start + max(start, stop),
+                    )
+                return self.take(range(start, stop, step))
+            size = len(self)
+            if not -size <= index < size:
+                error_message = "RecordBatch index out of range"
+                raise IndexError(error_message)
+            return FlextOracleWmsUtilitiesColumnar.RowView(
+                self, self._start + index % size
+            )
+
+        @override
+        def __iter__(self) -> Iterator[FlextOracleWmsUtilitiesColumnar.RowView]:
+            for position in range(self._start, self._stop):
+                yield FlextOracleWmsUtilitiesColumnar.RowView(self, position)
+
+        @override
+        def __len__(self) -> int:
+            return self._stop - self._start
+
+        @property
+        def offset(self) -> int:
+            """Position of the batch's first row within each of ``columns``."""
+            return self._start
+
+        def column(self, name: str) -> FlextOracleWmsUtilitiesColumnar.ColumnView:
+            """Return a zero-copy view of column ``name``.
+
+            Raises:
+                KeyError: When the batch has no such field.
+
+            """
+            return FlextOracleWmsUtilitiesColumnar.ColumnView(
+                self.columns[self.field_index[name]], self._start, self._stop
+            )
+
+        def take(
+            self,
+            indices: Iterable[int],
+        ) -> FlextOracleWmsUtilitiesColumnar.RecordBatch:
+            """Return a new batch holding the rows at ``indices`` in order."""
+            positions = [self._start + index for index in indices]
+            return FlextOracleWmsUtilitiesColumnar.RecordBatch(
+                self.fields,
+                [
+                    [values[position] for position in positions]
+                    for values in self.columns
+                ],
+            )
+
+        def to_records(self) -> list[dict[str, t.JsonValue]]:
+            """Materialize the batch as one dict per row."""
+            return [dict(row) for row in self]
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesColumnar"]
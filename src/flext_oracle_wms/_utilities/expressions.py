@@ -0,0 +1,554 @@
+"""Oracle WMS Expressions utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import itertools
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Generator, Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, override
+
+from flext_oracle_wms import c, m, t
+from flext_oracle_wms.errors import FlextOracleWmsValidationError
+
+if TYPE_CHECKING:
+    from flext_oracle_wms._utilities.filtering import (
+        FlextOracleWmsUtilitiesFiltering,
+    )
+
+type FilterEntry = (
+    t.OracleWms.FilterScalar
+    | t.OracleWms.FilterList
+    | m.OracleWms.FlextOracleWmsOperatorFilter
+)
+
+type FieldValue = t.OracleWms.NestedFilterValue | None
+type FieldGetter = Callable[[t.OracleWms.FilterRecord], FieldValue]
+type FieldTest = Callable[[FieldValue], bool]
+type Memo = dict[Hashable, bool]
+type NodeTest = Callable[[t.OracleWms.FilterRecord, Memo], bool]
+type CompiledNode = tuple[NodeTest, float, float]
+
+_RANGE_OPERATORS = frozenset({
+    c.OracleWms.WmsFilterOperator.GT,
+    c.OracleWms.WmsFilterOperator.LT,
+    c.OracleWms.WmsFilterOperator.GTE,
+    c.OracleWms.WmsFilterOperator.LTE,
+})
+
+
+def _value_key(
+    value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+) -> Hashable:
+    """Return a hashable, type-preserving key for a filter value."""
+    if isinstance(value, list):
+        return tuple((type(item).__name__, item) for item in value)
+    return (type(value).__name__, value)
+
+
+def _entry_key(entry: FilterEntry) -> Hashable:
+    """Return a hashable key identifying a filter entry by structure."""
+    match entry:
+        case m.OracleWms.FlextOracleWmsOperatorFilter() as condition:
+            return ("operator", str(condition.operator), _value_key(condition.value))
+        case list():
+            return ("list", _value_key(entry))
+        case _:
+            return ("value", _value_key(entry))
+
+
+class FlextOracleWmsUtilitiesExpressions:
+    """Filter expressions for Oracle WMS -- u.OracleWms.Expressions.*."""
+
+    class RecordPredicate(ABC):
+        """Compiled record predicate with eager and lazy filtering helpers."""
+
+        __slots__ = ()
+
+        @abstractmethod
+        def __call__(self, record: t.OracleWms.FilterRecord) -> bool:
+            """Return whether ``record`` matches."""
+
+        @property
+        @abstractmethod
+        def fields(self) -> tuple[str, ...]:
+            """Dot-path fields the predicate reads."""
+
+        def filter(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            limit: int | None = None,
+        ) -> list[t.OracleWms.FilterRecord]:
+            """Return matching records, stopping once ``limit`` are found."""
+            if limit is None:
+                return [record for record in records if self(record)]
+            matched: list[t.OracleWms.FilterRecord] = []
+            if limit <= 0:
+                return matched
+            for record in records:
+                if self(record):
+                    matched.append(record)
+                    if len(matched) >= limit:
+                        break
+            return matched
+
+        def stream(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            limit: int | None = None,
+        ) -> Generator[t.OracleWms.FilterRecord]:
+            """Yield matching records lazily, one upstream record at a time.
+
+            Once ``limit`` records are yielded, or the consumer closes this
+            iterator early, a generator ``records`` is closed so upstream work
+            such as pagination stops there.
+            """
+            found = 0
+            try:
+                if limit is None or limit > 0:
+                    for record in records:
+                        if self(record):
+                            yield record
+                            found += 1
+                            if found == limit:
+                                break
+            finally:
+                if isinstance(records, Generator):
+                    records.close()
+
+    class CompiledFilter(RecordPredicate):
+        """Filter conditions lowered once into per-field predicates.
+
+        Built by ``Filter.compile``; matching is identical to
+        ``Filter.filter_records`` but paths are pre-split, comparison values
+        pre-normalized and operators resolved before the first record.
+        """
+
+        __slots__ = ("conditions", "engine", "filters")
+
+        def __init__(
+            self,
+            filters: t.MappingKV[str, FilterEntry],
+            conditions: Sequence[tuple[str, FieldGetter, FieldTest]],
+            engine: FlextOracleWmsUtilitiesFiltering.Filter,
+        ) -> None:
+            """Initialize from source ``filters`` and their compiled conditions."""
+            self.filters: t.MappingKV[str, FilterEntry] = filters
+            self.conditions: tuple[tuple[str, FieldGetter, FieldTest], ...] = tuple(
+                conditions
+            )
+            self.engine: FlextOracleWmsUtilitiesFiltering.Filter = engine
+
+        @override
+        def __reduce__(
+            self,
+        ) -> tuple[
+            Callable[
+                [t.MappingKV[str, FilterEntry]],
+                FlextOracleWmsUtilitiesExpressions.CompiledFilter,
+            ],
+            tuple[t.MappingKV[str, FilterEntry]],
+        ]:
+            """Pickle as the source filters; unpickling compiles them again."""
+            return self.engine.compile, (dict(self.filters),)
+
+        @property
+        @override
+        def fields(self) -> tuple[str, ...]:
+            return tuple(self.filters)
+
+        @override
+        def __call__(self, record: t.OracleWms.FilterRecord) -> bool:
+            """Return whether ``record`` satisfies every condition."""
+            for _, get_value, test in self.conditions:
+                if not test(get_value(record)):
+                    return False
+            return True
+
+    class CompiledExpression(RecordPredicate):
+        """Boolean expression lowered into one short-circuiting predicate.
+
+        Built by ``Filter.compile_expression``. Sub-expressions that occur
+        more than once are evaluated at most once per call, through a memo
+        local to that call, so one instance can be shared across threads.
+        """
+
+        __slots__ = ("_test", "engine", "expression")
+
+        def __init__(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+            test: NodeTest,
+            engine: FlextOracleWmsUtilitiesFiltering.Filter,
+        ) -> None:
+            """Initialize from ``expression`` and its lowered node test."""
+            self.expression: FlextOracleWmsUtilitiesExpressions.Expression = expression
+            self._test = test
+            self.engine: FlextOracleWmsUtilitiesFiltering.Filter = engine
+
+        @override
+        def __reduce__(
+            self,
+        ) -> tuple[
+            Callable[
+                [FlextOracleWmsUtilitiesExpressions.Expression],
+                FlextOracleWmsUtilitiesExpressions.CompiledExpression,
+            ],
+            tuple[FlextOracleWmsUtilitiesExpressions.Expression],
+        ]:
+            """Pickle as the source expression; unpickling compiles it again."""
+            return self.engine.compile_expression, (self.expression,)
+
+        @property
+        @override
+        def fields(self) -> tuple[str, ...]:
+            fields: dict[str, None] = {}
+            pending = [self.expression]
+            while pending:
+                match pending.pop():
+                    case FlextOracleWmsUtilitiesExpressions.Condition(field=field):
+                        fields[field] = None
+                    case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                        pending.append(child)
+                    case (
+                        FlextOracleWmsUtilitiesExpressions.And(children=children)
+                        | FlextOracleWmsUtilitiesExpressions.Or(children=children)
+                    ):
+                        pending.extend(reversed(children))
+                    case _:
+                        pass
+            return tuple(fields)
+
+        @override
+        def __call__(self, record: t.OracleWms.FilterRecord) -> bool:
+            """Return whether ``record`` satisfies the expression."""
+            return self._test(record, {})
+
+    class Expression:
+        """Boolean filter expression node; compose with ``&``, ``|`` and ``~``.
+
+        Nodes compare and hash by structure, so repeated sub-expressions are
+        recognised when the tree is compiled.
+        """
+
+        __slots__ = ("key",)
+
+        key: Hashable
+
+        def __and__(
+            self, other: FlextOracleWmsUtilitiesExpressions.Expression
+        ) -> FlextOracleWmsUtilitiesExpressions.And:
+            return FlextOracleWmsUtilitiesExpressions.And(self, other)
+
+        def __or__(
+            self, other: FlextOracleWmsUtilitiesExpressions.Expression
+        ) -> FlextOracleWmsUtilitiesExpressions.Or:
+            return FlextOracleWmsUtilitiesExpressions.Or(self, other)
+
+        def __invert__(self) -> FlextOracleWmsUtilitiesExpressions.Not:
+            return FlextOracleWmsUtilitiesExpressions.Not(self)
+
+        @override
+        def __eq__(self, other: object) -> bool:
+            return (
+                isinstance(other, FlextOracleWmsUtilitiesExpressions.Expression)
+                and self.key == other.key
+            )
+
+        @override
+        def __hash__(self) -> int:
+            return hash(self.key)
+
+    class Condition(Expression):
+        """Leaf expression: one field condition in ``filter_records`` syntax."""
+
+        __slots__ = ("entry", "field")
+
+        def __init__(self, field: str, entry: FilterEntry) -> None:
+            """Initialize condition ``entry`` on dot-path ``field``."""
+            self.field: str = field
+            self.entry: FilterEntry = entry
+            self.key = ("condition", field, _entry_key(entry))
+
+        @override
+        def __repr__(self) -> str:
+            return f"Condition({self.field!r}, {self.entry!r})"
+
+    class And(Expression):
+        """Expression matching when every child matches (empty is true)."""
+
+        __slots__ = ("children",)
+
+        def __init__(
+            self, *children: FlextOracleWmsUtilitiesExpressions.Expression
+        ) -> None:
+            """Initialize conjunction of ``children``."""
+            self.children: tuple[FlextOracleWmsUtilitiesExpressions.Expression, ...] = (
+                children
+            )
+            self.key = ("and", tuple(child.key for child in children))
+
+        @classmethod
+        def from_filters(
+            cls,
+            filters: t.MappingKV[str, FilterEntry],
+        ) -> FlextOracleWmsUtilitiesExpressions.And:
+            """Return the implicit AND of a ``filter_records`` mapping."""
+            return cls(
+                *itertools.starmap(
+                    FlextOracleWmsUtilitiesExpressions.Condition, filters.items()
+                )
+            )
+
+        @override
+        def __repr__(self) -> str:
+            return f"And{self.children!r}"
+
+    class Or(Expression):
+        """Expression matching when any child matches (empty is false)."""
+
+        __slots__ = ("children",)
+
+        def __init__(
+            self, *children: FlextOracleWmsUtilitiesExpressions.Expression
+        ) -> None:
+            """Initialize disjunction of ``children``."""
+            self.children: tuple[FlextOracleWmsUtilitiesExpressions.Expression, ...] = (
+                children
+            )
+            self.key = ("or", tuple(child.key for child in children))
+
+        @override
+        def __repr__(self) -> str:
+            return f"Or{self.children!r}"
+
+    class Not(Expression):
+        """Expression matching when its child does not."""
+
+        __slots__ = ("child",)
+
+        def __init__(
+            self, child: FlextOracleWmsUtilitiesExpressions.Expression
+        ) -> None:
+            """Initialize negation of ``child``."""
+            self.child: FlextOracleWmsUtilitiesExpressions.Expression = child
+            self.key = ("not", child.key)
+
+        @override
+        def __repr__(self) -> str:
+            return f"Not({self.child!r})"
+
+    class Planner:
+        """Cost-based lowering of one expression tree into a node test.
+
+        Nested groups of the same kind are flattened and double negations
+        removed. ``And`` children run cheapest-and-most-selective first,
+        ``Or`` children cheapest-and-most-likely first, using static cost
+        and selectivity estimates per operator. Leaves are compiled with
+        the ``compile_getter`` and ``compile_test`` callables of the owning
+        filter engine.
+        """
+
+        __slots__ = ("compile_getter", "compile_test", "occurrences", "shared")
+
+        def __init__(
+            self,
+            compile_getter: Callable[[str], FieldGetter],
+            compile_test: Callable[[FilterEntry], FieldTest],
+        ) -> None:
+            """Initialize with the leaf compilers of a filter engine."""
+            self.compile_getter = compile_getter
+            self.compile_test = compile_test
+            self.occurrences: Counter[Hashable] = Counter()
+            self.shared: dict[Hashable, CompiledNode] = {}
+
+        def lower(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> NodeTest:
+            """Return the node test of ``expression``.
+
+            The test takes the record and a memo dict owned by the caller;
+            repeated sub-expressions store their result there, keyed by
+            structure, so a fresh memo per record evaluates each once.
+            """
+            simplified = self.simplify(expression)
+            self._count(simplified)
+            test, _, _ = self._node(simplified)
+            return test
+
+        @classmethod
+        def simplify(
+            cls,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> FlextOracleWmsUtilitiesExpressions.Expression:
+            """Flatten nested groups of one kind and drop double negations."""
+            match expression:
+                case FlextOracleWmsUtilitiesExpressions.Not(
+                    child=FlextOracleWmsUtilitiesExpressions.Not(child=inner)
+                ):
+                    return cls.simplify(inner)
+                case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                    return FlextOracleWmsUtilitiesExpressions.Not(cls.simplify(child))
+                case FlextOracleWmsUtilitiesExpressions.And(children=children):
+                    group: type[
+                        FlextOracleWmsUtilitiesExpressions.And
+                        | FlextOracleWmsUtilitiesExpressions.Or
+                    ] = FlextOracleWmsUtilitiesExpressions.And
+                case FlextOracleWmsUtilitiesExpressions.Or(children=children):
+                    group = FlextOracleWmsUtilitiesExpressions.Or
+                case _:
+                    return expression
+            flattened: list[FlextOracleWmsUtilitiesExpressions.Expression] = []
+            for child in children:
+                simplified = cls.simplify(child)
+                if type(simplified) is group:
+                    flattened.extend(simplified.children)
+                else:
+                    flattened.append(simplified)
+            if len(flattened) == 1:
+                return flattened[0]
+            return group(*flattened)
+
+        @staticmethod
+        def selectivity(entry: FilterEntry) -> float:
+            """Estimate the fraction of records a condition lets through."""
+            settings = c.OracleWms.Filtering
+            if not isinstance(entry, m.OracleWms.FlextOracleWmsOperatorFilter):
+                candidates = len(entry) if isinstance(entry, list) else 1
+                return min(
+                    settings.EQUALITY_SELECTIVITY * candidates,
+                    settings.MAX_LIST_SELECTIVITY,
+                )
+            operator, value = entry.operator, entry.value
+            match operator:
+                case c.OracleWms.WmsFilterOperator.EQ:
+                    return settings.EQUALITY_SELECTIVITY
+                case c.OracleWms.WmsFilterOperator.NE:
+                    return 1.0 - settings.EQUALITY_SELECTIVITY
+                case c.OracleWms.WmsFilterOperator.IN if isinstance(value, list):
+                    return min(
+                        settings.EQUALITY_SELECTIVITY * len(value),
+                        settings.MAX_LIST_SELECTIVITY,
+                    )
+                case c.OracleWms.WmsFilterOperator.NOT_IN if isinstance(value, list):
+                    return 1.0 - min(
+                        settings.EQUALITY_SELECTIVITY * len(value),
+                        settings.MAX_LIST_SELECTIVITY,
+                    )
+                case c.OracleWms.WmsFilterOperator.CONTAINS:
+                    return settings.CONTAINS_SELECTIVITY
+                case _ if operator in _RANGE_OPERATORS:
+                    return settings.RANGE_SELECTIVITY
+                case _:
+                    return settings.DEFAULT_SELECTIVITY
+
+        def _count(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> None:
+            """Count structural occurrences of every sub-expression."""
+            self.occurrences[expression.key] += 1
+            if self.occurrences[expression.key] > 1:
+                return
+            match expression:
+                case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                    self._count(child)
+                case (
+                    FlextOracleWmsUtilitiesExpressions.And(children=children)
+                    | FlextOracleWmsUtilitiesExpressions.Or(children=children)
+                ):
+                    for child in children:
+                        self._count(child)
+                case _:
+                    return
+
+        def _group(
+            self,
+            children: Sequence[FlextOracleWmsUtilitiesExpressions.Expression],
+            *,
+            conjunction: bool,
+        ) -> CompiledNode:
+            """Order ``And``/``Or`` children by cost per decisive outcome."""
+            nodes = [self._node(child) for child in children]
+            epsilon = 1e-9
+            if conjunction:
+                nodes.sort(key=lambda node: node[1] / max(1.0 - node[2], epsilon))
+            else:
+                nodes.sort(key=lambda node: node[1] / max(node[2], epsilon))
+            tests = tuple(node[0] for node in nodes)
+            cost = 0.0
+            reach = 1.0
+            for _, node_cost, selectivity in nodes:
+                cost += reach * node_cost
+                reach *= selectivity if conjunction else 1.0 - selectivity
+            if conjunction:
+
+                def all_test(record: t.OracleWms.FilterRecord, memo: Memo) -> bool:
+                    return all(child_test(record, memo) for child_test in tests)
+
+                return all_test, cost, reach
+
+            def any_test(record: t.OracleWms.FilterRecord, memo: Memo) -> bool:
+                return any(child_test(record, memo) for child_test in tests)
+
+            return any_test, cost, 1.0 - reach
+
+        def _node(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> CompiledNode:
+            """Return ``(test, expected cost, selectivity)`` for one node."""
+            key = expression.key
+            if (node := self.shared.get(key)) is not None:
+                return node
+            match expression:
+                case FlextOracleWmsUtilitiesExpressions.Condition(
+                    field=field, entry=entry
+                ):
+                    get_value = self.compile_getter(field)
+                    field_test = self.compile_test(entry)
+
+                    def leaf_test(
+                        record: t.OracleWms.FilterRecord, _memo: Memo
+                    ) -> bool:
+                        return field_test(get_value(record))
+
+                    node = (leaf_test, 1.0 + field.count("."), self.selectivity(entry))
+                case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                    child_test, cost, selectivity = self._node(child)
+
+                    def negated_test(
+                        record: t.OracleWms.FilterRecord, memo: Memo
+                    ) -> bool:
+                        return not child_test(record, memo)
+
+                    node = (negated_test, cost, 1.0 - selectivity)
+                case FlextOracleWmsUtilitiesExpressions.And(children=children):
+                    node = self._group(children, conjunction=True)
+                case FlextOracleWmsUtilitiesExpressions.Or(children=children):
+                    node = self._group(children, conjunction=False)
+                case _:
+                    error_message = f"Unsupported filter expression: {expression!r}"
+                    raise FlextOracleWmsValidationError(error_message)
+            if self.occurrences[key] > 1:
+                test = node[0]
+
+                def cached_test(record: t.OracleWms.FilterRecord, memo: Memo) -> bool:
+                    result = memo.get(key)
+                    if result is None:
+                        result = memo[key] = test(record, memo)
+                    return result
+
+                node = (cached_test, node[1], node[2])
+                self.shared[key] = node
+            return node
+
+
+__all__: list[str] = [
+    "FlextOracleWmsUtilitiesExpressions",
+]
@@ -6,7 +6,15 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import heapq
+import math
+import operator as operator_module
 from collections.abc import (
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
     MutableSequence,
     Sequence,
 )
@@ -14,13 +22,28 @@ from collections.abc import (
 from flext_api import u
 
 from flext_oracle_wms import c, e, m, p, r, t
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
+from flext_oracle_wms._utilities.expressions import (
+    FieldGetter,
+    FieldTest,
+    FieldValue,
+    FilterEntry,
+    FlextOracleWmsUtilitiesExpressions,
+)
+from flext_oracle_wms._utilities.grouping import (
+    FlextOracleWmsUtilitiesGrouping,
+    GroupRow,
+)
+from flext_oracle_wms._utilities.parallel import FlextOracleWmsUtilitiesParallel
+from flext_oracle_wms._utilities.sorting import FlextOracleWmsUtilitiesSorting
 from flext_oracle_wms.errors import FlextOracleWmsValidationError
 
-type FilterEntry = (
-    t.OracleWms.FilterScalar
-    | t.OracleWms.FilterList
-    | m.OracleWms.FlextOracleWmsOperatorFilter
-)
+_ORDERING: Mapping[str, Callable[[float | str, float | str], bool]] = {
+    c.OracleWms.WmsFilterOperator.GT: operator_module.gt,
+    c.OracleWms.WmsFilterOperator.LT: operator_module.lt,
+    c.OracleWms.WmsFilterOperator.GTE: operator_module.ge,
+    c.OracleWms.WmsFilterOperator.LTE: operator_module.le,
+}
 
 
 class FlextOracleWmsUtilitiesFiltering:
@@ -65,6 +88,54 @@ class FlextOracleWmsUtilitiesFiltering:
             """Create a filter engine with explicit configuration."""
             return cls(case_sensitive=case_sensitive, max_conditions=max_conditions)
 
+        def compile(
+            self,
+            filters: t.MappingKV[str, FilterEntry],
+        ) -> FlextOracleWmsUtilitiesExpressions.CompiledFilter:
+            """Compile ``filters`` into a reusable predicate.
+
+            Raises:
+                FlextOracleWmsValidationError: When ``filters`` exceed
+                    ``max_conditions``.
+
+            """
+            if (result := self._validate_filters(filters)).failure:
+                raise FlextOracleWmsValidationError(result.error or "Validation failed")
+            return FlextOracleWmsUtilitiesExpressions.CompiledFilter(
+                filters,
+                [
+                    (field, self.compile_getter(field), self._compile_test(entry))
+                    for field, entry in filters.items()
+                ],
+                self,
+            )
+
+        def compile_expression(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> FlextOracleWmsUtilitiesExpressions.CompiledExpression:
+            """Compile an expression tree into one short-circuiting predicate.
+
+            Nested groups of the same kind are flattened and double negations
+            removed. ``And`` children run cheapest-and-most-selective first,
+            ``Or`` children cheapest-and-most-likely first, using static cost
+            and selectivity estimates per operator. Repeated sub-expressions
+            share one compiled node whose result is cached per call.
+
+            Raises:
+                FlextOracleWmsValidationError: When the expression's leaves
+                    exceed ``max_conditions``.
+
+            """
+            if (result := self._validate_filters(expression)).failure:
+                raise FlextOracleWmsValidationError(result.error or "Validation failed")
+            planner = FlextOracleWmsUtilitiesExpressions.Planner(
+                self.compile_getter, self._compile_test
+            )
+            return FlextOracleWmsUtilitiesExpressions.CompiledExpression(
+                expression, planner.lower(expression), self
+            )
+
         @classmethod
         def filter_by_field(
             cls,
@@ -97,18 +168,69 @@ class FlextOracleWmsUtilitiesFiltering:
             """Filter records by inclusive identifier range."""
             if not records:
                 return r[Sequence[t.OracleWms.FilterRecord]].ok([])
-            filtered: MutableSequence[t.OracleWms.FilterRecord] = []
-            for record in records:
-                field_value = record.get(id_field)
-                if field_value is None:
-                    continue
-                if min_id is not None and (not cls._check_min(field_value, min_id)):
-                    continue
-                if max_id is not None and (not cls._check_max(field_value, max_id)):
-                    continue
-                filtered.append(record)
+            filtered: MutableSequence[t.OracleWms.FilterRecord] = list(
+                cls.iter_by_id_range(records, id_field, min_id, max_id)
+            )
             return r[Sequence[t.OracleWms.FilterRecord]].ok(filtered)
 
+        @classmethod
+        def iter_by_id_range(
+            cls,
+            records: Iterable[t.OracleWms.FilterRecord],
+            id_field: str,
+            min_id: t.OracleWms.FilterScalar | None = None,
+            max_id: t.OracleWms.FilterScalar | None = None,
+            limit: int | None = None,
+        ) -> Generator[t.OracleWms.FilterRecord]:
+            """Yield records in the inclusive identifier range lazily.
+
+            Stops and closes a generator ``records`` after ``limit`` matches
+            or when the consumer closes this iterator early.
+            """
+            found = 0
+            try:
+                if limit is None or limit > 0:
+                    for record in records:
+                        field_value = record.get(id_field)
+                        if field_value is None:
+                            continue
+                        if min_id is not None and not cls._check_min(
+                            field_value, min_id
+                        ):
+                            continue
+                        if max_id is not None and not cls._check_max(
+                            field_value, max_id
+                        ):
+                            continue
+                        yield record
+                        found += 1
+                        if found == limit:
+                            break
+            finally:
+                if isinstance(records, Generator):
+                    records.close()
+
+        def iter_filter_records(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            filters: (
+                t.MappingKV[str, FilterEntry]
+                | FlextOracleWmsUtilitiesExpressions.Expression
+            ),
+            limit: int | None = None,
+        ) -> Generator[t.OracleWms.FilterRecord]:
+            """Lazy ``filter_records`` over any iterable, in constant memory.
+
+            Raises:
+                FlextOracleWmsValidationError: Immediately, when ``filters``
+                    exceed ``max_conditions``.
+
+            """
+            if isinstance(filters, FlextOracleWmsUtilitiesExpressions.Expression):
+                return self.compile_expression(filters).stream(records, limit)
+            self.filters = filters
+            return self.compile(filters).stream(records, limit)
+
         @classmethod
         def _check_max(
             cls,
@@ -175,47 +297,277 @@ class FlextOracleWmsUtilitiesFiltering:
         def filter_records(
             self,
             records: t.SequenceOf[t.OracleWms.FilterRecord],
-            filters: t.MappingKV[str, FilterEntry],
+            filters: (
+                t.MappingKV[str, FilterEntry]
+                | FlextOracleWmsUtilitiesExpressions.Expression
+            ),
             limit: int | None = None,
+            *,
+            parallel: bool = False,
+            workers: int | None = None,
+            chunk_size: int = c.OracleWms.Filtering.PARALLEL_CHUNK_SIZE,
         ) -> p.Result[Sequence[t.OracleWms.FilterRecord]]:
-            """Filter records against field conditions and optional limit."""
+            """Filter records against field conditions and optional limit.
+
+            ``filters`` is either a mapping (implicit AND) or an expression
+            tree built from ``Condition``, ``And``, ``Or`` and ``Not``.
+
+            With ``parallel=True`` or ``workers`` above one, inputs longer
+            than ``chunk_size`` are split into chunks evaluated in a process
+            pool, and results keep input order. ``RecordBatch`` inputs only
+            ship (pickled copies of) the columns the filter reads.
+            """
             if (result := self._validate_filters(filters)).failure:
                 return r[Sequence[t.OracleWms.FilterRecord]].fail(
                     result.error or "Validation failed",
                 )
+            if isinstance(filters, FlextOracleWmsUtilitiesExpressions.Expression):
+                predicate: FlextOracleWmsUtilitiesExpressions.RecordPredicate = (
+                    self.compile_expression(filters)
+                )
+            else:
+                self.filters = filters
+                predicate = self.compile(filters)
+            pool = FlextOracleWmsUtilitiesParallel.ParallelPool
+            pool_size = pool.size(workers, parallel=parallel)
+            if pool_size <= 1 or len(records) <= chunk_size:
+                return r[Sequence[t.OracleWms.FilterRecord]].ok(
+                    predicate.filter(records, limit)
+                )
+            return r[Sequence[t.OracleWms.FilterRecord]].ok([
+                records[position]
+                for position in pool.positions(
+                    records, predicate, limit, pool_size, chunk_size
+                )
+            ])
+
+        def filter_batch(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            filters: t.MappingKV[str, FilterEntry],
+            limit: int | None = None,
+            *,
+            workers: int | None = None,
+            chunk_size: int = c.OracleWms.Filtering.PARALLEL_CHUNK_SIZE,
+        ) -> p.Result[FlextOracleWmsUtilitiesColumnar.RecordBatch]:
+            """Filter a columnar batch one condition (column) at a time.
+
+            Each condition only visits the rows that survived the previous
+            ones, and matching follows ``filter_records`` semantics. With
+            ``workers`` above one, batches longer than ``chunk_size`` are
+            filtered in a process pool that only receives copies of the read
+            columns.
+            """
+            if (result := self._validate_filters(filters)).failure:
+                return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].fail(
+                    result.error or "Validation failed",
+                )
             self.filters = filters
-            filtered = [
-                record
-                for record in records
-                if self._matches_all_filters(record, filters)
-            ]
+            pool = FlextOracleWmsUtilitiesParallel.ParallelPool
+            if (pool_size := pool.size(workers, parallel=False)) > 1 and len(
+                batch
+            ) > chunk_size:
+                return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].ok(
+                    batch.take(
+                        pool.positions(
+                            batch, self.compile(filters), limit, pool_size, chunk_size
+                        )
+                    )
+                )
+            selected: Sequence[int] = range(len(batch))
+            for field, _, test in self.compile(filters).conditions:
+                values = self._column_values(batch, field)
+                selected = [index for index in selected if test(values[index])]
+                if not selected:
+                    break
             if limit is not None:
-                filtered = filtered[:limit]
-            return r[Sequence[t.OracleWms.FilterRecord]].ok(filtered)
+                selected = selected[:limit]
+            return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].ok(
+                batch.take(selected)
+            )
+
+        def pushdown(
+            self,
+            filters: t.MappingKV[str, FilterEntry],
+        ) -> p.Result[m.OracleWms.FilterPushdown]:
+            """Split ``filters`` into WMS query parameters and a residual.
+
+            Flat-field ``eq``, ``in``, ``gt``, ``gte``, ``lt`` and ``lte``
+            conditions become ``field`` / ``field__<op>`` parameters. Nested
+            paths, ``None`` and boolean values, other operators and
+            case-insensitive string equality stay in ``residual`` for
+            ``filter_records`` to apply to the response.
+            """
+            if (result := self._validate_filters(filters)).failure:
+                return r[m.OracleWms.FilterPushdown].fail(
+                    result.error or "Validation failed",
+                )
+            params: dict[str, str] = {}
+            residual: dict[str, FilterEntry] = {}
+            for field, entry in filters.items():
+                pushed = self._pushdown_param(field, entry)
+                if pushed is None or pushed[0] in params:
+                    residual[field] = entry
+                else:
+                    params[pushed[0]] = pushed[1]
+            return r[m.OracleWms.FilterPushdown].ok(
+                m.OracleWms.FilterPushdown(params=params, residual=residual)
+            )
+
+        @classmethod
+        def pushdown_id_range(
+            cls,
+            id_field: str,
+            min_id: t.OracleWms.FilterScalar | None = None,
+            max_id: t.OracleWms.FilterScalar | None = None,
+        ) -> t.StrMapping:
+            """Return ``id_field__gte`` / ``__lte`` parameters for an id range.
+
+            Bounds that cannot be sent (booleans, non-finite numbers) are left
+            out; apply ``filter_by_id_range`` to the response for those.
+            """
+            suffixes = c.OracleWms.Filtering.PUSHDOWN_SUFFIXES
+            params: dict[str, str] = {}
+            for operator, bound in (
+                (c.OracleWms.WmsFilterOperator.GTE, min_id),
+                (c.OracleWms.WmsFilterOperator.LTE, max_id),
+            ):
+                text = cls._pushdown_value(bound)
+                if text is not None:
+                    params[f"{id_field}{suffixes[operator]}"] = text
+            return params
 
         def sort_records(
             self,
             records: t.SequenceOf[t.OracleWms.FilterRecord],
-            sort_field: str,
+            sort_field: str | Sequence[str | m.OracleWms.SortKey],
             *,
             ascending: bool = True,
+            limit: int | None = None,
         ) -> p.Result[Sequence[t.OracleWms.FilterRecord]]:
-            """Sort records by a dot-path field."""
-            try:
-
-                def key_func(record: t.OracleWms.FilterRecord) -> str:
-                    value = self._get_nested_value(record, sort_field)
-                    return str(
-                        value if value is not None else "" if ascending else "zzz"
-                    )
+            """Sort records by one or more typed dot-path keys.
 
-                return r[Sequence[t.OracleWms.FilterRecord]].ok(
-                    sorted(records, key=key_func, reverse=not ascending),
+            ``sort_field`` is a field name or a sequence of names and
+            ``SortKey`` entries; plain names use ``ascending`` and
+            ``SortKind.AUTO`` (numbers and numeric strings numerically, then
+            ISO-8601 datetime strings, then text). Keys are computed once per
+            record and missing or unparseable values sort last. With ``limit``
+            only the first ``limit`` records are kept, selected with a heap in
+            O(n log limit) instead of a full sort.
+            """
+            ordering = FlextOracleWmsUtilitiesSorting.Ordering
+            try:
+                key_func = ordering.compile(
+                    ordering.keys(sort_field, ascending=ascending),
+                    self.compile_getter,
+                )
+                ordered = (
+                    sorted(records, key=key_func)
+                    if limit is None
+                    else heapq.nsmallest(max(limit, 0), records, key=key_func)
                 )
+                return r[Sequence[t.OracleWms.FilterRecord]].ok(ordered)
             except Exception as exc:
                 self.logger.exception("Sort failed")
                 return r[Sequence[t.OracleWms.FilterRecord]].fail_op("Sort", exc)
 
+        def iter_sorted_records(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            sort_field: str | Sequence[str | m.OracleWms.SortKey],
+            *,
+            ascending: bool = True,
+            memory_budget: int = c.OracleWms.Sorting.MEMORY_BUDGET,
+            spill_dir: str | None = None,
+            merge_fan_in: int = c.OracleWms.Sorting.MAX_MERGE_FAN_IN,
+        ) -> Iterator[t.OracleWms.FilterRecord]:
+            """Yield ``records`` in ``sort_records`` order with bounded memory.
+
+            Records are consumed lazily into runs of about ``memory_budget``
+            bytes. Each full run is sorted and spilled to a temporary file in
+            ``spill_dir``, where every record is stored as a layout id plus a
+            tuple of values. While more than ``merge_fan_in`` runs exist, the
+            oldest ones are merged into a new spill file, so at most
+            ``merge_fan_in`` files are open at once; the last runs are then
+            k-way merged back lazily. Spilled records come back as plain dicts,
+            and the temporary files are removed once iteration ends.
+
+            Raises:
+                e.BaseError: When ``memory_budget`` is not positive or
+                    ``merge_fan_in`` is below two.
+
+            """
+            ordering = FlextOracleWmsUtilitiesSorting.Ordering
+            yield from FlextOracleWmsUtilitiesSorting.ExternalSort.iter_sorted(
+                records,
+                ordering.compile(
+                    ordering.keys(sort_field, ascending=ascending),
+                    self.compile_getter,
+                ),
+                memory_budget=memory_budget,
+                spill_dir=spill_dir,
+                merge_fan_in=merge_fan_in,
+            )
+
+        def group_by(
+            self,
+            records: (
+                Iterable[t.OracleWms.FilterRecord]
+                | FlextOracleWmsUtilitiesColumnar.RecordBatch
+            ),
+            keys: str | Sequence[str],
+            aggregations: t.MappingKV[str, m.OracleWms.Aggregate],
+        ) -> p.Result[Sequence[GroupRow]]:
+            """Aggregate ``records`` per distinct combination of ``keys``.
+
+            Groups are numbered through a hash table and every aggregate is
+            updated column-wise, one chunk of ``GROUP_BY_CHUNK_SIZE`` records
+            at a time, so any iterable is consumed in one pass and memory
+            holds one chunk plus per-group state. ``RecordBatch`` inputs read
+            their columns directly. Each row holds the key fields and one
+            entry per aggregation name, in first-seen group order; missing
+            key values form their own group.
+            """
+            try:
+                rows = FlextOracleWmsUtilitiesGrouping.GroupBy(
+                    keys, aggregations, self.compile_getter, self._column_values
+                ).aggregate(records)
+            except Exception as exc:
+                self.logger.exception("Group by failed")
+                return r[Sequence[GroupRow]].fail_op("Group by", exc)
+            return r[Sequence[GroupRow]].ok(rows)
+
+        def iter_group_by(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            keys: str | Sequence[str],
+            aggregations: t.MappingKV[str, m.OracleWms.Aggregate],
+        ) -> Iterator[GroupRow]:
+            """Yield ``group_by`` rows lazily from records clustered by ``keys``.
+
+            A group is emitted as soon as its key changes, so memory stays
+            bounded however many groups there are. Input must arrive with
+            equal keys adjacent, for example from ``iter_sorted_records``;
+            otherwise a key yields several rows.
+
+            Raises:
+                e.BaseError: When ``aggregations`` are invalid.
+
+            """
+            yield from FlextOracleWmsUtilitiesGrouping.GroupBy(
+                keys, aggregations, self.compile_getter, self._column_values
+            ).iter_clustered(records)
+
+        def validate_filters(
+            self,
+            filters: (
+                t.MappingKV[str, FilterEntry]
+                | FlextOracleWmsUtilitiesExpressions.Expression
+            ),
+        ) -> p.Result[bool]:
+            """Check ``filters`` against ``max_conditions``."""
+            return self._validate_filters(filters)
+
         def _apply_operator(
             self,
             field_value: t.OracleWms.FilterRecordValue | None,
@@ -278,6 +630,191 @@ class FlextOracleWmsUtilitiesFiltering:
                         result = False
             return result
 
+        def compile_getter(self, field: str) -> FieldGetter:
+            """Pre-split ``field`` into a getter mirroring ``_get_nested_value``."""
+            keys = tuple(field.split("."))
+            if len(keys) == 1:
+                key = keys[0]
+
+                def get_flat(record: t.OracleWms.FilterRecord) -> FieldValue:
+                    value = record.get(key)
+                    return None if isinstance(value, Mapping) else value
+
+                return get_flat
+
+            flat_key = "_".join(keys)
+
+            def get_nested(record: t.OracleWms.FilterRecord) -> FieldValue:
+                current: FieldValue | t.OracleWms.FilterRecord = record
+                for key in keys:
+                    if not isinstance(current, Mapping):
+                        break
+                    next_value = current.get(key)
+                    if next_value is None:
+                        break
+                    current = next_value
+                else:
+                    return None if isinstance(current, Mapping) else current
+                flat_value = record.get(flat_key)
+                return None if isinstance(flat_value, Mapping) else flat_value
+
+            return get_nested
+
+        def _compile_ordering(
+            self,
+            filter_value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+            compare: Callable[[float | str, float | str], bool],
+        ) -> FieldTest:
+            """Mirror ``_compare``: numeric when both sides parse, else string."""
+            adapter = t.float_adapter()
+            value_type = type(filter_value)
+            right_text = str(filter_value)
+            try:
+                right_number: float | None = adapter.validate_python(filter_value)
+            except c.ValidationError:
+                right_number = None
+
+            def test(field_value: FieldValue) -> bool:
+                if type(field_value) is not value_type:
+                    return False
+                if right_number is not None:
+                    try:
+                        left_number = adapter.validate_python(field_value)
+                    except c.ValidationError:
+                        pass
+                    else:
+                        return compare(left_number, right_number)
+                return compare(str(field_value), right_text)
+
+            return test
+
+        def _compile_operator(
+            self,
+            operator: c.OracleWms.WmsFilterOperator | str,
+            filter_value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+        ) -> FieldTest:
+            """Resolve ``_apply_operator`` for one operator and value up front."""
+            if filter_value is None:
+                matches_none = operator in {
+                    c.OracleWms.WmsFilterOperator.EQ,
+                    c.OracleWms.WmsFilterOperator.GTE,
+                    c.OracleWms.WmsFilterOperator.LTE,
+                }
+                return lambda field_value: field_value is None and matches_none
+            normalize = self.compile_normalizer()
+            expected = normalize(filter_value)
+            inner: FieldTest
+            match operator:
+                case c.OracleWms.WmsFilterOperator.EQ:
+
+                    def equals(field_value: FieldValue) -> bool:
+                        return normalize(field_value) == expected
+
+                    inner = equals
+                case c.OracleWms.WmsFilterOperator.NE:
+
+                    def differs(field_value: FieldValue) -> bool:
+                        return normalize(field_value) != expected
+
+                    inner = differs
+                case c.OracleWms.WmsFilterOperator.IN if isinstance(filter_value, list):
+                    options = frozenset(str(item) for item in filter_value)
+
+                    def is_option(field_value: FieldValue) -> bool:
+                        return str(field_value) in options
+
+                    inner = is_option
+                case c.OracleWms.WmsFilterOperator.CONTAINS:
+                    needle = str(filter_value)
+
+                    def contains(field_value: FieldValue) -> bool:
+                        return isinstance(field_value, str) and needle in field_value
+
+                    inner = contains
+                case _ if operator in _ORDERING:
+                    inner = self._compile_ordering(filter_value, _ORDERING[operator])
+                case _:
+                    return lambda _field_value: False
+            return lambda field_value: field_value is not None and inner(field_value)
+
+        def _compile_test(self, filter_value: FilterEntry) -> FieldTest:
+            """Resolve ``_matches_value`` for one filter entry up front."""
+            match filter_value:
+                case m.OracleWms.FlextOracleWmsOperatorFilter() as condition:
+                    return self._compile_operator(condition.operator, condition.value)
+                case list() as candidates:
+                    try:
+                        options = frozenset(candidates)
+                    except TypeError:
+                        return lambda field_value: (
+                            field_value is not None and field_value in candidates
+                        )
+
+                    def is_candidate(field_value: FieldValue) -> bool:
+                        if field_value is None:
+                            return False
+                        try:
+                            return field_value in options
+                        except TypeError:
+                            return field_value in candidates
+
+                    return is_candidate
+                case _:
+                    normalize = self.compile_normalizer()
+                    expected = normalize(filter_value)
+                    return lambda field_value: normalize(field_value) == expected
+
+        def compile_normalizer(
+            self,
+        ) -> Callable[
+            [FieldValue | t.OracleWms.FilterScalar | t.OracleWms.FilterList],
+            FieldValue | t.OracleWms.FilterList,
+        ]:
+            """Return ``_normalize`` specialised for the current case mode."""
+            if self.case_sensitive:
+                return lambda value: "" if value is None else value
+
+            def fold_case(
+                value: FieldValue | t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+            ) -> FieldValue | t.OracleWms.FilterList:
+                if value is None:
+                    return ""
+                return value.lower() if isinstance(value, str) else value
+
+            return fold_case
+
+        def _column_values(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            field: str,
+        ) -> Sequence[t.OracleWms.NestedFilterValue | None]:
+            """Return ``field`` per row, reading the column directly when flat."""
+            if "." not in field:
+                if field not in batch.field_index:
+                    return [None] * len(batch)
+                return [
+                    None if isinstance(value, Mapping) else value
+                    for value in batch.column(field)
+                ]
+            return [self._get_nested_value(dict(row), field) for row in batch]
+
+        def _expression_size(
+            self,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> int:
+            match expression:
+                case FlextOracleWmsUtilitiesExpressions.Condition(entry=entry):
+                    return self._condition_size(entry)
+                case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                    return self._expression_size(child)
+                case (
+                    FlextOracleWmsUtilitiesExpressions.And(children=children)
+                    | FlextOracleWmsUtilitiesExpressions.Or(children=children)
+                ):
+                    return sum(self._expression_size(child) for child in children)
+                case _:
+                    return 0
+
         def _get_nested_value(
             self,
             record: t.OracleWms.FilterRecord,
@@ -299,7 +836,7 @@ class FlextOracleWmsUtilitiesFiltering:
             ) = record
             for key in keys:
                 match current:
-                    case dict() as mapping:
+                    case Mapping() as mapping:
                         next_value = mapping.get(key)
                         if next_value is None:
                             break
@@ -307,7 +844,7 @@ class FlextOracleWmsUtilitiesFiltering:
                     case _:
                         break
             else:
-                if not isinstance(current, dict):
+                if not isinstance(current, Mapping):
                     return current
                 return None
             # Fallback: try underscore-joined flat key
@@ -315,7 +852,7 @@ class FlextOracleWmsUtilitiesFiltering:
                 flat_key = "_".join(keys)
                 flat_value = record.get(flat_key)
                 if flat_value is not None:
-                    return flat_value if not isinstance(flat_value, dict) else None
+                    return flat_value if not isinstance(flat_value, Mapping) else None
             return None
 
         def _matches_all_filters(
@@ -336,7 +873,15 @@ class FlextOracleWmsUtilitiesFiltering:
             field: str,
             filter_value: FilterEntry,
         ) -> bool:
-            field_value = self._get_nested_value(record, field)
+            return self._matches_value(
+                self._get_nested_value(record, field), filter_value
+            )
+
+        def _matches_value(
+            self,
+            field_value: t.OracleWms.NestedFilterValue | None,
+            filter_value: FilterEntry,
+        ) -> bool:
             match filter_value:
                 case m.OracleWms.FlextOracleWmsOperatorFilter() as condition:
                     return self._apply_operator(
@@ -363,6 +908,60 @@ class FlextOracleWmsUtilitiesFiltering:
                 case _:
                     return value
 
+        def _pushdown_param(
+            self,
+            field: str,
+            entry: FilterEntry,
+        ) -> tuple[str, str] | None:
+            """Return the query parameter for one condition, or None."""
+            if "." in field:
+                return None
+            operator: c.OracleWms.WmsFilterOperator | str
+            match entry:
+                case m.OracleWms.FlextOracleWmsOperatorFilter() as condition:
+                    operator, value = condition.operator, condition.value
+                case list() as candidates:
+                    operator, value = c.OracleWms.WmsFilterOperator.IN, candidates
+                case _:
+                    operator, value = c.OracleWms.WmsFilterOperator.EQ, entry
+            suffix = c.OracleWms.Filtering.PUSHDOWN_SUFFIXES.get(operator)
+            if suffix is None:
+                return None
+            match value:
+                case list() as options if operator == c.OracleWms.WmsFilterOperator.IN:
+                    separator = c.OracleWms.Filtering.PUSHDOWN_LIST_SEPARATOR
+                    texts = [self._pushdown_value(option) for option in options]
+                    if not texts or any(
+                        text is None or separator in text for text in texts
+                    ):
+                        return None
+                    return f"{field}{suffix}", separator.join(
+                        text for text in texts if text is not None
+                    )
+                case list():
+                    return None
+                case str() if (
+                    operator == c.OracleWms.WmsFilterOperator.EQ
+                    and not self.case_sensitive
+                ):
+                    return None
+                case _ if operator == c.OracleWms.WmsFilterOperator.IN:
+                    return None
+                case _:
+                    text = self._pushdown_value(value)
+                    return None if text is None else (f"{field}{suffix}", text)
+
+        @staticmethod
+        def _pushdown_value(value: t.OracleWms.FilterScalar) -> str | None:
+            """Render a scalar for a query string, or None when it cannot be."""
+            match value:
+                case None | bool():
+                    return None
+                case float() if not math.isfinite(value):
+                    return None
+                case _:
+                    return str(value)
+
         def _validate_filter_conditions_total(
             self,
             filters: t.MappingKV[str, FilterEntry],
@@ -375,9 +974,16 @@ class FlextOracleWmsUtilitiesFiltering:
             return r[bool].ok(True)
 
         def _validate_filters(
-            self, filters: t.MappingKV[str, FilterEntry]
+            self,
+            filters: (
+                t.MappingKV[str, FilterEntry]
+                | FlextOracleWmsUtilitiesExpressions.Expression
+            ),
         ) -> p.Result[bool]:
-            total = sum(self._condition_size(value) for value in filters.values())
+            if isinstance(filters, FlextOracleWmsUtilitiesExpressions.Expression):
+                total = self._expression_size(filters)
+            else:
+                total = sum(self._condition_size(value) for value in filters.values())
             if total > self.max_conditions:
                 return r[bool].fail(
                     f"Too many conditions. Max: {self.max_conditions}, Got: {total}",
@@ -0,0 +1,409 @@
+"""Oracle WMS Grouping utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import itertools
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from typing import override
+
+from flext_oracle_wms import c, e, m, t
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
+from flext_oracle_wms._utilities.expressions import FieldGetter, FieldValue
+from flext_oracle_wms._utilities.sorting import (
+    FlextOracleWmsUtilitiesSorting,
+    SortComponent,
+)
+
+type GroupRow = dict[str, FieldValue]
+type GroupChunk = tuple[Sequence[tuple[FieldValue, ...]], list[Sequence[FieldValue]]]
+type ColumnReader = Callable[
+    [FlextOracleWmsUtilitiesColumnar.RecordBatch, str], Sequence[FieldValue]
+]
+
+
+def _hashable(value: FieldValue) -> Hashable:
+    """Return ``value`` with lists frozen into tuples for hashing."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value if isinstance(value, Hashable) else repr(value)
+
+
+def _aggregate_number(value: FieldValue) -> float | None:
+    """Return ``value`` as a number for sum/avg, or ``None`` to skip it."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        number: float = t.float_adapter().validate_python(value)
+    except c.ValidationError:
+        return None
+    return number
+
+
+class FlextOracleWmsUtilitiesGrouping:
+    """Group-by aggregation for Oracle WMS -- u.OracleWms.Grouping.*."""
+
+    class Accumulator(ABC):
+        """State of one aggregate for every group, updated a chunk at a time.
+
+        ``extend`` receives the group number of each row in the chunk and the
+        aggregated field's values aligned with them (empty for row counts).
+        """
+
+        __slots__ = ()
+
+        @abstractmethod
+        def resize(self, size: int) -> None:
+            """Make room for groups numbered below ``size``."""
+
+        @abstractmethod
+        def extend(self, groups: Sequence[int], values: Sequence[FieldValue]) -> None:
+            """Fold one chunk of values into their groups."""
+
+        @abstractmethod
+        def result(self, group: int) -> FieldValue:
+            """Return the aggregate of ``group``."""
+
+    class CountAccumulator(Accumulator):
+        """``count``: rows, or present values when counting a field."""
+
+        __slots__ = ("counts", "rows")
+
+        def __init__(self, *, rows: bool) -> None:
+            """Initialize counter of rows (``rows``) or non-missing values."""
+            self.rows = rows
+            self.counts: list[int] = []
+
+        @override
+        def resize(self, size: int) -> None:
+            self.counts.extend([0] * (size - len(self.counts)))
+
+        @override
+        def extend(self, groups: Sequence[int], values: Sequence[FieldValue]) -> None:
+            counts = self.counts
+            tally = (
+                Counter(groups)
+                if self.rows
+                else Counter(
+                    group
+                    for group, value in zip(groups, values, strict=True)
+                    if value is not None
+                )
+            )
+            for group, count in tally.items():
+                counts[group] += count
+
+        @override
+        def result(self, group: int) -> int:
+            return self.counts[group]
+
+    class SumAccumulator(Accumulator):
+        """``sum`` and ``avg`` over numbers and numeric strings."""
+
+        __slots__ = ("average", "counts", "totals")
+
+        def __init__(self, *, average: bool) -> None:
+            """Initialize totals; ``average`` divides them by the values counted."""
+            self.average = average
+            self.counts: list[int] = []
+            self.totals: list[float] = []
+
+        @override
+        def resize(self, size: int) -> None:
+            self.counts.extend([0] * (size - len(self.counts)))
+            self.totals.extend([0] * (size - len(self.totals)))
+
+        @override
+        def extend(self, groups: Sequence[int], values: Sequence[FieldValue]) -> None:
+            counts, totals = self.counts, self.totals
+            for group, value in zip(groups, values, strict=True):
+                if type(value) is int or type(value) is float:
+                    totals[group] += value
+                    counts[group] += 1
+                elif (number := _aggregate_number(value)) is not None:
+                    totals[group] += number
+                    counts[group] += 1
+
+        @override
+        def result(self, group: int) -> float | None:
+            if not self.average:
+                return self.totals[group]
+            count = self.counts[group]
+            return self.totals[group] / count if count else None
+
+    class ExtremeAccumulator(Accumulator):
+        """``min`` and ``max`` in ``sort_records`` order (``SortKind.AUTO``).
+
+        Numeric strings compare as numbers, as they are summed by ``sum``.
+        """
+
+        __slots__ = ("best", "keys", "largest", "sort_key")
+
+        def __init__(
+            self,
+            sort_key: Callable[[FieldValue], SortComponent],
+            *,
+            largest: bool,
+        ) -> None:
+            """Initialize tracker of the smallest (or ``largest``) value."""
+            self.sort_key = sort_key
+            self.largest = largest
+            self.best: list[FieldValue] = []
+            self.keys: list[SortComponent | None] = []
+
+        @override
+        def resize(self, size: int) -> None:
+            self.best.extend([None] * (size - len(self.best)))
+            self.keys.extend([None] * (size - len(self.keys)))
+
+        @override
+        def extend(self, groups: Sequence[int], values: Sequence[FieldValue]) -> None:
+            best, keys, sort_key = self.best, self.keys, self.sort_key
+            largest = self.largest
+            for group, value in zip(groups, values, strict=True):
+                if value is None:
+                    continue
+                key = sort_key(value)
+                if len(key) == 1:
+                    continue
+                current = keys[group]
+                if (
+                    current is None
+                    or (largest and current < key)
+                    or (not largest and key < current)
+                ):
+                    best[group] = value
+                    keys[group] = key
+
+        @override
+        def result(self, group: int) -> FieldValue:
+            return self.best[group]
+
+    class DistinctAccumulator(Accumulator):
+        """``distinct_count``: number of distinct non-missing values."""
+
+        __slots__ = ("seen",)
+
+        def __init__(self) -> None:
+            """Initialize empty per-group sets of seen values."""
+            self.seen: list[set[Hashable]] = []
+
+        @override
+        def resize(self, size: int) -> None:
+            self.seen.extend(set() for _ in range(size - len(self.seen)))
+
+        @override
+        def extend(self, groups: Sequence[int], values: Sequence[FieldValue]) -> None:
+            seen = self.seen
+            for group, value in zip(groups, values, strict=True):
+                if value is None:
+                    continue
+                try:
+                    seen[group].add(value)
+                except TypeError:
+                    seen[group].add(_hashable(value))
+
+        @override
+        def result(self, group: int) -> int:
+            return len(self.seen[group])
+
+    class GroupBy:
+        """One validated ``group_by`` request over record chunks.
+
+        Fields are read with the ``compile_getter`` and ``column_values``
+        callables of the owning filter engine, so keys and values follow
+        its dot-path lookup.
+        """
+
+        __slots__ = ("aggregations", "column_values", "compile_getter", "key_fields")
+
+        def __init__(
+            self,
+            keys: str | Sequence[str],
+            aggregations: t.MappingKV[str, m.OracleWms.Aggregate],
+            compile_getter: Callable[[str], FieldGetter],
+            column_values: ColumnReader,
+        ) -> None:
+            """Validate ``keys`` against ``aggregations``.
+
+            Raises:
+                e.BaseError: When an aggregate name collides with a key or a
+                    non-count aggregate has no field.
+
+            """
+            key_fields = (keys,) if isinstance(keys, str) else tuple(keys)
+            for name, aggregate in aggregations.items():
+                if name in key_fields:
+                    error_message = f"Aggregate name collides with key: {name}"
+                    raise e.BaseError(error_message)
+                if (
+                    aggregate.field is None
+                    and aggregate.function != c.OracleWms.AggregateFunction.COUNT
+                ):
+                    error_message = f"Aggregate requires a field: {name}"
+                    raise e.BaseError(error_message)
+            self.key_fields: tuple[str, ...] = key_fields
+            self.aggregations = aggregations
+            self.compile_getter = compile_getter
+            self.column_values = column_values
+
+        def aggregate(
+            self,
+            records: (
+                Iterable[t.OracleWms.FilterRecord]
+                | FlextOracleWmsUtilitiesColumnar.RecordBatch
+            ),
+        ) -> list[GroupRow]:
+            """Return one row per distinct key, numbering groups by hash."""
+            accumulators = self._accumulators()
+            numbers: dict[Hashable, int] = {}
+            group_keys: list[tuple[FieldValue, ...]] = []
+            for key_values, columns in self._chunks(records, self.key_fields):
+                groups: list[int] = []
+                for key in key_values:
+                    try:
+                        number = numbers.get(key)
+                        hashed: Hashable = key
+                    except TypeError:
+                        hashed = tuple(_hashable(value) for value in key)
+                        number = numbers.get(hashed)
+                    if number is None:
+                        number = numbers[hashed] = len(group_keys)
+                        group_keys.append(key)
+                    groups.append(number)
+                for accumulator, values in zip(accumulators, columns, strict=True):
+                    accumulator.resize(len(group_keys))
+                    accumulator.extend(groups, values)
+            return [
+                self._row(key, accumulators, number)
+                for number, key in enumerate(group_keys)
+            ]
+
+        def iter_clustered(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+        ) -> Iterator[GroupRow]:
+            """Yield one row per run of adjacent records with equal keys."""
+            key_getters = [self.compile_getter(field) for field in self.key_fields]
+            for key, group in itertools.groupby(
+                records,
+                lambda record: tuple(get_key(record) for get_key in key_getters),
+            ):
+                accumulators = self._accumulators()
+                for accumulator in accumulators:
+                    accumulator.resize(1)
+                for rows, columns in self._chunks(group, ()):
+                    groups = [0] * len(rows)
+                    for accumulator, values in zip(accumulators, columns, strict=True):
+                        accumulator.extend(groups, values)
+                yield self._row(key, accumulators, 0)
+
+        def _accumulators(
+            self,
+        ) -> list[FlextOracleWmsUtilitiesGrouping.Accumulator]:
+            """Return fresh accumulators, one per aggregation."""
+            grouping = FlextOracleWmsUtilitiesGrouping
+            functions = c.OracleWms.AggregateFunction
+            accumulators: list[FlextOracleWmsUtilitiesGrouping.Accumulator] = []
+            for aggregate in self.aggregations.values():
+                accumulator: FlextOracleWmsUtilitiesGrouping.Accumulator
+                match aggregate.function:
+                    case functions.COUNT:
+                        accumulator = grouping.CountAccumulator(
+                            rows=aggregate.field is None
+                        )
+                    case functions.SUM | functions.AVG:
+                        accumulator = grouping.SumAccumulator(
+                            average=aggregate.function == functions.AVG
+                        )
+                    case functions.MIN | functions.MAX:
+                        accumulator = grouping.ExtremeAccumulator(
+                            self._sort_key,
+                            largest=aggregate.function == functions.MAX,
+                        )
+                    case functions.DISTINCT_COUNT:
+                        accumulator = grouping.DistinctAccumulator()
+                accumulators.append(accumulator)
+            return accumulators
+
+        def _chunks(
+            self,
+            records: (
+                Iterable[t.OracleWms.FilterRecord]
+                | FlextOracleWmsUtilitiesColumnar.RecordBatch
+            ),
+            key_fields: Sequence[str],
+        ) -> Iterator[GroupChunk]:
+            """Yield ``(key tuples, value column per aggregation)`` per chunk.
+
+            Row counts get an empty column.
+            """
+            chunk_size = c.OracleWms.Filtering.GROUP_BY_CHUNK_SIZE
+            value_fields = [aggregate.field for aggregate in self.aggregations.values()]
+            if isinstance(records, FlextOracleWmsUtilitiesColumnar.RecordBatch):
+                read = self.column_values
+                for start in range(0, len(records), chunk_size):
+                    part = records[start : start + chunk_size]
+                    key_columns = [read(part, field) for field in key_fields]
+                    yield (
+                        list(zip(*key_columns, strict=True))
+                        if key_columns
+                        else [()] * len(part),
+                        [
+                            () if field is None else read(part, field)
+                            for field in value_fields
+                        ],
+                    )
+                return
+            key_getters = [self.compile_getter(field) for field in key_fields]
+            value_getters = [
+                None if field is None else self.compile_getter(field)
+                for field in value_fields
+            ]
+            for chunk in itertools.batched(records, chunk_size, strict=False):
+                key_columns = [
+                    [get_key(record) for record in chunk] for get_key in key_getters
+                ]
+                yield (
+                    list(zip(*key_columns, strict=True))
+                    if key_columns
+                    else [()] * len(chunk),
+                    [
+                        ()
+                        if get_value is None
+                        else [get_value(record) for record in chunk]
+                        for get_value in value_getters
+                    ],
+                )
+
+        def _row(
+            self,
+            key_values: Sequence[FieldValue],
+            accumulators: Sequence[FlextOracleWmsUtilitiesGrouping.Accumulator],
+            group: int,
+        ) -> GroupRow:
+            """Combine key values and aggregate results into one output row."""
+            row: GroupRow = dict(zip(self.key_fields, key_values, strict=True))
+            for name, accumulator in zip(self.aggregations, accumulators, strict=True):
+                row[name] = accumulator.result(group)
+            return row
+
+        @staticmethod
+        def _sort_key(value: FieldValue) -> SortComponent:
+            return FlextOracleWmsUtilitiesSorting.Ordering.component(
+                value, c.OracleWms.SortKind.AUTO, ascending=True
+            )
+
+
+__all__: list[str] = [
+    "FlextOracleWmsUtilitiesGrouping",
+]
@@ -6,12 +6,17 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import json
 from types import TracebackType
 from typing import Self
 
 from flext_api import FlextApi, FlextApiSettings, u
 
-from flext_oracle_wms import c, m, p, r, t
+from flext_oracle_wms import FlextOracleWmsSettings, c, m, p, r, t
+from flext_oracle_wms._utilities.cache import FlextOracleWmsUtilitiesCache
+from flext_oracle_wms._utilities.resilience import FlextOracleWmsUtilitiesResilience
+from flext_oracle_wms._utilities.transport import FlextOracleWmsUtilitiesTransport
+from flext_oracle_wms._utilities.validators import FlextOracleWmsUtilitiesValidators
 
 
 class FlextOracleWmsUtilitiesHttpClient:
@@ -30,13 +35,49 @@ class FlextOracleWmsUtilitiesHttpClient:
             headers: t.StrMapping | None = None,
             *,
             verify_ssl: bool = True,
+            pool_size: int = c.OracleWms.Transport.DEFAULT_POOL_SIZE,
+            retry_attempts: int | None = None,
+            validation: c.OracleWms.PayloadValidation = (
+                c.OracleWms.PayloadValidation.FULL
+            ),
+            settings: FlextOracleWmsSettings | None = None,
         ) -> None:
-            """Initialize Oracle WMS HTTP client with FLEXT patterns."""
+            """Initialize Oracle WMS HTTP client with FLEXT patterns.
+
+            Retry and circuit-breaker limits come from ``settings`` (the global
+            settings when omitted) so this client and ``Client`` back off and
+            trip the same way; ``retry_attempts`` overrides the setting.
+            """
+            resolved_settings = (
+                settings
+                if settings is not None
+                else FlextOracleWmsSettings.fetch_global()
+            )
             self.base_url: str = base_url.rstrip("/")
             self.timeout: float = timeout
             self.default_headers = self._normalize_headers(dict(headers or {}))
             self.verify_ssl: bool = verify_ssl
-            self._client: FlextApi | None = None
+            self.pool_size: int = pool_size
+            self.validation: c.OracleWms.PayloadValidation = validation
+            self._retry_policy = FlextOracleWmsUtilitiesResilience.RetryPolicy(
+                max_retries=(
+                    retry_attempts
+                    if retry_attempts is not None
+                    else resolved_settings.retry_attempts
+                ),
+                budget=resolved_settings.retry_budget,
+            )
+            self._circuit_breakers = (
+                FlextOracleWmsUtilitiesResilience.CircuitBreakerRegistry(
+                    window_size=resolved_settings.circuit_window_size,
+                    failure_rate_threshold=resolved_settings.circuit_failure_rate,
+                    open_seconds=resolved_settings.circuit_open_seconds,
+                )
+            )
+            self._conditional_cache: FlextOracleWmsUtilitiesCache.ConditionalCache[
+                t.JsonMapping
+            ] = FlextOracleWmsUtilitiesCache.ConditionalCache()
+            self._client: FlextOracleWmsUtilitiesTransport.ConnectionPool | None = None
 
         def __enter__(self) -> Self:
             """Context manager entry."""
@@ -81,11 +122,9 @@ class FlextOracleWmsUtilitiesHttpClient:
             return body
 
         def close(self) -> None:
-            """Close HTTP client with FLEXT cleanup."""
+            """Close HTTP client and every pooled connection."""
             if self._client is not None:
-                close_fn = getattr(self._client, "close", None)
-                if callable(close_fn):
-                    _ = close_fn()
+                self._client.close()
             self._client = None
 
         def delete(
@@ -109,7 +148,7 @@ class FlextOracleWmsUtilitiesHttpClient:
                     "query_params": {},
                     "timeout": self.timeout,
                 })
-                response_result = self._client.request(request)
+                response_result = self._send("DELETE", request)
                 if response_result.failure:
                     return r[t.JsonMapping].fail_op(
                         "HTTP request", response_result.error
@@ -127,7 +166,12 @@ class FlextOracleWmsUtilitiesHttpClient:
             params: t.Api.WebParams | None = None,
             headers: t.StrMapping | None = None,
         ) -> p.Result[t.JsonMapping]:
-            """Make GET request with railway-oriented error handling."""
+            """Make GET request with railway-oriented error handling.
+
+            URLs answered with ``ETag`` / ``Last-Modified`` are revalidated on
+            repeat calls; a 304 returns the previously decoded body. A 304 that
+            no remembered body backs is followed by one unconditional GET.
+            """
             params_str: t.Api.WebParams | None = params
             return self._execute_request(
                 "GET", path, params=params_str, headers=headers
@@ -168,7 +212,7 @@ class FlextOracleWmsUtilitiesHttpClient:
                     "query_params": {},
                     "timeout": self.timeout,
                 })
-                response_result = self._client.request(request)
+                response_result = self._send("PUT", request)
                 if response_result.failure:
                     return r[t.JsonMapping].fail_op(
                         "HTTP request",
@@ -198,7 +242,10 @@ class FlextOracleWmsUtilitiesHttpClient:
                     "log_requests": False,
                     "log_responses": False,
                 })
-                self._client = FlextApi(settings=settings)
+                self._client = FlextOracleWmsUtilitiesTransport.ConnectionPool(
+                    lambda: FlextApi(settings=settings),
+                    max_size=self.pool_size,
+                )
 
         def _execute_request(
             self,
@@ -207,18 +254,31 @@ class FlextOracleWmsUtilitiesHttpClient:
             params: t.Api.WebParams | None = None,
             headers: t.StrMapping | None = None,
             body: t.JsonMapping | None = None,
+            *,
+            revalidate: bool = True,
         ) -> p.Result[t.JsonMapping]:
-            """Execute HTTP request with FLEXT delegation."""
+            """Execute HTTP request with FLEXT delegation.
+
+            ``revalidate=False`` sends a GET without cache validators.
+            """
             try:
                 self._ensure_client()
                 if self._client is None:
                     return r[t.JsonMapping].fail("Client not initialized")
                 request_headers: t.MutableStrMapping = dict(self.default_headers)
-                request_headers.update(self._normalize_headers(headers))
                 url = f"{self.base_url}/{path.lstrip('/')}" if path else self.base_url
                 if params:
                     query = "&".join((f"{k}={v}" for k, v in params.items()))
                     url = f"{url}?{query}"
+                caller_headers = self._normalize_headers(headers)
+                caller_validated = any(
+                    name.lower() in c.OracleWms.Cache.VALIDATOR_HEADERS
+                    for name in caller_headers
+                )
+                conditional = method == "GET"
+                if conditional and revalidate and not caller_validated:
+                    request_headers.update(self._conditional_cache.validators(url))
+                request_headers.update(caller_headers)
                 request = m.Api.HttpRequest.model_validate({
                     "method": method,
                     "url": url,
@@ -227,7 +287,7 @@ class FlextOracleWmsUtilitiesHttpClient:
                     "query_params": params or {},
                     "timeout": self.timeout,
                 })
-                response_result = self._client.request(request)
+                response_result = self._send(method, request)
                 if response_result.failure:
                     return r[t.JsonMapping].fail(
                         f"HTTP {method} failed: {response_result.error}",
@@ -237,7 +297,34 @@ class FlextOracleWmsUtilitiesHttpClient:
                     return r[t.JsonMapping].fail(
                         f"HTTP {response.status_code}: {response.body!r}",
                     )
-                return self._parse_response_body(response.body)
+                if not conditional:
+                    return self._parse_response_body(response.body)
+                if (
+                    response.status_code == c.OracleWms.Cache.NOT_MODIFIED_STATUS_CODE
+                    and revalidate
+                ):
+                    cached = (
+                        None
+                        if caller_validated
+                        else self._conditional_cache.lookup(url)
+                    )
+                    if cached is not None:
+                        return r[t.JsonMapping].ok(cached)
+                    return self._execute_request(
+                        method,
+                        path,
+                        params=params,
+                        headers={
+                            name: value
+                            for name, value in caller_headers.items()
+                            if name.lower() not in c.OracleWms.Cache.VALIDATOR_HEADERS
+                        },
+                        revalidate=False,
+                    )
+                parsed = self._parse_response_body(response.body)
+                if parsed.success:
+                    self._conditional_cache.remember(url, response, parsed.value)
+                return parsed
             except c.EXC_VALIDATION_VALUE as exc:
                 return r[t.JsonMapping].fail(f"Request validation error: {exc}")
             except OSError as exc:
@@ -247,28 +334,59 @@ class FlextOracleWmsUtilitiesHttpClient:
             self,
             body: t.Api.ResponseBody,
         ) -> p.Result[t.JsonMapping]:
-            """Parse response body; propagates parse failure via result."""
-            try:
-                match body:
-                    case dict() as payload:
-                        parsed = t.json_mapping_adapter().validate_python(
-                            payload,
-                        )
-                    case str() as raw if raw:
-                        parsed = t.json_mapping_adapter().validate_json(
-                            raw,
-                        )
-                    case bytes() as raw_bytes:
-                        parsed = t.json_mapping_adapter().validate_json(
-                            raw_bytes,
-                        )
-                    case _:
-                        return r[t.JsonMapping].fail(
-                            f"Unsupported response body type: {type(body)}"
-                        )
-                return r[t.JsonMapping].ok(parsed)
-            except c.EXC_VALIDATION_VALUE as exc:
-                return r[t.JsonMapping].fail(f"Response parse error: {exc}")
+            """Parse response body; propagates parse failure via result.
+
+            Below ``full`` validation the decoded JSON object is trusted as is
+            instead of being re-validated as a JSON mapping.
+            """
+            if self.validation != c.OracleWms.PayloadValidation.FULL:
+                return self._trust_response_body(body)
+            return FlextOracleWmsUtilitiesValidators.Registry.json_mapping().decode(
+                body
+            )
+
+        @staticmethod
+        def _trust_response_body(body: t.Api.ResponseBody) -> p.Result[t.JsonMapping]:
+            """Decode ``body`` to a JSON object without per-value validation."""
+            match body:
+                case dict() as payload:
+                    return r[t.JsonMapping].ok(payload)
+                case bytes() | str() as raw if raw:
+                    try:
+                        parsed = json.loads(raw)
+                    except ValueError as exc:
+                        return r[t.JsonMapping].fail(f"Response parse error: {exc}")
+                    if isinstance(parsed, dict):
+                        return r[t.JsonMapping].ok(parsed)
+                    return r[t.JsonMapping].fail("Response parse error: not an object")
+                case _:
+                    return r[t.JsonMapping].fail(
+                        f"Unsupported response body type: {type(body)}"
+                    )
+
+        def _send(
+            self,
+            method: str,
+            request: m.Api.HttpRequest,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Send ``request`` through its endpoint circuit under the retry policy."""
+            client = self._client
+            if client is None:
+                return r[m.Api.HttpResponse].fail("Client not initialized")
+            endpoint, breaker = self._circuit_breakers.breaker_for(method, request.url)
+
+            def send() -> p.Result[m.Api.HttpResponse]:
+                if not breaker.allow():
+                    return r[m.Api.HttpResponse].fail(f"Circuit open for {endpoint}")
+                try:
+                    attempt = client.request(request)
+                except Exception:
+                    breaker.record_failure()
+                    raise
+                breaker.record(attempt)
+                return attempt
+
+            return self._retry_policy.execute(method, send)
 
         @staticmethod
         def create(
@@ -277,6 +395,12 @@ class FlextOracleWmsUtilitiesHttpClient:
             headers: t.StrMapping | None = None,
             *,
             verify_ssl: bool = True,
+            pool_size: int = c.OracleWms.Transport.DEFAULT_POOL_SIZE,
+            retry_attempts: int | None = None,
+            validation: c.OracleWms.PayloadValidation = (
+                c.OracleWms.PayloadValidation.FULL
+            ),
+            settings: FlextOracleWmsSettings | None = None,
         ) -> FlextOracleWmsUtilitiesHttpClient.HttpClient:
             """Create HttpClient instance."""
             return FlextOracleWmsUtilitiesHttpClient.HttpClient(
@@ -284,6 +408,10 @@ class FlextOracleWmsUtilitiesHttpClient:
                 timeout=timeout,
                 headers=headers,
                 verify_ssl=verify_ssl,
+                pool_size=pool_size,
+                retry_attempts=retry_attempts,
+                validation=validation,
+                settings=settings,
             )
 
 
@@ -0,0 +1,376 @@
+"""Oracle WMS Indexing utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections.abc import Callable, Hashable, Iterable, Sequence
+
+from flext_oracle_wms import c, m, p, r, t
+from flext_oracle_wms._utilities.expressions import (
+    FieldGetter,
+    FieldTest,
+    FieldValue,
+    FilterEntry,
+)
+from flext_oracle_wms._utilities.filtering import FlextOracleWmsUtilitiesFiltering
+
+type IndexKey = tuple[str, str] | tuple[str, str, type]
+
+
+class FlextOracleWmsUtilitiesIndexing:
+    """Indexed record lookups for Oracle WMS -- u.OracleWms.Indexing.*."""
+
+    class HashIndex:
+        """Record positions grouped by one derived key per field value."""
+
+        __slots__ = ("keys", "missing")
+
+        def __init__(
+            self,
+            values: Iterable[FieldValue | t.OracleWms.FilterRecordValue],
+            key: (
+                Callable[[FieldValue | t.OracleWms.FilterRecordValue], Hashable] | None
+            ) = None,
+        ) -> None:
+            """Index ``values`` by ``key`` (the value itself by default).
+
+            ``None`` values are kept apart in ``missing``.
+
+            Unhashable values are left out; they never equal a scalar key.
+            """
+            self.keys: dict[Hashable, list[int]] = {}
+            self.missing: list[int] = []
+            for position, value in enumerate(values):
+                if value is None:
+                    self.missing.append(position)
+                    continue
+                try:
+                    derived = value if key is None else key(value)
+                    self.keys.setdefault(derived, []).append(position)
+                except TypeError:
+                    continue
+
+        def select(self, keys: Iterable[Hashable]) -> set[int]:
+            """Return positions whose key is any of ``keys``."""
+            selected: set[int] = set()
+            for key in keys:
+                selected.update(self.keys.get(key, ()))
+            return selected
+
+        def select_equal(self, key: Hashable) -> set[int]:
+            """Return positions whose key ``==`` ``key`` (NaN matches nothing)."""
+            if isinstance(key, float) and math.isnan(key):
+                return set()
+            return set(self.keys.get(key, ()))
+
+    class RangeIndex:
+        """Sorted record positions mirroring ``Filter._compare`` semantics.
+
+        Values that parse as numbers are ordered numerically, the rest as
+        text; a text ordering of every value serves non-numeric bounds.
+        """
+
+        __slots__ = (
+            "number_positions",
+            "numbers",
+            "text_positions",
+            "texts",
+            "unparsed",
+            "unparsed_positions",
+        )
+
+        def __init__(
+            self,
+            entries: Iterable[tuple[int, FieldValue | t.OracleWms.FilterRecordValue]],
+        ) -> None:
+            """Sort ``(position, value)`` entries into bisectable key lists."""
+            adapter = t.float_adapter()
+            numbers: list[tuple[float, int]] = []
+            unparsed: list[tuple[str, int]] = []
+            texts: list[tuple[str, int]] = []
+            for position, value in entries:
+                text = str(value)
+                texts.append((text, position))
+                try:
+                    number = adapter.validate_python(value)
+                except c.ValidationError:
+                    unparsed.append((text, position))
+                    continue
+                if not math.isnan(number):
+                    numbers.append((number, position))
+            numbers.sort()
+            unparsed.sort()
+            texts.sort()
+            self.numbers: list[float] = [key for key, _ in numbers]
+            self.number_positions: list[int] = [position for _, position in numbers]
+            self.unparsed: list[str] = [key for key, _ in unparsed]
+            self.unparsed_positions: list[int] = [position for _, position in unparsed]
+            self.texts: list[str] = [key for key, _ in texts]
+            self.text_positions: list[int] = [position for _, position in texts]
+
+        def select(
+            self,
+            operator: c.OracleWms.WmsFilterOperator | str,
+            bound: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+        ) -> set[int]:
+            """Return positions whose value compares ``operator`` to ``bound``."""
+            try:
+                number = t.float_adapter().validate_python(bound)
+            except c.ValidationError:
+                return self._slice(
+                    self.texts, self.text_positions, operator, str(bound)
+                )
+            selected = self._slice(
+                self.unparsed, self.unparsed_positions, operator, str(bound)
+            )
+            if not math.isnan(number):
+                selected.update(
+                    self._slice(self.numbers, self.number_positions, operator, number)
+                )
+            return selected
+
+        @staticmethod
+        def _slice[K: float | str](
+            keys: list[K],
+            positions: list[int],
+            operator: c.OracleWms.WmsFilterOperator | str,
+            bound: K,
+        ) -> set[int]:
+            match operator:
+                case c.OracleWms.WmsFilterOperator.GT:
+                    return set(positions[bisect.bisect_right(keys, bound) :])
+                case c.OracleWms.WmsFilterOperator.GTE:
+                    return set(positions[bisect.bisect_left(keys, bound) :])
+                case c.OracleWms.WmsFilterOperator.LT:
+                    return set(positions[: bisect.bisect_left(keys, bound)])
+                case _:
+                    return set(positions[: bisect.bisect_right(keys, bound)])
+
+    class IndexedRecordSet:
+        """Immutable record snapshot answering repeated filters through indexes.
+
+        Hash indexes serve equality, list and ``in`` conditions; sorted
+        indexes serve ordering operators and id ranges. Each index is built
+        the first time a query needs it. The planner intersects index hits,
+        smallest first, and evaluates the remaining conditions only on the
+        surviving records, so results equal ``Filter.filter_records``.
+        """
+
+        def __init__(
+            self,
+            records: Iterable[t.OracleWms.FilterRecord],
+            *,
+            filter_engine: FlextOracleWmsUtilitiesFiltering.Filter | None = None,
+        ) -> None:
+            """Snapshot ``records`` matched with ``filter_engine`` semantics."""
+            self.records: tuple[t.OracleWms.FilterRecord, ...] = tuple(records)
+            self.filter_engine: FlextOracleWmsUtilitiesFiltering.Filter = (
+                filter_engine or FlextOracleWmsUtilitiesFiltering.Filter()
+            )
+            self._columns: dict[str, list[FieldValue]] = {}
+            self._hash_indexes: dict[
+                IndexKey, FlextOracleWmsUtilitiesIndexing.HashIndex
+            ] = {}
+            self._range_indexes: dict[
+                IndexKey, FlextOracleWmsUtilitiesIndexing.RangeIndex
+            ] = {}
+
+        def __len__(self) -> int:
+            """Return the number of records in the snapshot."""
+            return len(self.records)
+
+        @property
+        def indexes(self) -> frozenset[IndexKey]:
+            """Keys of every index built so far."""
+            return frozenset(self._hash_indexes) | frozenset(self._range_indexes)
+
+        def filter_records(
+            self,
+            filters: t.MappingKV[str, FilterEntry],
+            limit: int | None = None,
+        ) -> p.Result[Sequence[t.OracleWms.FilterRecord]]:
+            """Filter the snapshot like ``Filter.filter_records``."""
+            engine = self.filter_engine
+            if (result := engine.validate_filters(filters)).failure:
+                return r[Sequence[t.OracleWms.FilterRecord]].fail(
+                    result.error or "Validation failed",
+                )
+            compiled = engine.compile(filters)
+            hits: list[set[int]] = []
+            residual: list[tuple[FieldGetter, FieldTest]] = []
+            for (field, entry), (_, get_value, test) in zip(
+                filters.items(), compiled.conditions, strict=True
+            ):
+                selected = self._lookup(field, entry)
+                if selected is None:
+                    residual.append((get_value, test))
+                else:
+                    hits.append(selected)
+            if not hits:
+                return r[Sequence[t.OracleWms.FilterRecord]].ok(
+                    compiled.filter(self.records, limit)
+                )
+            hits.sort(key=len)
+            candidates = hits[0].intersection(*hits[1:])
+            matched: list[t.OracleWms.FilterRecord] = []
+            if limit is not None and limit <= 0:
+                return r[Sequence[t.OracleWms.FilterRecord]].ok(matched)
+            for position in sorted(candidates):
+                record = self.records[position]
+                if all(test(get_value(record)) for get_value, test in residual):
+                    matched.append(record)
+                    if limit is not None and len(matched) >= limit:
+                        break
+            return r[Sequence[t.OracleWms.FilterRecord]].ok(matched)
+
+        def filter_by_field(
+            self,
+            field: str,
+            value: t.OracleWms.FilterScalar,
+            operator: c.OracleWms.WmsFilterOperator | None = None,
+        ) -> p.Result[Sequence[t.OracleWms.FilterRecord]]:
+            """Filter the snapshot like ``Filter.filter_by_field``."""
+            filters: t.MappingKV[str, FilterEntry]
+            if operator is None:
+                filters = {field: value}
+            else:
+                filters = {
+                    field: m.OracleWms.FlextOracleWmsOperatorFilter(
+                        operator=operator, value=value
+                    ),
+                }
+            return self.filter_records(filters)
+
+        def filter_by_id_range(
+            self,
+            id_field: str,
+            min_id: t.OracleWms.FilterScalar | None = None,
+            max_id: t.OracleWms.FilterScalar | None = None,
+        ) -> p.Result[Sequence[t.OracleWms.FilterRecord]]:
+            """Filter the snapshot like ``Filter.filter_by_id_range``."""
+            key: IndexKey = ("range", id_field)
+            index = self._range_indexes.get(key)
+            if index is None:
+                index = FlextOracleWmsUtilitiesIndexing.RangeIndex(
+                    (position, value)
+                    for position, record in enumerate(self.records)
+                    if (value := record.get(id_field)) is not None
+                )
+                self._range_indexes[key] = index
+            selected = set(index.text_positions)
+            if min_id is not None:
+                selected &= index.select(c.OracleWms.WmsFilterOperator.GTE, min_id)
+            if max_id is not None:
+                selected &= index.select(c.OracleWms.WmsFilterOperator.LTE, max_id)
+            return r[Sequence[t.OracleWms.FilterRecord]].ok([
+                self.records[position] for position in sorted(selected)
+            ])
+
+        def _column(self, field: str) -> list[FieldValue]:
+            """Return ``field`` per record as the filter engine resolves it."""
+            column = self._columns.get(field)
+            if column is None:
+                get_value = self.filter_engine.compile_getter(field)
+                column = [get_value(record) for record in self.records]
+                self._columns[field] = column
+            return column
+
+        def _hash_index(
+            self,
+            field: str,
+            kind: str,
+        ) -> FlextOracleWmsUtilitiesIndexing.HashIndex:
+            key: IndexKey = (kind, field)
+            index = self._hash_indexes.get(key)
+            if index is None:
+                derive: (
+                    Callable[[FieldValue | t.OracleWms.FilterRecordValue], Hashable]
+                    | None
+                )
+                match kind:
+                    case "fold":
+                        derive = self.filter_engine.compile_normalizer()
+                    case "text":
+                        derive = str
+                    case _:
+                        derive = None
+                index = FlextOracleWmsUtilitiesIndexing.HashIndex(
+                    self._column(field), derive
+                )
+                self._hash_indexes[key] = index
+            return index
+
+        def _lookup(self, field: str, entry: FilterEntry) -> set[int] | None:
+            """Return exact matches of one condition, or None when unindexed."""
+            match entry:
+                case list() as candidates:
+                    try:
+                        return self._hash_index(field, "raw").select(
+                            frozenset(candidates)
+                        )
+                    except TypeError:
+                        return None
+                case m.OracleWms.FlextOracleWmsOperatorFilter() as condition:
+                    return self._lookup_operator(
+                        field, condition.operator, condition.value
+                    )
+                case _:
+                    index = self._hash_index(field, "fold")
+                    expected = self.filter_engine.compile_normalizer()(entry)
+                    selected = index.select_equal(expected)
+                    if isinstance(expected, str) and not expected:
+                        selected.update(index.missing)
+                    return selected
+
+        def _lookup_operator(
+            self,
+            field: str,
+            operator: c.OracleWms.WmsFilterOperator | str,
+            value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+        ) -> set[int] | None:
+            ordering = {
+                c.OracleWms.WmsFilterOperator.GT,
+                c.OracleWms.WmsFilterOperator.GTE,
+                c.OracleWms.WmsFilterOperator.LT,
+                c.OracleWms.WmsFilterOperator.LTE,
+            }
+            if value is None:
+                if operator in {
+                    c.OracleWms.WmsFilterOperator.EQ,
+                    c.OracleWms.WmsFilterOperator.GTE,
+                    c.OracleWms.WmsFilterOperator.LTE,
+                }:
+                    return set(self._hash_index(field, "fold").missing)
+                return set()
+            match operator:
+                case c.OracleWms.WmsFilterOperator.EQ if not isinstance(value, list):
+                    expected = self.filter_engine.compile_normalizer()(value)
+                    return self._hash_index(field, "fold").select_equal(expected)
+                case c.OracleWms.WmsFilterOperator.IN:
+                    if not isinstance(value, list):
+                        return set()
+                    return self._hash_index(field, "text").select({
+                        str(item) for item in value
+                    })
+                case _ if operator in ordering:
+                    value_type = type(value)
+                    key: IndexKey = ("typed", field, value_type)
+                    index = self._range_indexes.get(key)
+                    if index is None:
+                        index = FlextOracleWmsUtilitiesIndexing.RangeIndex(
+                            (position, item)
+                            for position, item in enumerate(self._column(field))
+                            if type(item) is value_type
+                        )
+                        self._range_indexes[key] = index
+                    return index.select(operator, value)
+                case _:
+                    return None
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesIndexing"]
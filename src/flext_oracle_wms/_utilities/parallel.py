@@ -0,0 +1,183 @@
+"""Oracle WMS Parallel utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import ClassVar
+
+from flext_oracle_wms import c, e, t
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
+from flext_oracle_wms._utilities.expressions import (
+    FlextOracleWmsUtilitiesExpressions,
+)
+
+type ChunkCall = tuple[Callable[..., list[int]], tuple[Sequence[object], ...], int]
+
+
+class FlextOracleWmsUtilitiesParallel:
+    """Process-pool filtering for Oracle WMS -- u.OracleWms.Parallel.*."""
+
+    class ParallelWorker:
+        """Process-pool side of parallel filtering.
+
+        Each worker process receives the pickled predicate once, through
+        ``initialize``, and then answers chunks with the positions of the
+        matching records so no record is pickled back to the parent.
+        """
+
+        predicate: ClassVar[
+            FlextOracleWmsUtilitiesExpressions.RecordPredicate | None
+        ] = None
+
+        @classmethod
+        def initialize(
+            cls,
+            predicate: FlextOracleWmsUtilitiesExpressions.RecordPredicate,
+        ) -> None:
+            """Install ``predicate`` for the current worker process."""
+            cls.predicate = predicate
+
+        @classmethod
+        def match_rows(
+            cls,
+            records: Sequence[t.OracleWms.FilterRecord],
+        ) -> list[int]:
+            """Return the positions of ``records`` matching the predicate."""
+            predicate = cls.predicate
+            if predicate is None:
+                error_message = "Parallel worker is not initialized"
+                raise e.BaseError(error_message)
+            return [
+                position for position, record in enumerate(records) if predicate(record)
+            ]
+
+        @classmethod
+        def match_columns(
+            cls,
+            fields: Sequence[str],
+            columns: Sequence[list[t.JsonValue]],
+        ) -> list[int]:
+            """Return the matching row positions of a pruned columnar chunk."""
+            return cls.match_rows(
+                FlextOracleWmsUtilitiesColumnar.RecordBatch(fields, columns)
+            )
+
+    class ParallelPool:
+        """Parent side of parallel filtering: chunking, submission, order."""
+
+        @staticmethod
+        def size(workers: int | None, *, parallel: bool) -> int:
+            """Resolve the worker count; ``parallel`` defaults it to the CPUs.
+
+            Raises:
+                e.BaseError: When ``workers`` is not positive.
+
+            """
+            if workers is None:
+                return (os.process_cpu_count() or 1) if parallel else 1
+            if workers <= 0:
+                error_message = "Invalid workers"
+                raise e.BaseError(error_message)
+            return workers
+
+        @classmethod
+        def positions(
+            cls,
+            records: t.SequenceOf[t.OracleWms.FilterRecord],
+            predicate: FlextOracleWmsUtilitiesExpressions.RecordPredicate,
+            limit: int | None,
+            workers: int,
+            chunk_size: int,
+        ) -> list[int]:
+            """Return matching positions, evaluating chunks in a process pool.
+
+            At most ``PARALLEL_WINDOW_PER_WORKER * workers`` chunks are
+            pickled and in flight at once; results are collected in input
+            order and each one frees a slot for the next chunk. Once
+            ``limit`` positions are known the remaining chunks are neither
+            sliced nor submitted.
+
+            Raises:
+                e.BaseError: When ``chunk_size`` is not positive.
+
+            """
+            if chunk_size <= 0:
+                error_message = "Invalid chunk_size"
+                raise e.BaseError(error_message)
+            positions: list[int] = []
+            if limit is not None and limit <= 0:
+                return positions
+            window = c.OracleWms.Filtering.PARALLEL_WINDOW_PER_WORKER * workers
+            chunks = cls._chunks(records, predicate.fields, chunk_size)
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(
+                    c.OracleWms.Filtering.PARALLEL_START_METHOD
+                ),
+                initializer=FlextOracleWmsUtilitiesParallel.ParallelWorker.initialize,
+                initargs=(predicate,),
+            )
+            try:
+                pending: deque[tuple[Future[list[int]], int]] = deque(
+                    (executor.submit(call, *arguments), offset)
+                    for call, arguments, offset in itertools.islice(chunks, window)
+                )
+                while pending:
+                    future, offset = pending.popleft()
+                    positions.extend(offset + position for position in future.result())
+                    if limit is not None and len(positions) >= limit:
+                        return positions[:limit]
+                    if (chunk := next(chunks, None)) is not None:
+                        call, arguments, next_offset = chunk
+                        pending.append((executor.submit(call, *arguments), next_offset))
+                return positions
+            finally:
+                executor.shutdown(cancel_futures=True)
+
+        @staticmethod
+        def _chunks(
+            records: t.SequenceOf[t.OracleWms.FilterRecord],
+            fields: Sequence[str],
+            chunk_size: int,
+        ) -> Iterator[ChunkCall]:
+            """Yield ``(worker call, arguments, offset)`` per input chunk.
+
+            Columnar batches are cut into column slices restricted to the
+            top-level (and flattened) keys of ``fields``. The slices are still
+            copied and pickled to the workers, not shared: columns hold
+            arbitrary JSON values that ``multiprocessing.shared_memory`` cannot
+            store, and the ``spawn`` start method inherits no parent memory.
+            """
+            worker = FlextOracleWmsUtilitiesParallel.ParallelWorker
+            if isinstance(records, FlextOracleWmsUtilitiesColumnar.RecordBatch):
+                names = dict.fromkeys(
+                    name
+                    for field in fields
+                    for name in dict.fromkeys((
+                        field.split(".", 1)[0],
+                        field.replace(".", "_"),
+                    ))
+                    if name in records.field_index
+                )
+                for start in range(0, len(records), chunk_size):
+                    stop = start + chunk_size
+                    columns = [list(records.column(name)[start:stop]) for name in names]
+                    yield worker.match_columns, (tuple(names), columns), start
+                return
+            for start in range(0, len(records), chunk_size):
+                chunk = list(records[start : start + chunk_size])
+                yield worker.match_rows, (chunk,), start
+
+
+__all__: list[str] = [
+    "FlextOracleWmsUtilitiesParallel",
+]
@@ -0,0 +1,432 @@
+"""Oracle WMS Resilience utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from flext_oracle_wms import c, e, m, p
+
+
+class FlextOracleWmsUtilitiesResilience:
+    """Resilience utilities for Oracle WMS -- u.OracleWms.Resilience.*."""
+
+    class CircuitBreaker:
+        """Count-window circuit breaker guarding a single WMS endpoint.
+
+        The circuit opens when the failure rate over the last ``window_size``
+        calls reaches ``failure_rate_threshold`` (after ``minimum_calls``).
+        After ``open_seconds`` it lets ``half_open_max_calls`` trial calls
+        through; their success closes the circuit, any failure reopens it.
+        Transport failures and HTTP 5xx responses count as failures.
+        """
+
+        def __init__(
+            self,
+            *,
+            window_size: int = c.OracleWms.CircuitBreaker.WINDOW_SIZE,
+            minimum_calls: int = c.OracleWms.CircuitBreaker.MINIMUM_CALLS,
+            failure_rate_threshold: float = (
+                c.OracleWms.CircuitBreaker.FAILURE_RATE_THRESHOLD
+            ),
+            open_seconds: float = c.OracleWms.CircuitBreaker.OPEN_SECONDS,
+            half_open_max_calls: int = c.OracleWms.CircuitBreaker.HALF_OPEN_MAX_CALLS,
+            clock: Callable[[], float] = time.monotonic,
+        ) -> None:
+            """Initialize breaker thresholds and the rolling outcome window."""
+            if window_size <= 0 or not 0 < failure_rate_threshold <= 1:
+                error_message = "Invalid circuit breaker parameters"
+                raise e.BaseError(error_message)
+            self.window_size: int = window_size
+            self.minimum_calls: int = min(max(minimum_calls, 1), window_size)
+            self.failure_rate_threshold: float = failure_rate_threshold
+            self.open_seconds: float = open_seconds
+            self.half_open_max_calls: int = max(half_open_max_calls, 1)
+            self._clock = clock
+            self._lock = threading.Lock()
+            self._outcomes: deque[bool] = deque(maxlen=window_size)
+            self._state = c.OracleWms.CircuitState.CLOSED
+            self._opened_at = 0.0
+            self._trial_calls = 0
+            self._trial_successes = 0
+
+        @property
+        def state(self) -> c.OracleWms.CircuitState:
+            """Current circuit state, moving from open to half-open on expiry."""
+            with self._lock:
+                return self._current_state()
+
+        def allow(self) -> bool:
+            """Return whether a call may proceed, reserving a half-open trial."""
+            with self._lock:
+                match self._current_state():
+                    case c.OracleWms.CircuitState.CLOSED:
+                        return True
+                    case c.OracleWms.CircuitState.HALF_OPEN:
+                        if self._trial_calls < self.half_open_max_calls:
+                            self._trial_calls += 1
+                            return True
+                        return False
+                    case _:
+                        return False
+
+        def record(self, result: p.Result[m.Api.HttpResponse]) -> None:
+            """Record the outcome of an allowed call."""
+            failed = (
+                result.failure
+                or result.value.status_code
+                >= c.OracleWms.CircuitBreaker.FAILURE_STATUS_CODE
+            )
+            self._record(failed=failed)
+
+        def record_failure(self) -> None:
+            """Record an allowed call that raised instead of returning."""
+            self._record(failed=True)
+
+        def _current_state(self) -> c.OracleWms.CircuitState:
+            if (
+                self._state is c.OracleWms.CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.open_seconds
+            ):
+                self._state = c.OracleWms.CircuitState.HALF_OPEN
+                self._trial_calls = 0
+                self._trial_successes = 0
+            return self._state
+
+        def _record(self, *, failed: bool) -> None:
+            with self._lock:
+                match self._current_state():
+                    case c.OracleWms.CircuitState.HALF_OPEN:
+                        if failed:
+                            self._trip()
+                            return
+                        self._trial_successes += 1
+                        if self._trial_successes >= self.half_open_max_calls:
+                            self._state = c.OracleWms.CircuitState.CLOSED
+                            self._outcomes.clear()
+                    case c.OracleWms.CircuitState.CLOSED:
+                        self._outcomes.append(failed)
+                        calls = len(self._outcomes)
+                        if (
+                            calls >= self.minimum_calls
+                            and sum(self._outcomes) / calls
+                            >= self.failure_rate_threshold
+                        ):
+                            self._trip()
+                    case _:
+                        return
+
+        def _trip(self) -> None:
+            self._state = c.OracleWms.CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._outcomes.clear()
+
+    class CircuitBreakerRegistry:
+        """Circuit breakers keyed by HTTP method and endpoint path template.
+
+        Concrete paths are folded onto ``templates`` (``/entities/inventory``
+        becomes ``GET /entities/{name}``) so every entity shares one breaker
+        per endpoint; unknown paths are keyed by their literal path.
+        """
+
+        def __init__(
+            self,
+            *,
+            templates: tuple[str, ...] = c.OracleWms.CircuitBreaker.PATH_TEMPLATES,
+            window_size: int = c.OracleWms.CircuitBreaker.WINDOW_SIZE,
+            failure_rate_threshold: float = (
+                c.OracleWms.CircuitBreaker.FAILURE_RATE_THRESHOLD
+            ),
+            open_seconds: float = c.OracleWms.CircuitBreaker.OPEN_SECONDS,
+            clock: Callable[[], float] = time.monotonic,
+        ) -> None:
+            """Initialize registry with endpoint templates and breaker settings."""
+            self._templates = tuple(
+                tuple(template.strip("/").split("/")) for template in templates
+            )
+            self._window_size = window_size
+            self._failure_rate_threshold = failure_rate_threshold
+            self._open_seconds = open_seconds
+            self._clock = clock
+            self._lock = threading.Lock()
+            self._breakers: dict[
+                str, FlextOracleWmsUtilitiesResilience.CircuitBreaker
+            ] = {}
+
+        def breaker_for(
+            self,
+            method: str,
+            path: str,
+        ) -> tuple[str, FlextOracleWmsUtilitiesResilience.CircuitBreaker]:
+            """Return the endpoint key and breaker guarding ``method`` ``path``."""
+            key = self.endpoint_key(method, path)
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = FlextOracleWmsUtilitiesResilience.CircuitBreaker(
+                        window_size=self._window_size,
+                        minimum_calls=min(
+                            c.OracleWms.CircuitBreaker.MINIMUM_CALLS,
+                            self._window_size,
+                        ),
+                        failure_rate_threshold=self._failure_rate_threshold,
+                        open_seconds=self._open_seconds,
+                        clock=self._clock,
+                    )
+                    self._breakers[key] = breaker
+                return key, breaker
+
+        def endpoint_key(self, method: str, path: str) -> str:
+            """Fold ``path`` onto a known template, e.g. ``GET /entities/{name}``."""
+            segments = tuple(urlsplit(path).path.strip("/").split("/"))
+            for template in self._templates:
+                tail = segments[-len(template) :]
+                if len(tail) == len(template) and all(
+                    part.startswith("{") or part == segment
+                    for part, segment in zip(template, tail, strict=True)
+                ):
+                    return f"{method.upper()} /{'/'.join(template)}"
+            return f"{method.upper()} /{'/'.join(segments)}"
+
+        def states(self) -> Mapping[str, c.OracleWms.CircuitState]:
+            """Return the current state of every known endpoint circuit."""
+            with self._lock:
+                breakers = dict(self._breakers)
+            return {key: breaker.state for key, breaker in breakers.items()}
+
+    class RateLimiter:
+        """Thread-safe token bucket whose rate adapts with AIMD.
+
+        Every throttled (HTTP 429) response multiplies the rate by
+        ``decrease_factor``; every successful response adds roughly
+        ``additive_increase`` requests/second per second of traffic. One
+        limiter can be shared by several clients, threads and the asyncio
+        client executor.
+        """
+
+        def __init__(
+            self,
+            *,
+            rate: float,
+            min_rate: float = c.OracleWms.RateLimit.MIN_RATE,
+            max_rate: float = c.OracleWms.RateLimit.MAX_RATE,
+            burst: float = c.OracleWms.RateLimit.BURST,
+            additive_increase: float = c.OracleWms.RateLimit.ADDITIVE_INCREASE,
+            decrease_factor: float = c.OracleWms.RateLimit.DECREASE_FACTOR,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep,
+        ) -> None:
+            """Initialize the bucket with its starting rate and AIMD bounds."""
+            if rate <= 0 or not 0 < decrease_factor < 1:
+                error_message = "Invalid rate limiter parameters"
+                raise e.BaseError(error_message)
+            self.min_rate: float = min(min_rate, rate)
+            self.max_rate: float = max(max_rate, rate)
+            self.burst: float = max(burst, 1.0)
+            self.additive_increase: float = additive_increase
+            self.decrease_factor: float = decrease_factor
+            self._rate = rate
+            self._tokens = self.burst
+            self._clock = clock
+            self._sleep = sleep
+            self._updated_at = clock()
+            self._lock = threading.Lock()
+            self._granted = 0
+            self._throttled = 0
+            self._waited = 0.0
+
+        @property
+        def rate(self) -> float:
+            """Currently allowed sustained requests per second."""
+            with self._lock:
+                return self._rate
+
+        def acquire(self) -> None:
+            """Block until a request token is available."""
+            while True:
+                with self._lock:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._granted += 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+                    self._waited += wait
+                self._sleep(wait)
+
+        def on_success(self) -> None:
+            """Probe upward additively after an accepted request."""
+            with self._lock:
+                self._rate = min(
+                    self.max_rate,
+                    self._rate + self.additive_increase / self._rate,
+                )
+
+        def on_throttle(self) -> None:
+            """Back off multiplicatively after a throttled request."""
+            with self._lock:
+                self._throttled += 1
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._tokens = min(self._tokens, 0.0)
+
+        def record(self, result: p.Result[m.Api.HttpResponse]) -> None:
+            """Feed a request outcome back into the AIMD controller."""
+            if result.failure:
+                return
+            status = result.value.status_code
+            if status == c.OracleWms.RateLimit.THROTTLED_STATUS_CODE:
+                self.on_throttle()
+            elif status < c.OracleWms.RateLimit.SERVER_ERROR_STATUS_CODE:
+                self.on_success()
+
+        def stats(self) -> m.OracleWms.RateLimiterStats:
+            """Return a snapshot of the allowed rate and limiter counters."""
+            with self._lock:
+                return m.OracleWms.RateLimiterStats(
+                    rate=self._rate,
+                    granted=self._granted,
+                    throttled=self._throttled,
+                    waited_seconds=self._waited,
+                )
+
+        def _refill(self) -> None:
+            now = self._clock()
+            elapsed = max(now - self._updated_at, 0.0)
+            self._updated_at = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+
+    class RetryPolicy:
+        """Decorrelated-jitter retry policy for transient WMS failures.
+
+        HTTP 429 and 503 are retried for every method because the server did
+        not process the request; 502, 504 and connection resets are retried for
+        idempotent methods only. ``Retry-After`` is honored, and a call stops
+        retrying once its ``budget`` seconds would be exceeded.
+        """
+
+        def __init__(
+            self,
+            *,
+            max_retries: int = c.OracleWms.DEFAULT_MAX_RETRIES,
+            base_delay: float = c.OracleWms.DEFAULT_RETRY_DELAY,
+            max_delay: float = c.OracleWms.Retry.MAX_DELAY,
+            budget: float = c.OracleWms.Retry.DEFAULT_BUDGET,
+            sleep: Callable[[float], None] = time.sleep,
+            rng: random.Random | None = None,
+        ) -> None:
+            """Initialize retry policy limits and backoff parameters."""
+            if max_retries < 0:
+                error_message = "Invalid max_retries"
+                raise e.BaseError(error_message)
+            self.max_retries: int = max_retries
+            self.base_delay: float = base_delay
+            self.max_delay: float = max(max_delay, base_delay)
+            self.budget: float = budget
+            self._sleep = sleep
+            self._rng = rng or random.SystemRandom()
+
+        @staticmethod
+        def _idempotent(method: str) -> bool:
+            return method.upper() in c.OracleWms.Retry.IDEMPOTENT_METHODS
+
+        @staticmethod
+        def _retry_after(response: m.Api.HttpResponse) -> float | None:
+            """Parse ``Retry-After`` as delta-seconds or an HTTP date."""
+            headers = getattr(response, "headers", None)
+            if not isinstance(headers, Mapping):
+                return None
+            raw = next(
+                (
+                    str(value)
+                    for key, value in headers.items()
+                    if str(key).lower() == "retry-after"
+                ),
+                None,
+            )
+            if raw is None:
+                return None
+            try:
+                return max(float(raw), 0.0)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(raw)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+        def execute(
+            self,
+            method: str,
+            send: Callable[[], p.Result[m.Api.HttpResponse]],
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Call ``send`` until it succeeds, is not retryable, or limits are hit.
+
+            The last result is returned unchanged so callers keep mapping
+            HTTP status codes as before.
+            """
+            deadline = time.monotonic() + self.budget
+            delay = self.base_delay
+            attempt = 0
+            while True:
+                attempt += 1
+                connection_error: ConnectionError | None = None
+                retry_after: float | None = None
+                try:
+                    result = send()
+                except ConnectionError as exc:
+                    if attempt > self.max_retries or not self._idempotent(method):
+                        raise
+                    connection_error = exc
+                else:
+                    if attempt > self.max_retries or not self.is_retryable(
+                        method, result
+                    ):
+                        return result
+                    if result.success:
+                        retry_after = self._retry_after(result.value)
+                delay = min(
+                    self.max_delay,
+                    self._rng.uniform(self.base_delay, delay * 3),
+                )
+                wait = max(delay, retry_after or 0.0)
+                if time.monotonic() + wait > deadline:
+                    if connection_error is not None:
+                        raise connection_error
+                    return result
+                self._sleep(wait)
+
+        def is_retryable(
+            self,
+            method: str,
+            result: p.Result[m.Api.HttpResponse],
+        ) -> bool:
+            """Return whether ``result`` is a transient failure worth retrying."""
+            if result.failure:
+                error = (result.error or "").lower()
+                return self._idempotent(method) and any(
+                    marker in error
+                    for marker in c.OracleWms.Retry.CONNECTION_RESET_MARKERS
+                )
+            status = result.value.status_code
+            if status in c.OracleWms.Retry.ALWAYS_RETRYABLE_STATUS_CODES:
+                return True
+            return (
+                status in c.OracleWms.Retry.IDEMPOTENT_RETRYABLE_STATUS_CODES
+                and self._idempotent(method)
+            )
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesResilience"]
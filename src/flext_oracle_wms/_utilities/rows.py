@@ -0,0 +1,94 @@
+"""Oracle WMS Rows utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from typing import override
+
+from flext_oracle_wms import c
+
+
+class FlextOracleWmsUtilitiesRows:
+    """Compact record utilities for Oracle WMS -- u.OracleWms.Rows.*."""
+
+    class RowSchema:
+        """Interned field table shared by every row with the same key layout."""
+
+        __slots__ = ("fields", "index")
+
+        def __init__(self, fields: Sequence[str]) -> None:
+            """Intern ``fields`` and index them by name."""
+            self.fields: tuple[str, ...] = tuple(sys.intern(name) for name in fields)
+            self.index: Mapping[str, int] = {
+                name: position for position, name in enumerate(self.fields)
+            }
+
+    class Row[V](Mapping[str, V]):
+        """Tuple-backed read-only record; keys live once in its ``RowSchema``."""
+
+        __slots__ = ("_schema", "_values")
+
+        def __init__(
+            self,
+            schema: FlextOracleWmsUtilitiesRows.RowSchema,
+            values: tuple[V, ...],
+        ) -> None:
+            """Initialize row with ``values`` aligned to ``schema.fields``."""
+            self._schema = schema
+            self._values = values
+
+        @override
+        def __getitem__(self, key: str) -> V:
+            return self._values[self._schema.index[key]]
+
+        @override
+        def __iter__(self) -> Iterator[str]:
+            return iter(self._schema.fields)
+
+        @override
+        def __len__(self) -> int:
+            return len(self._values)
+
+        @override
+        def __repr__(self) -> str:
+            return f"Row({dict(self)!r})"
+
+    class RowFactory[V]:
+        """Convert decoded records into compact rows, one schema per key layout.
+
+        Records of one entity nearly always share their key order, so the
+        schema lookup is a single dict hit. Layouts beyond ``max_schemas``
+        still get a row, just with an uncached schema.
+        """
+
+        def __init__(
+            self,
+            *,
+            max_schemas: int = c.OracleWms.Rows.MAX_SCHEMAS,
+        ) -> None:
+            """Initialize factory caching at most ``max_schemas`` layouts."""
+            self.max_schemas: int = max_schemas
+            self._schemas: dict[
+                tuple[str, ...], FlextOracleWmsUtilitiesRows.RowSchema
+            ] = {}
+
+        def __call__(
+            self,
+            record: Mapping[str, V],
+        ) -> FlextOracleWmsUtilitiesRows.Row[V]:
+            """Return ``record`` as a tuple-backed row."""
+            layout = tuple(record)
+            schema = self._schemas.get(layout)
+            if schema is None:
+                schema = FlextOracleWmsUtilitiesRows.RowSchema(layout)
+                if len(self._schemas) < self.max_schemas:
+                    self._schemas[schema.fields] = schema
+            return FlextOracleWmsUtilitiesRows.Row(schema, tuple(record.values()))
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesRows"]
@@ -0,0 +1,322 @@
+"""Oracle WMS Sorting utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import heapq
+import locale
+import math
+import pickle  # ruff: ignore[suspicious-pickle-import]
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from typing import IO, override
+
+from flext_oracle_wms import c, e, m, t
+from flext_oracle_wms._utilities.expressions import FieldGetter, FieldValue
+
+type SortComponent = (
+    tuple[int]
+    | tuple[int, int, float | str | FlextOracleWmsUtilitiesSorting.DescendingKey]
+)
+type SortKeyFunc = Callable[[t.OracleWms.FilterRecord], tuple[SortComponent, ...]]
+type SortEntry = tuple[tuple[SortComponent, ...], int, t.OracleWms.FilterRecord]
+
+_LAYOUT_ENTRY = 0
+_RECORD_ENTRY = 1
+
+_NUMBER_RANK = 0
+_DATETIME_RANK = 1
+_TEXT_RANK = 2
+
+
+def _number(value: FieldValue) -> float | None:
+    """Return ``value`` parsed as a float, or ``None`` when it is not one."""
+    try:
+        number: float = t.float_adapter().validate_python(value)
+    except c.ValidationError:
+        return None
+    return number
+
+
+def _timestamp(value: str) -> float | None:
+    """Return the POSIX timestamp of an ISO-8601 ``value`` (naive is UTC)."""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.timestamp()
+
+
+class FlextOracleWmsUtilitiesSorting:
+    """Record sorting for Oracle WMS -- u.OracleWms.Sorting.*."""
+
+    class DescendingKey:
+        """Text sort key with inverted ordering, for descending sort keys."""
+
+        __slots__ = ("value",)
+
+        def __init__(self, value: str) -> None:
+            """Wrap ``value``."""
+            self.value = value
+
+        @override
+        def __eq__(self, other: object) -> bool:
+            return (
+                isinstance(other, FlextOracleWmsUtilitiesSorting.DescendingKey)
+                and self.value == other.value
+            )
+
+        @override
+        def __hash__(self) -> int:
+            return hash(self.value)
+
+        def __lt__(self, other: FlextOracleWmsUtilitiesSorting.DescendingKey) -> bool:
+            return other.value < self.value
+
+    class Ordering:
+        """Typed sort keys lowered into one comparable tuple per record."""
+
+        @staticmethod
+        def keys(
+            sort_field: str | Sequence[str | m.OracleWms.SortKey],
+            *,
+            ascending: bool,
+        ) -> list[m.OracleWms.SortKey]:
+            """Normalize ``sort_field`` into ``SortKey`` entries."""
+            fields = [sort_field] if isinstance(sort_field, str) else sort_field
+            return [
+                key
+                if isinstance(key, m.OracleWms.SortKey)
+                else m.OracleWms.SortKey(field=key, ascending=ascending)
+                for key in fields
+            ]
+
+        @staticmethod
+        def component(
+            value: FieldValue,
+            kind: c.OracleWms.SortKind,
+            *,
+            ascending: bool,
+        ) -> SortComponent:
+            """Return the comparable form of one key value; missing sorts last.
+
+            ``SortKind.AUTO`` orders numbers (including numeric strings) first,
+            then ISO-8601 datetime strings by instant, then other text.
+            """
+            typed: float | str | None = None
+            rank = _NUMBER_RANK
+            match kind:
+                case c.OracleWms.SortKind.NUMBER if value is not None:
+                    typed = _number(value)
+                case c.OracleWms.SortKind.DATETIME if isinstance(value, str):
+                    typed = _timestamp(value)
+                    rank = _DATETIME_RANK
+                case c.OracleWms.SortKind.DATETIME | c.OracleWms.SortKind.NUMBER:
+                    typed = None
+                case c.OracleWms.SortKind.LOCALE if value is not None:
+                    typed = locale.strxfrm(str(value))
+                case c.OracleWms.SortKind.AUTO if isinstance(value, int | float):
+                    typed = float(value)
+                case c.OracleWms.SortKind.AUTO if isinstance(value, str):
+                    number = _number(value)
+                    if number is not None and math.isfinite(number):
+                        typed = number
+                    elif (moment := _timestamp(value)) is not None:
+                        typed = moment
+                        rank = _DATETIME_RANK
+                    else:
+                        typed = value
+                case _ if value is not None:
+                    typed = str(value)
+            if typed is None or (isinstance(typed, float) and math.isnan(typed)):
+                return (1,)
+            if isinstance(typed, float):
+                return (0, rank, typed if ascending else -typed)
+            return (
+                0,
+                _TEXT_RANK,
+                typed
+                if ascending
+                else FlextOracleWmsUtilitiesSorting.DescendingKey(typed),
+            )
+
+        @classmethod
+        def compile(
+            cls,
+            keys: Sequence[m.OracleWms.SortKey],
+            compile_getter: Callable[[str], FieldGetter],
+        ) -> SortKeyFunc:
+            """Lower ``keys`` into one tuple key per record for ``sorted``."""
+            plan = [
+                (compile_getter(key.field), key.kind, key.ascending) for key in keys
+            ]
+            component = cls.component
+
+            def sort_key(record: t.OracleWms.FilterRecord) -> tuple[SortComponent, ...]:
+                return tuple(
+                    component(get_value(record), kind, ascending=ascending)
+                    for get_value, kind, ascending in plan
+                )
+
+            return sort_key
+
+    class ExternalSort:
+        """Bounded-memory sort spilling sorted runs to temporary files."""
+
+        @classmethod
+        def iter_sorted(
+            cls,
+            records: Iterable[t.OracleWms.FilterRecord],
+            key_func: SortKeyFunc,
+            *,
+            memory_budget: int = c.OracleWms.Sorting.MEMORY_BUDGET,
+            spill_dir: str | None = None,
+            merge_fan_in: int = c.OracleWms.Sorting.MAX_MERGE_FAN_IN,
+        ) -> Iterator[t.OracleWms.FilterRecord]:
+            """Yield ``records`` ordered by ``key_func``, stable on ties.
+
+            Runs of about ``memory_budget`` bytes are sorted and spilled to
+            ``spill_dir``, every record stored as a layout id plus a tuple of
+            values. While ``merge_fan_in`` runs exist, the oldest ones are
+            merged into a new spill file, so at most ``merge_fan_in`` files
+            are open at once; the last runs are then k-way merged lazily.
+            Spilled records come back as plain dicts.
+
+            Raises:
+                e.BaseError: When ``memory_budget`` is not positive or
+                    ``merge_fan_in`` is below two.
+
+            """
+            if memory_budget <= 0:
+                error_message = "Invalid memory_budget"
+                raise e.BaseError(error_message)
+            if merge_fan_in < c.OracleWms.Sorting.MIN_MERGE_FAN_IN:
+                error_message = "Invalid merge_fan_in"
+                raise e.BaseError(error_message)
+            run: list[SortEntry] = []
+            used = 0
+            spills: list[IO[bytes]] = []
+            try:
+                for sequence, record in enumerate(records):
+                    run.append((key_func(record), sequence, record))
+                    used += cls._record_size(record)
+                    if used >= memory_budget:
+                        spills.append(cls._spill_run(run, spill_dir))
+                        run = []
+                        used = 0
+                    if len(spills) >= merge_fan_in:
+                        spills = cls._merge_runs(spills, merge_fan_in, spill_dir)
+                run.sort()
+                if not spills:
+                    for _, _, record in run:
+                        yield record
+                    return
+                streams = [cls._read_run(spill) for spill in spills]
+                for _, _, record in heapq.merge(*streams, iter(run)):
+                    yield record
+            finally:
+                for spill in spills:
+                    spill.close()
+
+        @classmethod
+        def _merge_runs(
+            cls,
+            spills: list[IO[bytes]],
+            fan_in: int,
+            spill_dir: str | None,
+        ) -> list[IO[bytes]]:
+            """Merge the oldest ``fan_in`` spill files into one new spill file."""
+            merging, remaining = spills[:fan_in], spills[fan_in:]
+            try:
+                merged = cls._write_run(
+                    heapq.merge(*(cls._read_run(spill) for spill in merging)),
+                    spill_dir,
+                )
+            except BaseException:
+                for spill in remaining:
+                    spill.close()
+                raise
+            finally:
+                for spill in merging:
+                    spill.close()
+            remaining.append(merged)
+            return remaining
+
+        @staticmethod
+        def _read_run(spill: IO[bytes]) -> Iterator[SortEntry]:
+            """Yield the entries written by ``_write_run`` in order."""
+            _ = spill.seek(0)
+            layouts: list[tuple[str, ...]] = []
+            while True:
+                try:
+                    entry = pickle.load(spill)  # ruff: ignore[suspicious-pickle-usage]
+                except EOFError:
+                    return
+                if entry[0] == _LAYOUT_ENTRY:
+                    layouts.append(entry[1])
+                    continue
+                _, key, sequence, layout, values = entry
+                yield key, sequence, dict(zip(layouts[layout], values, strict=True))
+
+        @staticmethod
+        def _record_size(record: t.OracleWms.FilterRecord) -> int:
+            """Estimate the in-memory size of ``record`` and its values."""
+            return sys.getsizeof(record) + sum(
+                sys.getsizeof(value) for value in record.values()
+            )
+
+        @classmethod
+        def _spill_run(
+            cls,
+            run: list[SortEntry],
+            spill_dir: str | None,
+        ) -> IO[bytes]:
+            """Sort ``run`` and write it to a temporary file."""
+            run.sort()
+            return cls._write_run(run, spill_dir)
+
+        @staticmethod
+        def _write_entries(entries: Iterable[SortEntry], spill: IO[bytes]) -> None:
+            """Pickle sorted ``entries`` into ``spill``, each layout once."""
+            layouts: dict[tuple[str, ...], int] = {}
+            protocol = pickle.HIGHEST_PROTOCOL
+            for key, sequence, record in entries:
+                fields = tuple(record)
+                layout = layouts.get(fields)
+                if layout is None:
+                    layout = layouts[fields] = len(layouts)
+                    pickle.dump((_LAYOUT_ENTRY, fields), spill, protocol)
+                pickle.dump(
+                    (_RECORD_ENTRY, key, sequence, layout, tuple(record.values())),
+                    spill,
+                    protocol,
+                )
+
+        @classmethod
+        def _write_run(
+            cls,
+            entries: Iterable[SortEntry],
+            spill_dir: str | None,
+        ) -> IO[bytes]:
+            """Write sorted ``entries`` to a new temporary file."""
+            # ruff: disable[open-file-with-context-handler]
+            spill = tempfile.TemporaryFile(dir=spill_dir)
+            # ruff: enable[open-file-with-context-handler]
+            try:
+                cls._write_entries(entries, spill)
+            except BaseException:
+                spill.close()
+                raise
+            return spill
+
+
+__all__: list[str] = [
+    "FlextOracleWmsUtilitiesSorting",
+]
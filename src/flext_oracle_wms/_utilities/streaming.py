@@ -0,0 +1,197 @@
+"""Oracle WMS Streaming utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from collections.abc import Iterable, Iterator, Mapping
+
+from flext_oracle_wms import c, t
+from flext_oracle_wms.errors import FlextOracleWmsError
+
+
+class FlextOracleWmsUtilitiesStreaming:
+    """Streaming decode utilities for Oracle WMS -- u.OracleWms.Streaming.*."""
+
+    class JsonArrayDecoder:
+        """Incremental decoder for one array field of a top-level JSON object.
+
+        Items of ``field`` are yielded as soon as they are complete, so only
+        the current item and the unread input are held in memory. Every other
+        top-level member is collected into ``fields`` and is complete once
+        iteration finishes.
+        """
+
+        def __init__(
+            self,
+            field: str = "data",
+            *,
+            chunk_size: int = c.OracleWms.Streaming.CHUNK_SIZE,
+        ) -> None:
+            """Initialize decoder for ``field`` reading ``chunk_size`` slices."""
+            self.field: str = field
+            self.chunk_size: int = chunk_size
+            self.fields: dict[str, t.JsonValue] = {}
+            self._decoder = json.JSONDecoder()
+            self._chunks: Iterator[str] = iter(())
+            self._buffer = ""
+            self._position = 0
+            self._exhausted = False
+
+        def iter_items(
+            self,
+            source: t.Api.ResponseBody | Iterable[bytes | str],
+        ) -> Iterator[t.JsonValue]:
+            """Yield each item of ``field`` from a body or a chunk stream.
+
+            Raises:
+                FlextOracleWmsError: When the input is not a JSON object or is
+                    truncated.
+
+            """
+            self.fields = {}
+            match source:
+                case Mapping() as payload:
+                    self.fields = {
+                        key: value
+                        for key, value in payload.items()
+                        if key != self.field
+                    }
+                    items = payload.get(self.field)
+                    if isinstance(items, list | tuple):
+                        yield from items
+                    return
+                case bytes() | str() as raw:
+                    self._reset(self._slices(raw))
+                case None:
+                    error_message = "Empty response payload"
+                    raise FlextOracleWmsError(error_message)
+                case _ if isinstance(source, Iterable):
+                    self._reset(self._decode_chunks(source))
+                case _:
+                    error_message = "Unsupported response type"
+                    raise FlextOracleWmsError(error_message)
+            yield from self._iter_object()
+
+        def _decode_chunks(self, chunks: Iterable[bytes | str]) -> Iterator[str]:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for chunk in chunks:
+                text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+                if text:
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
+        def _expect(self, token: str) -> None:
+            if self._peek() != token:
+                error_message = f"Invalid JSON payload: expected {token!r}"
+                raise FlextOracleWmsError(error_message)
+            self._position += 1
+
+        def _fill(self) -> bool:
+            """Append the next chunk to the buffer; False once input is done."""
+            if self._exhausted:
+                return False
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                return False
+            self._buffer = self._buffer[self._position :] + chunk
+            self._position = 0
+            return True
+
+        def _iter_array(self) -> Iterator[t.JsonValue]:
+            self._expect("[")
+            if self._peek() == "]":
+                self._position += 1
+                return
+            while True:
+                yield self._value()
+                match self._peek():
+                    case ",":
+                        self._position += 1
+                    case "]":
+                        self._position += 1
+                        return
+                    case _:
+                        error_message = "Invalid JSON payload: expected ',' or ']'"
+                        raise FlextOracleWmsError(error_message)
+
+        def _iter_object(self) -> Iterator[t.JsonValue]:
+            self._expect("{")
+            if self._peek() == "}":
+                return
+            while True:
+                key = self._value()
+                if not isinstance(key, str):
+                    error_message = "Invalid JSON payload: expected member name"
+                    raise FlextOracleWmsError(error_message)
+                self._expect(":")
+                if key == self.field and self._peek() == "[":
+                    yield from self._iter_array()
+                else:
+                    self.fields[key] = self._value()
+                match self._peek():
+                    case ",":
+                        self._position += 1
+                    case "}":
+                        return
+                    case _:
+                        error_message = "Invalid JSON payload: expected ',' or '}'"
+                        raise FlextOracleWmsError(error_message)
+
+        def _peek(self) -> str:
+            """Return the next non-whitespace character without consuming it."""
+            while True:
+                buffer = self._buffer
+                position = self._position
+                while position < len(buffer) and buffer[position] in " \t\r\n":
+                    position += 1
+                self._position = position
+                if position < len(buffer):
+                    return buffer[position]
+                if not self._fill():
+                    error_message = "Invalid JSON payload: unexpected end of input"
+                    raise FlextOracleWmsError(error_message)
+
+        def _reset(self, chunks: Iterator[str]) -> None:
+            self._chunks = chunks
+            self._buffer = ""
+            self._position = 0
+            self._exhausted = False
+
+        def _slices(self, raw: bytes | str) -> Iterator[str]:
+            size = self.chunk_size
+            if isinstance(raw, str):
+                return (raw[start : start + size] for start in range(0, len(raw), size))
+            return self._decode_chunks(
+                raw[start : start + size] for start in range(0, len(raw), size)
+            )
+
+        def _value(self) -> t.JsonValue:
+            """Decode one complete JSON value, reading more input as needed.
+
+            A value that ends exactly at the buffer edge may be a truncated
+            number or literal, so it is only accepted once input is exhausted
+            or another character follows it.
+            """
+            _ = self._peek()
+            while True:
+                try:
+                    value, end = self._decoder.raw_decode(self._buffer, self._position)
+                except json.JSONDecodeError as exc:
+                    if self._fill():
+                        continue
+                    error_message = f"Invalid JSON payload: {exc}"
+                    raise FlextOracleWmsError(error_message) from exc
+                if end < len(self._buffer) or not self._fill():
+                    self._position = end
+                    return value
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesStreaming"]
@@ -0,0 +1,167 @@
+"""Oracle WMS Transport utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+from flext_api import FlextApi
+
+from flext_oracle_wms import c, e, m, p, r
+
+
+class FlextOracleWmsUtilitiesTransport:
+    """Transport utilities for Oracle WMS -- u.OracleWms.Transport.*."""
+
+    class ConnectionPool:
+        """Bounded per-host pool of persistent keep-alive ``FlextApi`` transports.
+
+        Each pooled transport keeps its underlying connection (and TLS session)
+        open between requests, so a leased transport skips the handshake. At most
+        ``max_size`` transports exist per host; callers beyond that wait up to
+        ``acquire_timeout`` seconds for one to be released.
+        """
+
+        def __init__(
+            self,
+            factory: Callable[[], FlextApi],
+            *,
+            max_size: int = c.OracleWms.Transport.DEFAULT_POOL_SIZE,
+            acquire_timeout: float = c.OracleWms.Transport.POOL_ACQUIRE_TIMEOUT,
+        ) -> None:
+            """Initialize pool with a transport factory and per-host size limit."""
+            if max_size <= 0:
+                error_message = "Invalid max_size"
+                raise e.BaseError(error_message)
+            self.max_size: int = max_size
+            self.acquire_timeout: float = acquire_timeout
+            self._factory = factory
+            self._condition = threading.Condition()
+            self._idle: dict[str, deque[FlextApi]] = {}
+            self._open: dict[str, int] = {}
+            self._closed = False
+            self._hits = 0
+            self._misses = 0
+            self._waits = 0
+            self._timeouts = 0
+
+        @staticmethod
+        def _host_for(url: str) -> str:
+            netloc = urlsplit(url).netloc
+            return netloc.lower() if netloc else ""
+
+        @staticmethod
+        def _close_transport(transport: FlextApi) -> None:
+            close_fn = getattr(transport, "close", None)
+            if callable(close_fn):
+                _ = close_fn()
+
+        def acquire(self, host: str = "") -> p.Result[FlextApi]:
+            """Lease a transport for ``host``, reusing an idle one when possible."""
+            deadline = time.monotonic() + self.acquire_timeout
+            waited = False
+            with self._condition:
+                if self._closed:
+                    return r[FlextApi].fail("Connection pool is closed")
+                idle = self._idle.setdefault(host, deque())
+                while True:
+                    if idle:
+                        self._hits += 1
+                        # LIFO keeps the most recently used (warmest) connection busy.
+                        return r[FlextApi].ok(idle.pop())
+                    if self._open.get(host, 0) < self.max_size:
+                        self._open[host] = self._open.get(host, 0) + 1
+                        self._misses += 1
+                        break
+                    if not waited:
+                        self._waits += 1
+                        waited = True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        return r[FlextApi].fail(
+                            f"Connection pool exhausted for {host or 'default host'}"
+                            f" after {self.acquire_timeout}s",
+                        )
+                    _ = self._condition.wait(remaining)
+            try:
+                transport = self._factory()
+            except Exception:
+                self._forget(host)
+                raise
+            return r[FlextApi].ok(transport)
+
+        def close(self) -> None:
+            """Close every idle transport and refuse further leases."""
+            with self._condition:
+                self._closed = True
+                idle_transports = [
+                    transport for idle in self._idle.values() for transport in idle
+                ]
+                self._idle.clear()
+                self._open.clear()
+                self._condition.notify_all()
+            for transport in idle_transports:
+                self._close_transport(transport)
+
+        def discard(self, host: str, transport: FlextApi) -> None:
+            """Drop a leased transport that is no longer safe to reuse."""
+            self._forget(host)
+            self._close_transport(transport)
+
+        def release(self, host: str, transport: FlextApi) -> None:
+            """Return a leased transport to the idle set for ``host``."""
+            with self._condition:
+                if not self._closed:
+                    self._idle.setdefault(host, deque()).append(transport)
+                    self._condition.notify()
+                    return
+            self._close_transport(transport)
+
+        def request(
+            self,
+            request: m.Api.HttpRequest,
+        ) -> p.Result[m.Api.HttpResponse]:
+            """Execute ``request`` on a pooled transport for its host."""
+            host = self._host_for(request.url)
+            lease = self.acquire(host)
+            if lease.failure:
+                return r[m.Api.HttpResponse].fail(
+                    lease.error or "Connection pool unavailable"
+                )
+            transport = lease.value
+            try:
+                result = transport.request(request)
+            except Exception:
+                self.discard(host, transport)
+                raise
+            self.release(host, transport)
+            return result
+
+        def stats(self) -> m.OracleWms.PoolStats:
+            """Return a snapshot of pool hit, miss and wait counters."""
+            with self._condition:
+                return m.OracleWms.PoolStats(
+                    hits=self._hits,
+                    misses=self._misses,
+                    waits=self._waits,
+                    timeouts=self._timeouts,
+                    open_connections=sum(self._open.values()),
+                    idle_connections=sum(len(idle) for idle in self._idle.values()),
+                )
+
+        def _forget(self, host: str) -> None:
+            with self._condition:
+                if self._open.get(host, 0) > 0:
+                    self._open[host] -= 1
+                self._condition.notify()
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesTransport"]
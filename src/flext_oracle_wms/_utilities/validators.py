@@ -0,0 +1,94 @@
+"""Oracle WMS Validators utilities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import functools
+
+from pydantic import TypeAdapter
+
+from flext_oracle_wms import c, m, p, r, t
+
+
+class FlextOracleWmsUtilitiesValidators:
+    """Prebuilt response validators for Oracle WMS -- u.OracleWms.Validators.*."""
+
+    class ModelDecoder[T: m.BaseModel]:
+        """Decode response bodies into one model with a prebuilt type adapter."""
+
+        __slots__ = ("_adapter", "model_type")
+
+        def __init__(self, model_type: type[T]) -> None:
+            """Build the ``TypeAdapter`` of ``model_type`` once."""
+            self.model_type: type[T] = model_type
+            self._adapter: TypeAdapter[T] = TypeAdapter(model_type)
+
+        def decode(self, payload: t.Api.ResponseBody | t.JsonValue) -> p.Result[T]:
+            """Validate a parsed or raw JSON body into ``model_type``."""
+            match payload:
+                case dict():
+                    try:
+                        return r[T].ok(self._adapter.validate_python(payload))
+                    except c.ValidationError as exc:
+                        return r[T].fail(f"Invalid response payload: {exc}")
+                case str() | bytes():
+                    try:
+                        return r[T].ok(self._adapter.validate_json(payload))
+                    except c.ValidationError as exc:
+                        return r[T].fail(f"Invalid JSON payload: {exc}")
+                case None:
+                    return r[T].fail("Empty response payload")
+                case _:
+                    return r[T].fail("Unsupported response type")
+
+    class JsonMappingDecoder:
+        """Decode response bodies into JSON mappings with one shared adapter."""
+
+        __slots__ = ("_adapter",)
+
+        def __init__(self) -> None:
+            """Build the JSON mapping adapter once."""
+            self._adapter = t.json_mapping_adapter()
+
+        def decode(self, body: t.Api.ResponseBody) -> p.Result[t.JsonMapping]:
+            """Validate a parsed or raw JSON body as a JSON mapping."""
+            match body:
+                case dict() as payload:
+                    try:
+                        return r[t.JsonMapping].ok(
+                            self._adapter.validate_python(payload)
+                        )
+                    except c.EXC_VALIDATION_VALUE as exc:
+                        return r[t.JsonMapping].fail(f"Response parse error: {exc}")
+                case bytes() | str() as raw if isinstance(raw, bytes) or raw:
+                    try:
+                        return r[t.JsonMapping].ok(self._adapter.validate_json(raw))
+                    except c.EXC_VALIDATION_VALUE as exc:
+                        return r[t.JsonMapping].fail(f"Response parse error: {exc}")
+                case _:
+                    return r[t.JsonMapping].fail(
+                        f"Unsupported response body type: {type(body)}"
+                    )
+
+    class Registry:
+        """Process-wide registry of decoders, built on first use per model."""
+
+        @staticmethod
+        @functools.cache
+        def decoder[T: m.BaseModel](
+            model_type: type[T],
+        ) -> FlextOracleWmsUtilitiesValidators.ModelDecoder[T]:
+            """Return the shared decoder for ``model_type``."""
+            return FlextOracleWmsUtilitiesValidators.ModelDecoder(model_type)
+
+        @staticmethod
+        @functools.cache
+        def json_mapping() -> FlextOracleWmsUtilitiesValidators.JsonMappingDecoder:
+            """Return the shared JSON mapping decoder."""
+            return FlextOracleWmsUtilitiesValidators.JsonMappingDecoder()
+
+
+__all__: list[str] = ["FlextOracleWmsUtilitiesValidators"]
@@ -0,0 +1,442 @@
+"""Oracle WMS Vectorized utilities.
+
+NumPy is optional: install the ``numpy`` extra
+(``flext-oracle-wms[numpy]``) for mask-based filtering. Without it
+``VectorizedFilter.filter_batch`` falls back to the pure-Python
+``Filter`` path and ``mask`` raises ``e.BaseError``.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import math
+import operator as operator_module
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, override
+
+from flext_oracle_wms import c, e, m, p, r, t
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
+from flext_oracle_wms._utilities.expressions import (
+    FilterEntry,
+    FlextOracleWmsUtilitiesExpressions,
+)
+from flext_oracle_wms._utilities.filtering import FlextOracleWmsUtilitiesFiltering
+from flext_oracle_wms.errors import FlextOracleWmsValidationError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    NUMPY_AVAILABLE = False
+else:
+    NUMPY_AVAILABLE = True
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+type Mask = NDArray[np.bool_]
+type ColumnKey = tuple[int, int, int]
+
+_INTEGER = 0
+_FLOAT = 1
+_TEXT = 2
+
+_ORDERING: Mapping[str, Callable[..., Mask]] = {
+    c.OracleWms.WmsFilterOperator.GT: operator_module.gt,
+    c.OracleWms.WmsFilterOperator.GTE: operator_module.ge,
+    c.OracleWms.WmsFilterOperator.LT: operator_module.lt,
+    c.OracleWms.WmsFilterOperator.LTE: operator_module.le,
+}
+_MATCHES_NONE = frozenset({
+    c.OracleWms.WmsFilterOperator.EQ,
+    c.OracleWms.WmsFilterOperator.GTE,
+    c.OracleWms.WmsFilterOperator.LTE,
+})
+
+
+def _is_scalar(value: object) -> bool:
+    return value is None or isinstance(value, str | int | float)
+
+
+def _is_exact_number(value: float) -> bool:
+    """Whether ``value`` converts to float64 without rounding."""
+    return isinstance(value, float) or (
+        abs(value) <= c.OracleWms.Vectorized.MAX_EXACT_INTEGER
+    )
+
+
+class FlextOracleWmsUtilitiesVectorized:
+    """NumPy filter backend for Oracle WMS -- u.OracleWms.VectorizedFilter."""
+
+    class EncodedColumn:
+        """One batch column as NumPy arrays, when its values share one type.
+
+        Integer, float and text columns are encoded; missing cells are kept
+        out of ``present`` and stored as ``0`` or ``""`` in ``values``.
+        """
+
+        __slots__ = ("_folded", "kind", "present", "values")
+
+        def __init__(
+            self,
+            kind: int,
+            values: NDArray[np.generic],
+            present: Mask,
+        ) -> None:
+            """Initialize from ``values`` of ``kind`` and the ``present`` mask."""
+            self.kind: int = kind
+            self.values: NDArray[np.generic] = values
+            self.present: Mask = present
+            self._folded: NDArray[np.str_] | None = None
+
+        @classmethod
+        def encode(
+            cls,
+            values: Sequence[t.JsonValue],
+        ) -> FlextOracleWmsUtilitiesVectorized.EncodedColumn | None:
+            """Encode ``values``, or return ``None`` for mixed or nested cells."""
+            kinds = {type(value) for value in values}
+            kinds.discard(type(None))
+            present = np.fromiter(
+                (value is not None for value in values),
+                dtype=np.bool_,
+                count=len(values),
+            )
+            if kinds <= {str}:
+                texts = ["" if value is None else str(value) for value in values]
+                if any(text.endswith("\x00") for text in texts):
+                    return None
+                return cls(_TEXT, np.array(texts, dtype=np.str_), present)
+            if kinds == {float}:
+                return cls(
+                    _FLOAT,
+                    np.array(
+                        [0.0 if value is None else value for value in values],
+                        dtype=np.float64,
+                    ),
+                    present,
+                )
+            if kinds != {int}:
+                return None
+            try:
+                integers = np.array(
+                    [0 if value is None else value for value in values],
+                    dtype=np.int64,
+                )
+            except OverflowError:
+                return None
+            limit = c.OracleWms.Vectorized.MAX_EXACT_INTEGER
+            if bool(((integers > limit) | (integers < -limit)).any()):
+                return None
+            return cls(_INTEGER, integers, present)
+
+        def folded(self) -> NDArray[np.str_]:
+            """Return lower-cased text values, computed once."""
+            if self._folded is None:
+                self._folded = np.array(
+                    [str(text).lower() for text in self.values.tolist()],
+                    dtype=np.str_,
+                )
+            return self._folded
+
+    class VectorizedFilter(FlextOracleWmsUtilitiesFiltering.Filter):
+        """``Filter`` evaluating columnar batches as NumPy boolean masks.
+
+        ``eq``, ``ne``, ``in``, ordering operators, scalar and list entries
+        become array comparisons over encoded columns, combined with ``&``,
+        ``|`` and ``~``. ``contains``, dotted paths and mixed-type columns
+        use the Python predicate for that condition only. Results match
+        ``Filter`` exactly. Encoded columns are cached per batch window, so
+        batches are treated as immutable. Without NumPy, ``filter_batch``
+        runs the Python path.
+        """
+
+        def __init__(
+            self,
+            *,
+            filters: t.MappingKV[str, FilterEntry] | None = None,
+            case_sensitive: bool = False,
+            max_conditions: int = 50,
+        ) -> None:
+            """Initialize filter engine with an empty column cache."""
+            super().__init__(
+                filters=filters,
+                case_sensitive=case_sensitive,
+                max_conditions=max_conditions,
+            )
+            self._columns: dict[
+                ColumnKey,
+                tuple[
+                    list[t.JsonValue],
+                    FlextOracleWmsUtilitiesVectorized.EncodedColumn | None,
+                ],
+            ] = {}
+
+        @staticmethod
+        def available() -> bool:
+            """Whether NumPy is installed."""
+            return NUMPY_AVAILABLE
+
+        @override
+        def filter_batch(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            filters: t.MappingKV[str, FilterEntry],
+            limit: int | None = None,
+            *,
+            workers: int | None = None,
+            chunk_size: int = c.OracleWms.Filtering.PARALLEL_CHUNK_SIZE,
+        ) -> p.Result[FlextOracleWmsUtilitiesColumnar.RecordBatch]:
+            """Filter ``batch`` through one combined mask per call."""
+            if not NUMPY_AVAILABLE or (workers is not None and workers != 1):
+                return super().filter_batch(
+                    batch, filters, limit, workers=workers, chunk_size=chunk_size
+                )
+            if (result := self._validate_filters(filters)).failure:
+                return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].fail(
+                    result.error or "Validation failed",
+                )
+            self.filters = filters
+            positions: list[int] = np.flatnonzero(self.mask(batch, filters)).tolist()
+            if limit is not None:
+                positions = positions[:limit]
+            return r[FlextOracleWmsUtilitiesColumnar.RecordBatch].ok(
+                batch.take(positions)
+            )
+
+        def mask(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            filters: (
+                t.MappingKV[str, FilterEntry]
+                | FlextOracleWmsUtilitiesExpressions.Expression
+            ),
+        ) -> Mask:
+            """Return one boolean per row of ``batch`` matching ``filters``.
+
+            Raises:
+                FlextOracleWmsValidationError: When ``filters`` exceed
+                    ``max_conditions``.
+                BaseError: When NumPy is not installed.
+
+            """
+            if not NUMPY_AVAILABLE:
+                error_message = "NumPy is required for vectorized filtering"
+                raise e.BaseError(error_message)
+            if (result := self._validate_filters(filters)).failure:
+                raise FlextOracleWmsValidationError(result.error or "Validation failed")
+            if isinstance(filters, FlextOracleWmsUtilitiesExpressions.Expression):
+                return self._expression_mask(batch, filters)
+            matched = np.ones(len(batch), dtype=np.bool_)
+            for field, entry in filters.items():
+                matched &= self._condition_mask(batch, field, entry)
+            return matched
+
+        def _candidates_mask(
+            self,
+            column: FlextOracleWmsUtilitiesVectorized.EncodedColumn,
+            candidates: t.OracleWms.FilterList,
+        ) -> Mask | None:
+            """Mirror list entries: hash membership of the raw value."""
+            if not all(_is_scalar(candidate) for candidate in candidates):
+                return None
+            if column.kind == _TEXT:
+                options = [item for item in candidates if isinstance(item, str)]
+                if any(option.endswith("\x00") for option in options):
+                    return None
+                return column.present & np.isin(
+                    column.values, np.array(options, dtype=np.str_)
+                )
+            numbers = [item for item in candidates if isinstance(item, int | float)]
+            if any(
+                (isinstance(item, float) and math.isnan(item))
+                or not _is_exact_number(item)
+                for item in numbers
+            ):
+                return None
+            return column.present & np.isin(
+                column.values, np.array(numbers, dtype=np.float64)
+            )
+
+        def _condition_mask(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            field: str,
+            entry: FilterEntry,
+        ) -> Mask:
+            """Vectorize one condition, or run its Python predicate per row."""
+            column = self._encoded(batch, field)
+            if column is not None:
+                match entry:
+                    case m.OracleWms.FlextOracleWmsOperatorFilter(
+                        operator=operator, value=value
+                    ):
+                        matched = self._operator_mask(column, operator, value)
+                    case list() as candidates:
+                        matched = self._candidates_mask(column, candidates)
+                    case _:
+                        matched = self._equality_mask(column, entry)
+                if matched is not None:
+                    return matched
+            test = self._compile_test(entry)
+            return np.fromiter(
+                (test(value) for value in self._column_values(batch, field)),
+                dtype=np.bool_,
+                count=len(batch),
+            )
+
+        def _encoded(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            field: str,
+        ) -> FlextOracleWmsUtilitiesVectorized.EncodedColumn | None:
+            """Return the cached encoding of flat ``field`` in ``batch``."""
+            if "." in field:
+                return None
+            position = batch.field_index.get(field)
+            if position is None:
+                return FlextOracleWmsUtilitiesVectorized.EncodedColumn.encode(
+                    [None] * len(batch)
+                )
+            values = batch.columns[position]
+            key = (id(values), batch.offset, len(batch))
+            cached = self._columns.get(key)
+            if cached is not None and cached[0] is values:
+                return cached[1]
+            encoded = FlextOracleWmsUtilitiesVectorized.EncodedColumn.encode(
+                batch.column(field)
+            )
+            if len(self._columns) >= c.OracleWms.Vectorized.MAX_CACHED_COLUMNS:
+                self._columns.clear()
+            self._columns[key] = (values, encoded)
+            return encoded
+
+        def _equality_mask(
+            self,
+            column: FlextOracleWmsUtilitiesVectorized.EncodedColumn,
+            value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+        ) -> Mask | None:
+            """Mirror ``normalize(field) == normalize(value)``; missing is ``""``."""
+            if value is None or isinstance(value, str):
+                expected = "" if value is None else value
+                if not self.case_sensitive:
+                    expected = expected.lower()
+                if expected.endswith("\x00"):
+                    return None
+                if column.kind == _TEXT:
+                    texts = column.values if self.case_sensitive else column.folded()
+                    return np.asarray(texts == expected, dtype=np.bool_)
+                if expected:
+                    return np.zeros(len(column.present), dtype=np.bool_)
+                return ~column.present
+            if not isinstance(value, int | float) or not _is_exact_number(value):
+                return None
+            if column.kind == _TEXT:
+                return np.zeros(len(column.present), dtype=np.bool_)
+            return column.present & (column.values == value)
+
+        def _expression_mask(
+            self,
+            batch: FlextOracleWmsUtilitiesColumnar.RecordBatch,
+            expression: FlextOracleWmsUtilitiesExpressions.Expression,
+        ) -> Mask:
+            match expression:
+                case FlextOracleWmsUtilitiesExpressions.Condition(
+                    field=field, entry=entry
+                ):
+                    return self._condition_mask(batch, field, entry)
+                case FlextOracleWmsUtilitiesExpressions.Not(child=child):
+                    return ~self._expression_mask(batch, child)
+                case FlextOracleWmsUtilitiesExpressions.And(children=children):
+                    matched = np.ones(len(batch), dtype=np.bool_)
+                    for child in children:
+                        matched &= self._expression_mask(batch, child)
+                    return matched
+                case FlextOracleWmsUtilitiesExpressions.Or(children=children):
+                    matched = np.zeros(len(batch), dtype=np.bool_)
+                    for child in children:
+                        matched |= self._expression_mask(batch, child)
+                    return matched
+                case _:
+                    error_message = f"Unsupported filter expression: {expression!r}"
+                    raise FlextOracleWmsValidationError(error_message)
+
+        def _operator_mask(
+            self,
+            column: FlextOracleWmsUtilitiesVectorized.EncodedColumn,
+            operator: c.OracleWms.WmsFilterOperator | str,
+            value: t.OracleWms.FilterScalar | t.OracleWms.FilterList,
+        ) -> Mask | None:
+            """Mirror ``_compile_operator``; ``None`` when it cannot vectorize."""
+            if value is None:
+                if operator in _MATCHES_NONE:
+                    return ~column.present
+                return np.zeros(len(column.present), dtype=np.bool_)
+            match operator:
+                case c.OracleWms.WmsFilterOperator.EQ:
+                    equal = self._equality_mask(column, value)
+                    return None if equal is None else column.present & equal
+                case c.OracleWms.WmsFilterOperator.NE:
+                    equal = self._equality_mask(column, value)
+                    return None if equal is None else column.present & ~equal
+                case c.OracleWms.WmsFilterOperator.IN if isinstance(value, list):
+                    return self._options_mask(column, value)
+                case c.OracleWms.WmsFilterOperator.CONTAINS:
+                    return None
+                case _ if operator in _ORDERING and not isinstance(value, list):
+                    return self._ordering_mask(column, _ORDERING[operator], value)
+                case _:
+                    return np.zeros(len(column.present), dtype=np.bool_)
+
+        def _options_mask(
+            self,
+            column: FlextOracleWmsUtilitiesVectorized.EncodedColumn,
+            items: t.OracleWms.FilterList,
+        ) -> Mask | None:
+            """Mirror the ``in`` operator: ``str(field)`` among ``str(items)``."""
+            options = {str(item) for item in items}
+            if column.kind == _TEXT:
+                if any(option.endswith("\x00") for option in options):
+                    return None
+                return column.present & np.isin(
+                    column.values, np.array(sorted(options), dtype=np.str_)
+                )
+            if column.kind != _INTEGER:
+                return None
+            integers: list[int] = []
+            for option in options:
+                try:
+                    number = int(option)
+                except ValueError:
+                    continue
+                if str(number) == option and _is_exact_number(number):
+                    integers.append(number)
+            return column.present & np.isin(
+                column.values, np.array(integers, dtype=np.int64)
+            )
+
+        def _ordering_mask(
+            self,
+            column: FlextOracleWmsUtilitiesVectorized.EncodedColumn,
+            compare: Callable[..., Mask],
+            value: t.OracleWms.FilterScalar,
+        ) -> Mask | None:
+            """Mirror ``_compile_ordering``: exact type match, numbers first."""
+            kind = {int: _INTEGER, float: _FLOAT, str: _TEXT}.get(type(value))
+            if kind != column.kind:
+                return np.zeros(len(column.present), dtype=np.bool_)
+            try:
+                bound: float | None = t.float_adapter().validate_python(value)
+            except c.ValidationError:
+                bound = None
+            if kind == _TEXT:
+                if bound is not None or str(value).endswith("\x00"):
+                    return None
+                return column.present & compare(column.values, value)
+            if bound is None:
+                return None
+            return column.present & compare(column.values.astype(np.float64), bound)
+
+
+__all__: list[str] = ["NUMPY_AVAILABLE", "FlextOracleWmsUtilitiesVectorized"]
@@ -79,6 +79,7 @@ class FlextOracleWmsApi(s[bool]):
         headers: t.StrMapping | None = None,
         *,
         verify_ssl: bool = True,
+        settings: FlextOracleWmsSettings | None = None,
     ) -> u.OracleWms.HttpClient:
         """Create FlextHttpClient instance."""
         return u.OracleWms.HttpClient(
@@ -86,6 +87,7 @@ class FlextOracleWmsApi(s[bool]):
             timeout=timeout,
             headers=headers,
             verify_ssl=verify_ssl,
+            settings=settings,
         )
 
     @staticmethod
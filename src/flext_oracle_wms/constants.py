@@ -111,16 +111,171 @@ class FlextOracleWmsConstants(c):
             DEFAULT_BATCH_SIZE: Final[int] = c.DEFAULT_SIZE
             MAX_BATCH_SIZE: Final[int] = c.MAX_ITEMS
             DEFAULT_PAGE_SIZE: Final[int] = c.DEFAULT_PAGE_SIZE
+            MAX_PREFETCH_DEPTH: Final[int] = 16
             MAX_SCHEMA_DEPTH: ClassVar[int] = 10
 
         class Filtering:
             """Filtering constants - minimal declaration."""
 
             MAX_FILTER_CONDITIONS: ClassVar[int] = 50
+            PUSHDOWN_SUFFIXES: ClassVar[t.StrMapping] = MappingProxyType({
+                "eq": "",
+                "in": "__in",
+                "gt": "__gt",
+                "gte": "__gte",
+                "lt": "__lt",
+                "lte": "__lte",
+            })
+            PUSHDOWN_LIST_SEPARATOR: ClassVar[str] = ","
+            EQUALITY_SELECTIVITY: ClassVar[float] = 0.1
+            RANGE_SELECTIVITY: ClassVar[float] = 1 / 3
+            CONTAINS_SELECTIVITY: ClassVar[float] = 0.25
+            DEFAULT_SELECTIVITY: ClassVar[float] = 0.5
+            MAX_LIST_SELECTIVITY: ClassVar[float] = 0.9
+            PARALLEL_CHUNK_SIZE: ClassVar[int] = 100_000
+            PARALLEL_START_METHOD: ClassVar[str] = "spawn"
+            PARALLEL_WINDOW_PER_WORKER: ClassVar[int] = 2
+            GROUP_BY_CHUNK_SIZE: ClassVar[int] = 65_536
 
         class Authentication:
             """Auth constants - minimal."""
 
+        class Transport:
+            """HTTP transport constants - pooled keep-alive connections."""
+
+            DEFAULT_POOL_SIZE: Final[int] = 10
+            POOL_ACQUIRE_TIMEOUT: Final[float] = 30.0
+            ASYNC_MAX_WORKERS: Final[int] = 32
+
+        class Streaming:
+            """Incremental JSON decoding constants."""
+
+            CHUNK_SIZE: Final[int] = 64 * 1024
+
+        class Sorting:
+            """External merge sort constants."""
+
+            MEMORY_BUDGET: Final[int] = 64 * 1024 * 1024
+            MAX_MERGE_FAN_IN: Final[int] = 64
+            MIN_MERGE_FAN_IN: Final[int] = 2
+
+        class Vectorized:
+            """NumPy filter backend constants."""
+
+            MAX_EXACT_INTEGER: Final[int] = 2**53
+            MAX_CACHED_COLUMNS: Final[int] = 256
+
+        class Rows:
+            """Compact row representation constants."""
+
+            MAX_SCHEMAS: Final[int] = 64
+
+        class Cache:
+            """Response cache constants - TTL plus byte-bounded LRU."""
+
+            MAX_BYTES: Final[int] = 64 * 1024 * 1024
+            MAX_CONDITIONAL_ENTRIES: Final[int] = 1024
+            MAX_CONDITIONAL_BYTES: Final[int] = 16 * 1024 * 1024
+            DISK_FILENAME: Final[str] = "oracle_wms_cache.sqlite3"
+            DISK_BUSY_TIMEOUT: Final[float] = 5.0
+            NOT_MODIFIED_STATUS_CODE: Final[int] = 304
+            VALIDATOR_HEADERS: ClassVar[frozenset[str]] = frozenset({
+                "if-none-match",
+                "if-modified-since",
+            })
+
+        @unique
+        class PayloadValidation(StrEnum):
+            """How strictly entity page payloads are validated."""
+
+            NONE = "none"
+            SHAPE = "shape"
+            FULL = "full"
+
+        @unique
+        class SortKind(StrEnum):
+            """How sort key values are typed before comparison."""
+
+            AUTO = "auto"
+            NUMBER = "number"
+            DATETIME = "datetime"
+            STRING = "string"
+            LOCALE = "locale"
+
+        @unique
+        class AggregateFunction(StrEnum):
+            """Aggregate functions supported by ``Filter.group_by``."""
+
+            COUNT = "count"
+            SUM = "sum"
+            MIN = "min"
+            MAX = "max"
+            AVG = "avg"
+            DISTINCT_COUNT = "distinct_count"
+
+        @unique
+        class CircuitState(StrEnum):
+            """Circuit breaker states."""
+
+            CLOSED = "closed"
+            OPEN = "open"
+            HALF_OPEN = "half_open"
+
+        class CircuitBreaker:
+            """Per-endpoint circuit breaker constants."""
+
+            WINDOW_SIZE: Final[int] = 20
+            MINIMUM_CALLS: Final[int] = 10
+            FAILURE_RATE_THRESHOLD: Final[float] = 0.5
+            OPEN_SECONDS: Final[float] = 30.0
+            HALF_OPEN_MAX_CALLS: Final[int] = 1
+            FAILURE_STATUS_CODE: Final[int] = 500
+            PATH_TEMPLATES: ClassVar[tuple[str, ...]] = (
+                "/entities/{name}",
+                "/apis/category/{category}",
+                "/oblpn/{oblpn_id}/tracking",
+                "/api/{api_name}",
+            )
+
+        class RateLimit:
+            """Client-side rate limiter constants - AIMD token bucket."""
+
+            MIN_RATE: Final[float] = 0.5
+            MAX_RATE: Final[float] = 100.0
+            BURST: Final[float] = 5.0
+            ADDITIVE_INCREASE: Final[float] = 1.0
+            DECREASE_FACTOR: Final[float] = 0.5
+            THROTTLED_STATUS_CODE: Final[int] = 429
+            SERVER_ERROR_STATUS_CODE: Final[int] = 500
+
+        class Retry:
+            """Retry constants - decorrelated-jitter backoff."""
+
+            MAX_DELAY: Final[float] = 30.0
+            DEFAULT_BUDGET: Final[float] = 120.0
+            ALWAYS_RETRYABLE_STATUS_CODES: ClassVar[frozenset[int]] = frozenset({
+                429,
+                503,
+            })
+            IDEMPOTENT_RETRYABLE_STATUS_CODES: ClassVar[frozenset[int]] = frozenset({
+                502,
+                504,
+            })
+            IDEMPOTENT_METHODS: ClassVar[frozenset[str]] = frozenset({
+                "DELETE",
+                "GET",
+                "HEAD",
+                "OPTIONS",
+                "PUT",
+            })
+            CONNECTION_RESET_MARKERS: ClassVar[tuple[str, ...]] = (
+                "connection reset",
+                "connection aborted",
+                "broken pipe",
+                "remote end closed",
+                "server disconnected",
+            )
+
 
 c = FlextOracleWmsConstants
 
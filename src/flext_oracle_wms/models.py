@@ -9,6 +9,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Annotated, ClassVar
 
 from flext_api import m, u
@@ -37,6 +38,39 @@ class FlextOracleWmsModels(m):
             operator: str
             value: t.OracleWms.FilterScalar | t.OracleWms.FilterList
 
+        class SortKey(m.BaseModel):
+            """One ``Filter.sort_records`` key: dot-path field, direction and type."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            field: Annotated[str, u.Field(min_length=1)]
+            ascending: bool = True
+            kind: c.OracleWms.SortKind = c.OracleWms.SortKind.AUTO
+
+        class Aggregate(m.BaseModel):
+            """One ``Filter.group_by`` output: a function over a dot-path field.
+
+            ``field`` may be omitted for ``count`` only, which then counts rows.
+            """
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            function: c.OracleWms.AggregateFunction
+            field: Annotated[str | None, u.Field(min_length=1)] = None
+
+        class FilterPushdown(m.BaseModel):
+            """Filter conditions split into WMS query parameters and a residual."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            params: t.StrMapping = u.Field(default_factory=dict)
+            residual: t.MappingKV[
+                str,
+                t.OracleWms.FilterScalar
+                | t.OracleWms.FilterList
+                | FlextOracleWmsModels.OracleWms.FlextOracleWmsOperatorFilter,
+            ] = u.Field(default_factory=dict)
+
         class Entity(m.BaseModel):
             """Oracle WMS entity definition."""
 
@@ -147,6 +181,60 @@ class FlextOracleWmsModels(m):
             model_config: ClassVar[m.ConfigDict] = m.ConfigDict(extra="ignore")
 
             data: t.SequenceOf[t.StrMapping] = u.Field(default_factory=tuple)
+            next_page: Annotated[
+                str | None,
+                u.Field(description="Cursor URL of the next page"),
+            ] = None
+            page_count: Annotated[
+                t.NonNegativeInt | None,
+                u.Field(description="Total number of pages"),
+            ] = None
+
+        class PoolStats(m.BaseModel):
+            """Connection pool counters snapshot."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            hits: t.NonNegativeInt = 0
+            misses: t.NonNegativeInt = 0
+            waits: t.NonNegativeInt = 0
+            timeouts: t.NonNegativeInt = 0
+            open_connections: t.NonNegativeInt = 0
+            idle_connections: t.NonNegativeInt = 0
+
+        class CacheStats(m.BaseModel):
+            """Response cache counters snapshot."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            hits: t.NonNegativeInt = 0
+            misses: t.NonNegativeInt = 0
+            evictions: t.NonNegativeInt = 0
+            entries: t.NonNegativeInt = 0
+            size_bytes: t.NonNegativeInt = 0
+
+        class CachedDocument(m.BaseModel):
+            """Persistently cached response body with revalidation metadata."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            body: bytes
+            etag: str | None = None
+            last_modified: str | None = None
+            fresh: bool = False
+
+        class RateLimiterStats(m.BaseModel):
+            """Adaptive rate limiter snapshot."""
+
+            model_config: ClassVar[m.ConfigDict] = m.ConfigDict(frozen=True)
+
+            rate: Annotated[
+                float,
+                u.Field(ge=0.0, description="Allowed sustained requests per second"),
+            ] = 0.0
+            granted: t.NonNegativeInt = 0
+            throttled: t.NonNegativeInt = 0
+            waited_seconds: Annotated[float, u.Field(ge=0.0)] = 0.0
 
         # =====================================================================
         # DOMAIN ENTITIES - Composed DDD patterns
@@ -230,6 +318,26 @@ class FlextOracleWmsModels(m):
             value: float = item.quantity * price
             return value
 
+        @staticmethod
+        def calculate_inventory_values(
+            items: Iterable[FlextOracleWmsModels.OracleWms.InventoryItem],
+            prices: float | t.MappingKV[str, float],
+        ) -> p.Result[list[float]]:
+            """Calculate ``calculate_inventory_value`` for many items at once.
+
+            ``prices`` is either one unit price for every item or a unit price
+            per SKU; an item whose SKU has no price fails the whole batch.
+            """
+            if isinstance(prices, int | float):
+                return r[list[float]].ok([item.quantity * prices for item in items])
+            values: list[float] = []
+            for item in items:
+                price = prices.get(item.sku)
+                if price is None:
+                    return r[list[float]].fail(f"Missing price for SKU: {item.sku}")
+                values.append(item.quantity * price)
+            return r[list[float]].ok(values)
+
         @staticmethod
         def validate_entity_name(name: str) -> p.Result[str]:
             """Validate entity name using domain rules."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Annotated, ClassVar, Self
 
 from flext_core import FlextSettingsBase, r
+from flext_oracle_wms.constants import c
 from flext_oracle_wms.models import m
 from flext_oracle_wms.protocols import p
 from flext_oracle_wms.utilities import u
@@ -28,6 +29,10 @@ class FlextOracleWmsSettings(FlextSettingsBase):
     username: Annotated[str, u.Field(description="WMS username")] = ""
     password: Annotated[str, u.Field(description="WMS password")] = ""
     retry_attempts: Annotated[int, u.Field(ge=0, description="Retry attempts")] = 3
+    retry_budget: Annotated[
+        float,
+        u.Field(ge=0.0, description="Per-call retry time budget seconds"),
+    ] = c.OracleWms.Retry.DEFAULT_BUDGET
     api_version: Annotated[str, u.Field(description="WMS API version")] = "LGF_V10"
     auth_method: Annotated[str, u.Field(description="Authentication method")] = "basic"
     verify_ssl: Annotated[
@@ -42,10 +47,46 @@ class FlextOracleWmsSettings(FlextSettingsBase):
         int,
         u.Field(ge=1, description="HTTP connection pool size"),
     ] = 10
+    rate_limit: Annotated[
+        float,
+        u.Field(ge=0.0, description="Initial adaptive requests/second (0 disables)"),
+    ] = 0.0
+    circuit_failure_rate: Annotated[
+        float,
+        u.Field(gt=0.0, le=1.0, description="Failure rate that opens a circuit"),
+    ] = c.OracleWms.CircuitBreaker.FAILURE_RATE_THRESHOLD
+    circuit_window_size: Annotated[
+        int,
+        u.Field(ge=1, description="Calls per endpoint in the failure-rate window"),
+    ] = c.OracleWms.CircuitBreaker.WINDOW_SIZE
+    circuit_open_seconds: Annotated[
+        float,
+        u.Field(ge=0.0, description="Seconds a circuit stays open before probing"),
+    ] = c.OracleWms.CircuitBreaker.OPEN_SECONDS
     cache_duration: Annotated[
         int,
         u.Field(ge=0, description="Cache duration in seconds"),
     ] = 300
+    cache_max_bytes: Annotated[
+        int,
+        u.Field(ge=0, description="Response cache byte budget"),
+    ] = c.OracleWms.Cache.MAX_BYTES
+    persistent_cache_dir: Annotated[
+        str,
+        u.Field(description="On-disk discovery cache directory (empty disables)"),
+    ] = ""
+    persistent_cache_duration: Annotated[
+        int,
+        u.Field(ge=0, description="On-disk discovery cache duration in seconds"),
+    ] = 86400
+    payload_validation: Annotated[
+        c.OracleWms.PayloadValidation,
+        u.Field(description="Entity payload validation: none, shape or full"),
+    ] = c.OracleWms.PayloadValidation.FULL
+    reference_entities: Annotated[
+        tuple[str, ...],
+        u.Field(description="Slow-changing entities whose data GETs are cached"),
+    ] = ("company", "facility", "item", "location")
 
     def validate_config(self) -> p.Result[bool]:
         """Validate configuration business rules."""
@@ -9,22 +9,50 @@ from __future__ import annotations
 from flext_api import u
 
 from flext_core import FlextUtilitiesConversion, FlextUtilitiesReliability
+from flext_oracle_wms._utilities.async_client import FlextOracleWmsUtilitiesAsyncClient
 from flext_oracle_wms._utilities.auth import FlextOracleWmsUtilitiesAuth
+from flext_oracle_wms._utilities.cache import FlextOracleWmsUtilitiesCache
 from flext_oracle_wms._utilities.client import FlextOracleWmsUtilitiesClient
+from flext_oracle_wms._utilities.columnar import FlextOracleWmsUtilitiesColumnar
 from flext_oracle_wms._utilities.discovery import FlextOracleWmsUtilitiesDiscovery
+from flext_oracle_wms._utilities.expressions import FlextOracleWmsUtilitiesExpressions
 from flext_oracle_wms._utilities.filtering import FlextOracleWmsUtilitiesFiltering
+from flext_oracle_wms._utilities.grouping import FlextOracleWmsUtilitiesGrouping
 from flext_oracle_wms._utilities.http_client import FlextOracleWmsUtilitiesHttpClient
+from flext_oracle_wms._utilities.indexing import FlextOracleWmsUtilitiesIndexing
+from flext_oracle_wms._utilities.parallel import FlextOracleWmsUtilitiesParallel
+from flext_oracle_wms._utilities.resilience import FlextOracleWmsUtilitiesResilience
+from flext_oracle_wms._utilities.rows import FlextOracleWmsUtilitiesRows
+from flext_oracle_wms._utilities.sorting import FlextOracleWmsUtilitiesSorting
+from flext_oracle_wms._utilities.streaming import FlextOracleWmsUtilitiesStreaming
+from flext_oracle_wms._utilities.transport import FlextOracleWmsUtilitiesTransport
+from flext_oracle_wms._utilities.validators import FlextOracleWmsUtilitiesValidators
+from flext_oracle_wms._utilities.vectorized import FlextOracleWmsUtilitiesVectorized
 
 
 class FlextOracleWmsUtilities(u, FlextUtilitiesConversion, FlextUtilitiesReliability):
     """Oracle WMS utilities composing all domain-specific utility mixins via MRO."""
 
     class OracleWms(
+        FlextOracleWmsUtilitiesAsyncClient,
         FlextOracleWmsUtilitiesAuth,
+        FlextOracleWmsUtilitiesCache,
         FlextOracleWmsUtilitiesClient,
+        FlextOracleWmsUtilitiesColumnar,
         FlextOracleWmsUtilitiesDiscovery,
+        FlextOracleWmsUtilitiesExpressions,
         FlextOracleWmsUtilitiesFiltering,
+        FlextOracleWmsUtilitiesGrouping,
         FlextOracleWmsUtilitiesHttpClient,
+        FlextOracleWmsUtilitiesIndexing,
+        FlextOracleWmsUtilitiesParallel,
+        FlextOracleWmsUtilitiesResilience,
+        FlextOracleWmsUtilitiesRows,
+        FlextOracleWmsUtilitiesSorting,
+        FlextOracleWmsUtilitiesStreaming,
+        FlextOracleWmsUtilitiesTransport,
+        FlextOracleWmsUtilitiesValidators,
+        FlextOracleWmsUtilitiesVectorized,
     ):
         """Oracle WMS utilities extending u via MRO composition."""
 
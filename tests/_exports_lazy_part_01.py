@@ -21,11 +21,14 @@ TESTS_FLEXT_ORACLE_WMS_LAZY_IMPORTS_PART_01 = build_lazy_import_map(
         ".unit.oracle_wms_complete_discovery": ("OracleWmsCompleteDiscovery",),
         ".unit.oracle_wms_focused_discovery": ("FocusedOracleWmsDiscovery",),
         ".unit.oracle_wms_optimized_discovery": ("OptimizedOracleWmsDiscovery",),
+        ".unit.test_async_client": ("TestsFlextOracleWmsAsyncClient",),
         ".unit.test_authentication": ("TestsFlextOracleWmsAuthentication",),
         ".unit.test_authentication_core": ("TestsFlextOracleWmsAuthenticationCore",),
+        ".unit.test_cache": ("TestsFlextOracleWmsCache",),
         ".unit.test_client": ("TestsFlextOracleWmsClient",),
         ".unit.test_client_class": ("TestsFlextOracleWmsClientClass",),
         ".unit.test_client_core": ("TestsFlextOracleWmsClientCore",),
+        ".unit.test_columnar": ("TestsFlextOracleWmsColumnar",),
         ".unit.test_config": ("TestsFlextOracleWmsConfig",),
         ".unit.test_config_module": ("TestsFlextOracleWmsConfigModule",),
         ".unit.test_connection": ("TestsFlextOracleWmsConnection",),
@@ -34,10 +37,17 @@ TESTS_FLEXT_ORACLE_WMS_LAZY_IMPORTS_PART_01 = build_lazy_import_map(
         ".unit.test_filtering": ("TestsFlextOracleWmsFiltering",),
         ".unit.test_helpers": ("TestsFlextOracleWmsHelpers",),
         ".unit.test_helpers_core": ("TestsFlextOracleWmsHelpersCore",),
+        ".unit.test_indexing": ("TestsFlextOracleWmsIndexing",),
         ".unit.test_models": ("TestsFlextOracleWmsModelsUnit",),
+        ".unit.test_resilience": ("TestsFlextOracleWmsResilience",),
+        ".unit.test_rows": ("TestsFlextOracleWmsRows",),
         ".unit.test_schema_dynamic": ("TestsFlextOracleWmsSchemaDynamic",),
         ".unit.test_singer_flattening": ("TestsFlextOracleWmsSingerFlattening",),
+        ".unit.test_streaming": ("TestsFlextOracleWmsStreaming",),
+        ".unit.test_transport": ("TestsFlextOracleWmsTransport",),
         ".unit.test_unified_config": ("TestsFlextOracleWmsUnifiedConfig",),
+        ".unit.test_validators": ("TestsFlextOracleWmsValidators",),
+        ".unit.test_vectorized": ("TestsFlextOracleWmsVectorized",),
         ".utilities": ("TestsFlextOracleWmsUtilities",),
         "flext_tests": (
             "d",
@@ -13,11 +13,14 @@ _LAZY_IMPORTS = build_lazy_import_map(
         ".oracle_wms_optimized_discovery": ("OptimizedOracleWmsDiscovery",),
         ".sitecustomize": ("sitecustomize",),
         ".test_api": ("test_api",),
+        ".test_async_client": ("TestsFlextOracleWmsAsyncClient",),
         ".test_authentication": ("TestsFlextOracleWmsAuthentication",),
         ".test_authentication_core": ("TestsFlextOracleWmsAuthenticationCore",),
+        ".test_cache": ("TestsFlextOracleWmsCache",),
         ".test_client": ("TestsFlextOracleWmsClient",),
         ".test_client_class": ("TestsFlextOracleWmsClientClass",),
         ".test_client_core": ("TestsFlextOracleWmsClientCore",),
+        ".test_columnar": ("TestsFlextOracleWmsColumnar",),
         ".test_config": ("TestsFlextOracleWmsConfig",),
         ".test_config_module": ("TestsFlextOracleWmsConfigModule",),
         ".test_connection": ("TestsFlextOracleWmsConnection",),
@@ -27,10 +30,17 @@ _LAZY_IMPORTS = build_lazy_import_map(
         ".test_filtering": ("TestsFlextOracleWmsFiltering",),
         ".test_helpers": ("TestsFlextOracleWmsHelpers",),
         ".test_helpers_core": ("TestsFlextOracleWmsHelpersCore",),
+        ".test_indexing": ("TestsFlextOracleWmsIndexing",),
         ".test_models": ("TestsFlextOracleWmsModelsUnit",),
+        ".test_resilience": ("TestsFlextOracleWmsResilience",),
+        ".test_rows": ("TestsFlextOracleWmsRows",),
         ".test_schema_dynamic": ("TestsFlextOracleWmsSchemaDynamic",),
         ".test_singer_flattening": ("TestsFlextOracleWmsSingerFlattening",),
+        ".test_streaming": ("TestsFlextOracleWmsStreaming",),
+        ".test_transport": ("TestsFlextOracleWmsTransport",),
         ".test_unified_config": ("TestsFlextOracleWmsUnifiedConfig",),
+        ".test_validators": ("TestsFlextOracleWmsValidators",),
+        ".test_vectorized": ("TestsFlextOracleWmsVectorized",),
         ".test_wms_api": ("test_wms_api",),
         ".test_wms_client": ("test_wms_client",),
         "flext_tests": (
@@ -0,0 +1,132 @@
+"""Unit tests for the asyncio Oracle WMS client.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import e, r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.errors import FlextOracleWmsError
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesAsyncClient,
+    FlextOracleWmsUtilitiesClient,
+)
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsAsyncClient:
+    """Async surface delegating to the pooled sync transport."""
+
+    @staticmethod
+    def _client(
+        mock_config: FlextOracleWmsSettings,
+        body: object,
+    ) -> FlextOracleWmsUtilitiesAsyncClient.AsyncClient:
+        sync_client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = body
+        sync_client._client = MagicMock()
+        sync_client._client.request.return_value = r[MagicMock].ok(mock_response)
+        return FlextOracleWmsUtilitiesAsyncClient.AsyncClient(client=sync_client)
+
+    def test_health_check(self, mock_config: FlextOracleWmsSettings) -> None:
+        client = self._client(mock_config, {"status": "healthy"})
+
+        async def run() -> bool:
+            async with client:
+                result = await client.health_check()
+            return result.success
+
+        assert asyncio.run(run())
+
+    def test_max_workers_exceeds_connection_pool_size(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        workers = mock_config.connection_pool_size + 2
+        sync_client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {}
+        barrier = threading.Barrier(workers, timeout=5)
+
+        def request(_request: object) -> r[MagicMock]:
+            _ = barrier.wait()
+            return r[MagicMock].ok(mock_response)
+
+        sync_client._client = MagicMock()
+        sync_client._client.request.side_effect = request
+        client = FlextOracleWmsUtilitiesAsyncClient.AsyncClient(
+            client=sync_client,
+            max_workers=workers,
+        )
+
+        async def run() -> list[bool]:
+            async with client:
+                results = await asyncio.gather(
+                    *(client.post(f"/lpn/{index}") for index in range(workers))
+                )
+            return [result.success for result in results]
+
+        assert asyncio.run(run()) == [True] * workers
+
+    def test_invalid_max_workers(self, mock_config: FlextOracleWmsSettings) -> None:
+        with pytest.raises(e.BaseError, match="Invalid max_workers"):
+            _ = FlextOracleWmsUtilitiesAsyncClient.AsyncClient(
+                mock_config,
+                max_workers=0,
+            )
+
+    def test_gather_entities(self, mock_config: FlextOracleWmsSettings) -> None:
+        client = self._client(mock_config, {"data": [{"id": "1"}]})
+
+        async def run() -> list[str]:
+            async with client:
+                results = await client.gather_entities(
+                    ["item", "inventory", "location"],
+                    concurrency=2,
+                )
+            return [name for name, result in results.items() if result.success]
+
+        assert asyncio.run(run()) == ["item", "inventory", "location"]
+
+    def test_iter_entity_data(self, mock_config: FlextOracleWmsSettings) -> None:
+        client = self._client(mock_config, {"data": [{"id": "1"}, {"id": "2"}]})
+
+        async def run() -> list[str]:
+            async with client:
+                return [
+                    str(record["id"])
+                    async for record in client.iter_entity_data(
+                        "inventory", page_size=10
+                    )
+                ]
+
+        assert asyncio.run(run()) == ["1", "2"]
+
+    def test_iter_entity_data_raises_on_failure(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        sync_client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        sync_client._client = MagicMock()
+        sync_client._client.request.return_value = r[MagicMock].fail("Not found")
+        client = FlextOracleWmsUtilitiesAsyncClient.AsyncClient(client=sync_client)
+
+        async def run() -> None:
+            async with client:
+                async for _ in client.iter_entity_data("inventory"):
+                    pass
+
+        with pytest.raises(FlextOracleWmsError):
+            asyncio.run(run())
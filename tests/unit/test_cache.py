@@ -0,0 +1,325 @@
+"""Unit tests for the Oracle WMS response cache.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesCache,
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesHttpClient,
+)
+
+
+def _response(
+    body: object,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.body = body
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsCache:
+    """TTL expiry, LRU byte budget and client wiring."""
+
+    def test_key_sorts_params_and_hides_identity(self) -> None:
+        cache = FlextOracleWmsUtilitiesCache.ResponseCache
+        first = cache.make_key("/entities", {"b": "2", "a": "1"}, "user:secret")
+        second = cache.make_key("/entities", {"a": "1", "b": "2"}, "user:secret")
+        assert first == second
+        assert "secret" not in first
+        assert first != cache.make_key("/entities", {"a": "1"}, "other")
+
+    def test_entries_expire_after_ttl(self) -> None:
+        now = [0.0]
+        cache = FlextOracleWmsUtilitiesCache.ResponseCache(
+            ttl=10.0, clock=lambda: now[0]
+        )
+        cache.put("k", _response({"entities": []}))
+        assert cache.get("k") is not None
+        now[0] = 10.0
+        assert cache.get("k") is None
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entries == 0
+
+    def test_lru_eviction_respects_byte_budget(self) -> None:
+        cache = FlextOracleWmsUtilitiesCache.ResponseCache(ttl=60.0, max_bytes=10)
+        cache.put("a", _response("aaaa"))
+        cache.put("b", _response("bbbb"))
+        assert cache.get("a") is not None
+        cache.put("c", _response("cccc"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats().evictions == 1
+        assert cache.stats().size_bytes == 8
+
+    def test_conditional_cache_respects_byte_budget(self) -> None:
+        cache = FlextOracleWmsUtilitiesCache.ConditionalCache[str](max_bytes=10)
+        cache.remember("a", _response("aaaa", headers={"ETag": '"a"'}), "a")
+        cache.remember("b", _response("bbbb", headers={"ETag": '"b"'}), "b")
+        assert cache.lookup("a") == "a"
+        cache.remember("c", _response("cccc", headers={"ETag": '"c"'}), "c")
+        assert cache.lookup("b") is None
+        assert cache.validators("b") == {}
+        assert cache.size_bytes == 8
+        cache.remember("d", _response("d" * 11, headers={"ETag": '"d"'}), "d")
+        assert cache.lookup("d") is None
+        assert cache.size_bytes == 8
+
+    def test_entity_paging_keeps_conditional_cache_empty(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        pages = [
+            r[MagicMock].ok(
+                _response(
+                    {"data": [{"id": str(number), "blob": "x" * 1024}]},
+                    headers={"ETag": f'"{number}"'},
+                )
+            )
+            for number in range(50)
+        ]
+        pages.append(r[MagicMock].ok(_response({"data": []})))
+        client._client = MagicMock()
+        client._client.request.side_effect = pages
+        records = list(client.iter_entity_data("inventory", page_size=1))
+        assert len(records) == 50
+        assert client._conditional_cache.size_bytes == 0
+        assert all(
+            "If-None-Match" not in call.args[0].headers
+            for call in client._client.request.call_args_list
+        )
+
+    def test_discovery_is_served_from_cache(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(
+            _response({"entities": ["item"]})
+        )
+        assert client.discover_entities().value == ["item"]
+        assert client.discover_entities().value == ["item"]
+        assert client._client.request.call_count == 1
+        assert client.cache_stats().hits == 1
+
+    def test_only_reference_entities_are_cached(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(
+            _response({"data": [{"id": "1"}]})
+        )
+        for _ in range(2):
+            assert client.get_entity_data("facility").success
+            assert client.get_entity_data("inventory").success
+        assert client._client.request.call_count == 3
+
+    def test_writes_invalidate_cache(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(
+            _response({"entities": ["item"]})
+        )
+        assert client.discover_entities().success
+        assert client.create_lpn("LPN1", 1).success
+        assert client.discover_entities().success
+        assert client._client.request.call_count == 3
+
+    def test_zero_duration_disables_cache(self) -> None:
+        settings = FlextOracleWmsSettings(
+            base_url="https://test.wms.com",
+            username="test_user",
+            password="test_pass",
+            cache_duration=0,
+        )
+        client = FlextOracleWmsUtilitiesClient.Client(settings)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(
+            _response({"status": "healthy"})
+        )
+        assert client.health_check().success
+        assert client.health_check().success
+        assert client._client.request.call_count == 2
+
+    def test_disk_cache_dedupes_bodies_and_expires(self, tmp_path: Path) -> None:
+        now = [0.0]
+        cache = FlextOracleWmsUtilitiesCache.DiskCache(
+            tmp_path, ttl=60.0, clock=lambda: now[0]
+        )
+        cache.store("a", b'{"entities": []}', etag='"v1"')
+        cache.store("b", b'{"entities": []}')
+        document = cache.load("a")
+        assert document is not None
+        assert document.fresh
+        assert document.etag == '"v1"'
+        now[0] = 60.0
+        stale = cache.load("a")
+        assert stale is not None
+        assert not stale.fresh
+        cache.touch("a")
+        renewed = cache.load("a")
+        assert renewed is not None
+        assert renewed.fresh
+        assert cache.load("missing") is None
+        cache.close()
+
+    def test_discovery_survives_restart_and_revalidates(
+        self,
+        mock_config: FlextOracleWmsSettings,
+        tmp_path: Path,
+    ) -> None:
+        settings = mock_config.model_copy(
+            update={
+                "cache_duration": 0,
+                "persistent_cache_dir": str(tmp_path),
+                "persistent_cache_duration": 0,
+            },
+        )
+        first = FlextOracleWmsUtilitiesClient.Client(settings)
+        first._client = MagicMock()
+        first._client.request.return_value = r[MagicMock].ok(
+            _response({"entities": ["item"]}, headers={"etag": '"v1"'})
+        )
+        assert first.discover_entities().value == ["item"]
+        _ = first.stop()
+
+        second = FlextOracleWmsUtilitiesClient.Client(settings)
+        second._client = MagicMock()
+        second._client.request.return_value = r[MagicMock].ok(
+            _response(b"", status_code=304)
+        )
+        assert second.discover_entities().value == ["item"]
+        request = second._client.request.call_args.args[0]
+        assert request.headers["If-None-Match"] == '"v1"'
+        _ = second.stop()
+
+    def test_client_get_revalidates_with_etag(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        client._client.request.side_effect = [
+            r[MagicMock].ok(
+                _response(
+                    {"data": []},
+                    headers={"ETag": '"v2"', "Last-Modified": "Mon, 01 Jan 2024"},
+                )
+            ),
+            r[MagicMock].ok(_response(b"", status_code=304)),
+        ]
+        first = client.get("/entities/inventory")
+        second = client.get("/entities/inventory")
+        assert second.value is first.value
+        request = client._client.request.call_args.args[0]
+        assert request.headers["If-None-Match"] == '"v2"'
+        assert request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+
+    def test_client_get_refetches_when_304_entry_was_evicted(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        fresh = _response({"data": [{"id": "1"}]}, headers={"ETag": '"v3"'})
+        responses = iter([
+            _response({"data": []}, headers={"ETag": '"v2"'}),
+            _response(b"", status_code=304),
+            fresh,
+        ])
+
+        def request(_request: object) -> r[MagicMock]:
+            response = next(responses)
+            if response.status_code == 304:
+                client._conditional_cache.clear()
+            return r[MagicMock].ok(response)
+
+        client._client = MagicMock()
+        client._client.request.side_effect = request
+        _ = client.get("/entities/inventory")
+        assert client.get("/entities/inventory").value is fresh
+        retry = client._client.request.call_args.args[0]
+        assert "If-None-Match" not in retry.headers
+
+    def test_client_get_refetches_on_304_for_unknown_validators(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        fresh = _response({"data": []})
+        client._client = MagicMock()
+        client._client.request.side_effect = [
+            r[MagicMock].ok(_response(b"", status_code=304)),
+            r[MagicMock].ok(fresh),
+        ]
+        result = client.get(
+            "/entities/inventory",
+            headers={"If-None-Match": '"never-seen"'},
+        )
+        assert result.value is fresh
+        assert client._client.request.call_count == 2
+        retry = client._client.request.call_args.args[0]
+        assert "If-None-Match" not in retry.headers
+
+    def test_http_client_returns_decoded_body_on_304(self) -> None:
+        http_client = FlextOracleWmsUtilitiesHttpClient.HttpClient(
+            "https://test.wms.com",
+            retry_attempts=0,
+        )
+        http_client._client = MagicMock()
+        http_client._client.request.side_effect = [
+            r[MagicMock].ok(_response({"status": "ok"}, headers={"ETag": '"a"'})),
+            r[MagicMock].ok(_response(b"", status_code=304)),
+        ]
+        assert http_client.get("health").value == {"status": "ok"}
+        assert http_client.get("health").value == {"status": "ok"}
+        request = http_client._client.request.call_args.args[0]
+        assert request.headers["If-None-Match"] == '"a"'
+
+    def test_http_client_refetches_when_304_entry_was_evicted(self) -> None:
+        http_client = FlextOracleWmsUtilitiesHttpClient.HttpClient(
+            "https://test.wms.com",
+            retry_attempts=0,
+        )
+        responses = iter([
+            _response({"status": "ok"}, headers={"ETag": '"a"'}),
+            _response(b"", status_code=304),
+            _response({"status": "fresh"}, headers={"ETag": '"b"'}),
+        ])
+
+        def request(_request: object) -> r[MagicMock]:
+            response = next(responses)
+            if response.status_code == 304:
+                http_client._conditional_cache.clear()
+            return r[MagicMock].ok(response)
+
+        http_client._client = MagicMock()
+        http_client._client.request.side_effect = request
+        assert http_client.get("health").value == {"status": "ok"}
+        assert http_client.get("health").value == {"status": "fresh"}
+        retry = http_client._client.request.call_args.args[0]
+        assert "If-None-Match" not in retry.headers
@@ -14,8 +14,14 @@ from unittest.mock import MagicMock
 import pytest
 from flext_tests import r
 
-from flext_oracle_wms import FlextOracleWmsSettings
-from flext_oracle_wms.utilities import FlextOracleWmsUtilitiesClient
+from flext_oracle_wms import FlextOracleWmsSettings, m
+from flext_oracle_wms.errors import FlextOracleWmsError
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesFiltering,
+    FlextOracleWmsUtilitiesHttpClient,
+)
+from tests.constants import c
 from tests.utilities import u
 
 
@@ -149,6 +155,277 @@ class TestsFlextOracleWmsClientCore:
         result = client.get_entity_data("test_entity")
         assert result.failure
 
+    @pytest.mark.parametrize(
+        ("validation", "succeeds"),
+        [
+            (c.OracleWms.PayloadValidation.FULL, False),
+            (c.OracleWms.PayloadValidation.SHAPE, True),
+            (c.OracleWms.PayloadValidation.NONE, True),
+        ],
+    )
+    def test_get_entity_data_validation_modes(
+        self,
+        mock_config: FlextOracleWmsSettings,
+        validation: c.OracleWms.PayloadValidation,
+        *,
+        succeeds: bool,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = b'{"data": [{"id": 1, "qty": 2.5}], "page_count": 1}'
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        result = client.get_entity_data("inventory", validation=validation)
+        assert result.success is succeeds
+        if succeeds:
+            assert result.value == [{"id": 1, "qty": 2.5}]
+
+    def test_shape_validation_rejects_non_object_records(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        settings = mock_config.model_copy(
+            update={"payload_validation": c.OracleWms.PayloadValidation.SHAPE},
+        )
+        client = FlextOracleWmsUtilitiesClient.Client(settings)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {"data": ["not-a-record"]}
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        assert client.get_entity_data("inventory").failure
+
+    def test_get_entity_data_pushes_conditions_to_query(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {
+            "data": [
+                {"id": "1", "status": "OPEN"},
+                {"id": "2", "status": "closed"},
+            ],
+        }
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        result = client.get_entity_data(
+            "inventory",
+            filters={"facility": "DC1"},
+            conditions={
+                "qty": m.OracleWms.FlextOracleWmsOperatorFilter(
+                    operator="gte", value=5
+                ),
+                "status": "open",
+            },
+        )
+        assert result.success
+        assert [record["id"] for record in result.value] == ["1"]
+        query = client._client.request.call_args.args[0].query_params
+        assert query["facility"] == "DC1"
+        assert query["qty__gte"] == "5"
+        assert "status" not in query
+
+    def test_get_entity_data_pages_until_limit_residual_matches(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        pages = [
+            {"data": [{"id": "1", "status": "closed"}], "page_count": 3},
+            {"data": [{"id": "2", "status": "OPEN"}], "page_count": 3},
+            {"data": [{"id": "3", "status": "open"}], "page_count": 3},
+        ]
+        responses = []
+        for body in pages:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.body = body
+            responses.append(r[MagicMock].ok(mock_response))
+        client._client = MagicMock()
+        client._client.request.side_effect = responses
+        result = client.get_entity_data(
+            "inventory",
+            limit=1,
+            conditions={"status": "open"},
+        )
+        assert [record["id"] for record in result.value] == ["2"]
+        assert client._client.request.call_count == 2
+        query = client._client.request.call_args.args[0].query_params
+        assert "limit" not in query
+
+    def test_get_entity_data_rejects_pushdown_collisions(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        result = client.get_entity_data(
+            "inventory",
+            filters={"qty__gte": "1"},
+            conditions={
+                "qty": m.OracleWms.FlextOracleWmsOperatorFilter(
+                    operator="gte", value=5
+                ),
+            },
+        )
+        assert result.failure
+        assert "qty__gte" in (result.error or "")
+        client._client.request.assert_not_called()
+
+    def test_http_client_trusts_payload_without_validation(self) -> None:
+        http_client = FlextOracleWmsUtilitiesHttpClient.HttpClient(
+            "https://test.wms.com",
+            validation=c.OracleWms.PayloadValidation.NONE,
+        )
+        assert http_client._parse_response_body(b'{"a": [1]}').value == {"a": [1]}
+        assert http_client._parse_response_body(b"[1]").failure
+
+    def test_http_client_follows_resilience_settings(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        settings = mock_config.model_copy(
+            update={
+                "retry_attempts": 1,
+                "retry_budget": 5.0,
+                "circuit_window_size": 4,
+                "circuit_failure_rate": 0.25,
+                "circuit_open_seconds": 2.0,
+            },
+        )
+        http_client = FlextOracleWmsUtilitiesHttpClient.HttpClient(
+            "https://test.wms.com",
+            settings=settings,
+        )
+        client = FlextOracleWmsUtilitiesClient.Client(settings)
+        for resilient in (http_client, client):
+            assert resilient._retry_policy.max_retries == 1
+            assert resilient._retry_policy.budget == pytest.approx(5.0)
+            breakers = resilient._circuit_breakers
+            assert breakers._window_size == 4
+            assert breakers._failure_rate_threshold == pytest.approx(0.25)
+            assert breakers._open_seconds == pytest.approx(2.0)
+
+    def test_iter_entity_data_follows_page_numbers(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        pages = [
+            {"data": [{"id": "1"}, {"id": "2"}]},
+            {"data": [{"id": "3"}]},
+        ]
+        responses = []
+        for body in pages:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.body = body
+            responses.append(r[MagicMock].ok(mock_response))
+        client._client = MagicMock()
+        client._client.request.side_effect = responses
+        records = list(client.iter_entity_data("inventory", page_size=2))
+        assert [record["id"] for record in records] == ["1", "2", "3"]
+        assert client._client.request.call_count == 2
+        second_request = client._client.request.call_args_list[1].args[0]
+        assert second_request.query_params["page"] == "2"
+
+    def test_iter_entity_data_follows_next_page_cursor(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        first = MagicMock()
+        first.status_code = 200
+        first.body = {"data": [{"id": "1"}], "next_page": "/entities/x?page=2"}
+        last = MagicMock()
+        last.status_code = 200
+        last.body = {"data": [{"id": "2"}]}
+        client._client = MagicMock()
+        client._client.request.side_effect = [
+            r[MagicMock].ok(first),
+            r[MagicMock].ok(last),
+        ]
+        records = list(client.iter_entity_data("x", page_size=100))
+        assert [record["id"] for record in records] == ["1", "2"]
+        second_request = client._client.request.call_args_list[1].args[0]
+        assert second_request.url == "/entities/x?page=2"
+
+    def test_streaming_filter_limit_stops_pagination(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        responses = []
+        for page in range(3):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.body = {
+                "data": [{"id": str(page * 2 + offset)} for offset in range(2)],
+                "page_count": 3,
+            }
+            responses.append(r[MagicMock].ok(mock_response))
+        client._client = MagicMock()
+        client._client.request.side_effect = responses
+        matches = FlextOracleWmsUtilitiesFiltering.Filter().iter_filter_records(
+            client.iter_entity_data("inventory", page_size=2),
+            {"id": ["1", "2", "5"]},
+            limit=2,
+        )
+        assert [record["id"] for record in matches] == ["1", "2"]
+        assert client._client.request.call_count == 2
+
+    def test_iter_entity_data_raises_on_failed_page(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].fail("Not found")
+        with pytest.raises(FlextOracleWmsError):
+            list(client.iter_entity_data("inventory"))
+
+    def test_iter_entity_data_prefetch_preserves_page_order(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+
+        def request(http_request: MagicMock) -> object:
+            page = int(http_request.query_params["page"])
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.body = {
+                "data": [{"id": f"{page}-{index}"} for index in range(2)],
+                "page_count": 4,
+            }
+            return r[MagicMock].ok(mock_response)
+
+        client._client = MagicMock()
+        client._client.request.side_effect = request
+        records = list(client.iter_entity_data("inventory", page_size=2, prefetch=3))
+        assert [record["id"] for record in records] == [
+            f"{page}-{index}" for page in range(1, 5) for index in range(2)
+        ]
+        assert client._client.request.call_count == 4
+
+    def test_iter_entity_data_prefetch_stops_when_consumer_stops(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {"data": [{"id": "1"}, {"id": "2"}]}
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        records = client.iter_entity_data("inventory", page_size=2, prefetch=2)
+        assert next(records)["id"] == "1"
+        records.close()
+        assert client._client.request.call_count <= 3
+
     def test_call_api_success(self, mock_config: FlextOracleWmsSettings) -> None:
         client = FlextOracleWmsUtilitiesClient.Client(mock_config)
         mock_response = MagicMock()
@@ -0,0 +1,77 @@
+"""Unit tests for Oracle WMS columnar record batches.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesColumnar,
+    FlextOracleWmsUtilitiesFiltering,
+)
+
+_RECORDS = [
+    {"id": "1", "status": "open", "zone": "A"},
+    {"id": "2", "status": "closed"},
+    {"id": "3", "status": "open", "zone": "B"},
+]
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsColumnar:
+    """Batch layout, views and column-wise filtering."""
+
+    def test_builds_one_column_per_field(self) -> None:
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(_RECORDS)
+        assert batch.fields == ("id", "status", "zone")
+        assert list(batch.column("zone")) == ["A", None, "B"]
+        assert batch.to_records() == _RECORDS
+        assert "zone" not in batch[1]
+
+    def test_slices_share_columns(self) -> None:
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(_RECORDS)
+        tail = batch[1:]
+        assert tail.columns is batch.columns
+        assert len(tail) == 2
+        assert tail[0]["id"] == "2"
+        assert list(tail.column("id")[1:]) == ["3"]
+        assert [row["id"] for row in batch[::2]] == ["1", "3"]
+        with pytest.raises(IndexError):
+            _ = tail[2]
+
+    def test_rejects_ragged_columns(self) -> None:
+        with pytest.raises(Exception, match="Invalid RecordBatch columns"):
+            FlextOracleWmsUtilitiesColumnar.RecordBatch(("a", "b"), [["1"], []])
+
+    def test_filter_batch_matches_filter_records(self) -> None:
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(_RECORDS)
+        engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        filters = {"status": "OPEN", "zone": ["B"]}
+        filtered = engine.filter_batch(batch, filters)
+        assert (
+            filtered.value.to_records()
+            == engine.filter_records(_RECORDS, filters).value
+        )
+
+    def test_client_returns_columnar_batch(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = b'{"data": [{"id": "1"}, {"id": "2", "qty": "5"}]}'
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        batch = client.get_entity_data_columnar("inventory").value
+        assert batch.fields == ("id", "qty")
+        assert list(batch.column("qty")) == [None, "5"]
@@ -18,11 +18,23 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import heapq
+import pickle  # ruff: ignore[suspicious-pickle-import]
+import time
+from collections import UserDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 from flext_tests import e
 
 from flext_oracle_wms.errors import FlextOracleWmsValidationError
-from flext_oracle_wms.utilities import FlextOracleWmsUtilitiesFiltering
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesColumnar,
+    FlextOracleWmsUtilitiesExpressions,
+    FlextOracleWmsUtilitiesFiltering,
+)
 from tests.constants import c
 from tests.models import m
 from tests.typings import t
@@ -802,3 +814,499 @@ class TestsFlextOracleWmsFiltering:
         assert FlextOracleWmsUtilitiesFiltering.Filter._check_max("b", "a") is False
         assert FlextOracleWmsUtilitiesFiltering.Filter._check_min("a", 1) is True
         assert FlextOracleWmsUtilitiesFiltering.Filter._check_max("a", 1) is False
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            "ACTIVE",
+            ["active", "pending"],
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="gte", value=10),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="in", value=["1", "3"]),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="contains", value="c"),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="ne", value=None),
+        ],
+    )
+    def test_compiled_filter_matches_interpreted(
+        self,
+        entry: t.OracleWms.FilterScalar
+        | t.OracleWms.FilterList
+        | m.OracleWms.FlextOracleWmsOperatorFilter,
+    ) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": "1", "status": "active", "qty": 12, "meta": {"status": "active"}},
+            {"id": "2", "status": "pending", "qty": 8},
+            {"id": "3", "status": None, "qty": 10, "meta_status": "active"},
+            {"id": "4", "qty": "10"},
+        ]
+        for field in ("status", "qty", "id", "meta.status"):
+            compiled = filter_engine.compile({field: entry})
+            assert [compiled(record) for record in records] == [
+                filter_engine._matches_condition(record, field, entry)
+                for record in records
+            ]
+
+    def test_compiled_filter_limit_and_validation(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter(max_conditions=2)
+        compiled = filter_engine.compile({"status": "open"})
+        records: list[t.OracleWms.FilterRecord] = [
+            {"status": "open", "id": str(index)} for index in range(5)
+        ]
+        assert [record["id"] for record in compiled.filter(records, limit=2)] == [
+            "0",
+            "1",
+        ]
+        assert compiled.filter(records, limit=0) == []
+        with pytest.raises(FlextOracleWmsValidationError):
+            filter_engine.compile({"id": ["1", "2", "3"]})
+
+    def test_pushdown_splits_supported_conditions(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        result = filter_engine.pushdown({
+            "id": ["1", "2"],
+            "qty": m.OracleWms.FlextOracleWmsOperatorFilter(operator="lt", value=5),
+            "zone": m.OracleWms.FlextOracleWmsOperatorFilter(
+                operator="in", value=["A", "B"]
+            ),
+            "status": "open",
+            "lot": m.OracleWms.FlextOracleWmsOperatorFilter(operator="ne", value="x"),
+            "loc.code": 7,
+            "active": True,
+        })
+        assert result.success
+        assert result.value.params == {
+            "id__in": "1,2",
+            "qty__lt": "5",
+            "zone__in": "A,B",
+        }
+        assert set(result.value.residual) == {
+            "status",
+            "lot",
+            "loc.code",
+            "active",
+        }
+
+    def test_pushdown_case_sensitive_equality_and_id_range(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter(case_sensitive=True)
+        result = filter_engine.pushdown({"status": "open", "note": ["a,b"]})
+        assert result.value.params == {"status": "open"}
+        assert set(result.value.residual) == {"note"}
+        assert FlextOracleWmsUtilitiesFiltering.Filter.pushdown_id_range(
+            "id", 10, None
+        ) == {"id__gte": "10"}
+        assert FlextOracleWmsUtilitiesFiltering.Filter.pushdown_id_range(
+            "id", "A", float("inf")
+        ) == {"id__gte": "A"}
+        assert (
+            FlextOracleWmsUtilitiesFiltering
+            .Filter(max_conditions=1)
+            .pushdown({"id": ["1", "2"]})
+            .failure
+        )
+
+    def test_sort_records_typed_multi_key(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": 1, "zone": "A", "qty": 9, "shipped": "2024-03-01T10:00:00Z"},
+            {"id": 2, "zone": "B", "qty": 10, "shipped": "2024-01-15"},
+            {"id": 3, "zone": "A", "qty": 100, "shipped": None},
+            {"id": 4, "zone": "B", "qty": None, "shipped": "2024-01-15T00:00:00+02:00"},
+        ]
+        by_qty = filter_engine.sort_records(records, "qty")
+        assert [record["id"] for record in by_qty.value] == [1, 2, 3, 4]
+        multi = filter_engine.sort_records(
+            records,
+            [
+                m.OracleWms.SortKey(field="zone", ascending=False),
+                m.OracleWms.SortKey(field="qty", ascending=False),
+            ],
+        )
+        assert [record["id"] for record in multi.value] == [2, 4, 3, 1]
+        by_date = filter_engine.sort_records(
+            records,
+            [m.OracleWms.SortKey(field="shipped", kind=c.OracleWms.SortKind.DATETIME)],
+        )
+        assert [record["id"] for record in by_date.value] == [4, 2, 1, 3]
+
+    def test_sort_records_auto_parses_string_numbers_and_datetimes(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": 1, "qty": "10", "shipped": "2024-03-01T10:00:00Z"},
+            {"id": 2, "qty": "9", "shipped": "2024-01-15"},
+            {"id": 3, "qty": "n/a", "shipped": "pending"},
+            {"id": 4, "qty": "-2.5", "shipped": "2024-01-15T00:00:00+02:00"},
+            {"id": 5, "qty": 100, "shipped": None},
+        ]
+        by_qty = filter_engine.sort_records(records, "qty")
+        assert [record["id"] for record in by_qty.value] == [4, 2, 1, 5, 3]
+        by_qty_desc = filter_engine.sort_records(records, "qty", ascending=False)
+        assert [record["id"] for record in by_qty_desc.value] == [5, 1, 2, 4, 3]
+        by_date = filter_engine.sort_records(records, "shipped", limit=3)
+        assert [record["id"] for record in by_date.value] == [4, 2, 1]
+
+    def test_sort_records_limit_keeps_top_k(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "age": (index * 7919) % 101} for index in range(500)
+        ]
+        keys = [m.OracleWms.SortKey(field="age", ascending=False), "id"]
+        ordered = filter_engine.sort_records(records, keys).value
+        for limit in (0, 1, 20, 1000):
+            top = filter_engine.sort_records(records, keys, limit=limit)
+            assert top.success
+            assert list(top.value) == list(ordered[:limit])
+
+    def test_iter_sorted_records_spills_and_merges(self, tmp_path: Path) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "zone": "AB"[index % 2], "qty": (index * 37) % 11}
+            for index in range(400)
+        ]
+        records[5] = {"id": 5, "lot": "L5"}
+        keys = ["zone", m.OracleWms.SortKey(field="qty", ascending=False)]
+        expected = filter_engine.sort_records(records, keys).value
+        spilled = filter_engine.iter_sorted_records(
+            iter(records), keys, memory_budget=4096, spill_dir=str(tmp_path)
+        )
+        assert list(spilled) == list(expected)
+        assert not list(tmp_path.iterdir())
+        in_memory = filter_engine.iter_sorted_records(records, "id", ascending=False)
+        assert [record["id"] for record in in_memory][:3] == [399, 398, 397]
+        with pytest.raises(e.BaseError, match="Invalid memory_budget"):
+            next(filter_engine.iter_sorted_records(records, "id", memory_budget=0))
+
+    def test_iter_sorted_records_bounds_merge_fan_in(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "qty": (index * 37) % 101} for index in range(600)
+        ]
+        expected = filter_engine.sort_records(records, ["qty", "id"]).value
+        merge = heapq.merge
+        widths: list[int] = []
+
+        def tracked_merge(
+            *iterables: Iterator[object],
+        ) -> Iterator[object]:
+            widths.append(len(iterables))
+            return merge(*iterables)
+
+        monkeypatch.setattr(heapq, "merge", tracked_merge)
+        spilled = filter_engine.iter_sorted_records(
+            iter(records),
+            ["qty", "id"],
+            memory_budget=2048,
+            spill_dir=str(tmp_path),
+            merge_fan_in=3,
+        )
+        assert list(spilled) == list(expected)
+        assert len(widths) > 1
+        assert max(widths) <= 3
+        with pytest.raises(e.BaseError, match="Invalid merge_fan_in"):
+            next(filter_engine.iter_sorted_records(records, "id", merge_fan_in=1))
+
+    def test_iter_filter_records_short_circuits_upstream(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        pulled: list[int] = []
+
+        def upstream() -> Iterator[t.OracleWms.FilterRecord]:
+            for index in range(1000):
+                pulled.append(index)
+                yield {"id": index, "status": "open" if index % 3 == 0 else "x"}
+
+        source = upstream()
+        matches = filter_engine.iter_filter_records(source, {"status": "OPEN"}, 4)
+        assert [record["id"] for record in matches] == [0, 3, 6, 9]
+        assert pulled[-1] == 9
+        assert source.gi_frame is None
+        assert list(filter_engine.iter_filter_records(iter([]), {"a": 1})) == []
+        with pytest.raises(FlextOracleWmsValidationError):
+            _ = FlextOracleWmsUtilitiesFiltering.Filter(
+                max_conditions=1
+            ).iter_filter_records([], {"id": [1, 2]})
+
+    def test_iter_by_id_range_is_lazy(self) -> None:
+        records = ({"id": index} for index in range(10_000))
+        in_range = FlextOracleWmsUtilitiesFiltering.Filter.iter_by_id_range(
+            records, "id", min_id=10, max_id=20, limit=3
+        )
+        assert [record["id"] for record in in_range] == [10, 11, 12]
+        assert records.gi_frame is None
+
+    def test_closing_lazy_filters_early_closes_upstream(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+
+        def upstream() -> Iterator[t.OracleWms.FilterRecord]:
+            for index in range(1000):
+                yield {"id": index, "status": "open"}
+
+        source = upstream()
+        matches = filter_engine.iter_filter_records(source, {"status": "OPEN"})
+        assert next(matches)["id"] == 0
+        matches.close()
+        assert source.gi_frame is None
+        source = upstream()
+        in_range = filter_engine.iter_by_id_range(source, "id", min_id=5)
+        assert next(in_range)["id"] == 5
+        in_range.close()
+        assert source.gi_frame is None
+
+    def test_filter_expression_matches_separate_passes(self) -> None:
+        expressions = FlextOracleWmsUtilitiesExpressions
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "zone": "ABC"[index % 3], "qty": index % 7}
+            for index in range(60)
+        ]
+        low_qty = expressions.Condition(
+            "qty", m.OracleWms.FlextOracleWmsOperatorFilter(operator="lt", value=3)
+        )
+        expression = (expressions.Condition("zone", "a") | low_qty) & ~(
+            expressions.Condition("id", [0, 1, 2])
+        )
+        expected = [
+            record
+            for record in records
+            if (
+                filter_engine._matches_condition(record, "zone", "a")
+                or filter_engine._matches_condition(record, "qty", low_qty.entry)
+            )
+            and not filter_engine._matches_condition(record, "id", [0, 1, 2])
+        ]
+        result = filter_engine.filter_records(records, expression)
+        assert result.success
+        assert list(result.value) == expected
+        lazy = filter_engine.iter_filter_records(iter(records), expression, 2)
+        assert list(lazy) == expected[:2]
+        assert filter_engine.filter_records(records, expressions.Or()).value == []
+        assert len(filter_engine.filter_records(records, expressions.And()).value) == 60
+        too_many = expressions.Or(*(expressions.Condition("id", i) for i in range(51)))
+        assert filter_engine.filter_records(records, too_many).failure
+
+    def test_filter_expression_evaluates_shared_subtree_once(self) -> None:
+        expressions = FlextOracleWmsUtilitiesExpressions
+        reads: list[str] = []
+
+        class CountingRecord(UserDict[str, t.OracleWms.FilterScalar]):
+            def get(
+                self, key: str, default: t.OracleWms.FilterScalar = None
+            ) -> t.OracleWms.FilterScalar:
+                reads.append(key)
+                return super().get(key, default)
+
+        shared = expressions.Condition("zone", "A") & expressions.Condition("lot", "L1")
+        expression = (shared & expressions.Condition("qty", 1)) | (
+            shared & expressions.Condition("qty", 2)
+        )
+        assert expressions.Condition("zone", "A") == expressions.Condition("zone", "A")
+        assert expressions.Condition("qty", 1) != expressions.Condition("qty", "1")
+        compiled = FlextOracleWmsUtilitiesFiltering.Filter().compile_expression(
+            expression
+        )
+        record = CountingRecord(zone="A", lot="L1", qty=2)
+        assert compiled(record)
+        assert reads.count("zone") == 1
+        assert reads.count("lot") == 1
+        assert compiled(record)
+        assert reads.count("zone") == 2
+
+    def test_compiled_expression_is_thread_safe(self) -> None:
+        expressions = FlextOracleWmsUtilitiesExpressions
+
+        class YieldingRecord(UserDict[str, t.OracleWms.FilterScalar]):
+            def get(
+                self, key: str, default: t.OracleWms.FilterScalar = None
+            ) -> t.OracleWms.FilterScalar:
+                time.sleep(0)
+                return super().get(key, default)
+
+        shared = expressions.Condition("zone", "A") & expressions.Condition("lot", "L1")
+        expression = (shared | expressions.Condition("x", 1)) & (
+            shared | expressions.Condition("y", 1)
+        )
+        compiled = FlextOracleWmsUtilitiesFiltering.Filter().compile_expression(
+            expression
+        )
+        records = [
+            YieldingRecord(
+                zone="AB"[index % 2], lot="L1", x=index % 3 // 2, y=index % 5 // 4
+            )
+            for index in range(1000)
+        ]
+        expected = [compiled(record) for record in records]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert list(pool.map(compiled, records)) == expected
+
+    def test_filter_records_parallel_preserves_order(self) -> None:
+        filtering = FlextOracleWmsUtilitiesFiltering
+        filter_engine = filtering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "zone": "ABC"[index % 3], "loc": {"row": index % 7}}
+            for index in range(3000)
+        ]
+        filters = {
+            "zone": "b",
+            "loc.row": m.OracleWms.FlextOracleWmsOperatorFilter(operator="gt", value=3),
+        }
+        compiled = filter_engine.compile(filters)
+        payload = pickle.dumps(compiled)
+        restored = pickle.loads(payload)  # ruff: ignore[suspicious-pickle-usage]
+        assert [restored(record) for record in records] == [
+            compiled(record) for record in records
+        ]
+        expected = list(filter_engine.filter_records(records, filters).value)
+        parallel = filter_engine.filter_records(
+            records, filters, workers=2, chunk_size=400
+        )
+        assert list(parallel.value) == expected
+        limited = filter_engine.filter_records(
+            records, filters, 5, workers=2, chunk_size=400
+        )
+        assert list(limited.value) == expected[:5]
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(records)
+        from_batch = filter_engine.filter_batch(
+            batch, filters, workers=2, chunk_size=400
+        )
+        assert from_batch.value.to_records() == expected
+        with pytest.raises(e.BaseError, match="Invalid workers"):
+            filter_engine.filter_records(records, filters, workers=0)
+
+    def test_filter_records_parallel_bounds_in_flight_chunks(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"id": index, "zone": "A"} for index in range(4000)
+        ]
+        submit = ProcessPoolExecutor.submit
+        submitted: list[object] = []
+
+        def tracked_submit(
+            executor: ProcessPoolExecutor,
+            fn: Callable[..., object],
+            /,
+            *args: object,
+        ) -> Future[object]:
+            submitted.append(fn)
+            return submit(executor, fn, *args)
+
+        monkeypatch.setattr(ProcessPoolExecutor, "submit", tracked_submit)
+        limited = filter_engine.filter_records(
+            records, {"zone": "a"}, 5, workers=2, chunk_size=100
+        )
+        assert [record["id"] for record in limited.value] == [0, 1, 2, 3, 4]
+        assert len(submitted) == 2 * c.OracleWms.Filtering.PARALLEL_WINDOW_PER_WORKER
+
+    def test_group_by_aggregates_records_and_batches(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"location_id": "L1", "zone": "A", "qty": 5, "sku": "S1"},
+            {"location_id": "L2", "zone": "A", "qty": "7", "sku": "S1"},
+            {"location_id": "L1", "zone": "A", "qty": 2.5, "sku": "S2"},
+            {"location_id": "L1", "zone": "B", "qty": None, "sku": "S2"},
+            {"zone": "B", "qty": "n/a"},
+            {"location_id": "L1", "zone": "A", "qty": 1, "sku": "S1"},
+        ]
+        function = c.OracleWms.AggregateFunction
+        aggregations = {
+            "rows": m.OracleWms.Aggregate(function=function.COUNT),
+            "total": m.OracleWms.Aggregate(function=function.SUM, field="qty"),
+            "mean": m.OracleWms.Aggregate(function=function.AVG, field="qty"),
+            "low": m.OracleWms.Aggregate(function=function.MIN, field="qty"),
+            "high": m.OracleWms.Aggregate(function=function.MAX, field="qty"),
+            "skus": m.OracleWms.Aggregate(
+                function=function.DISTINCT_COUNT, field="sku"
+            ),
+        }
+        result = filter_engine.group_by(records, "location_id", aggregations)
+        assert result.success
+        assert list(result.value) == [
+            {
+                "location_id": "L1",
+                "rows": 4,
+                "total": 8.5,
+                "mean": 8.5 / 3,
+                "low": 1,
+                "high": 5,
+                "skus": 2,
+            },
+            {
+                "location_id": "L2",
+                "rows": 1,
+                "total": 7.0,
+                "mean": 7.0,
+                "low": "7",
+                "high": "7",
+                "skus": 1,
+            },
+            {
+                "location_id": None,
+                "rows": 1,
+                "total": 0,
+                "mean": None,
+                "low": "n/a",
+                "high": "n/a",
+                "skus": 0,
+            },
+        ]
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(records)
+        assert filter_engine.group_by(batch, "location_id", aggregations).value == (
+            result.value
+        )
+        by_zone = filter_engine.group_by(
+            records, ["zone", "location_id"], {"rows": aggregations["rows"]}
+        )
+        assert [row["rows"] for row in by_zone.value] == [3, 1, 1, 1]
+        assert filter_engine.group_by(
+            records, "zone", {"zone": aggregations["rows"]}
+        ).failure
+        assert filter_engine.group_by(
+            records, "zone", {"x": m.OracleWms.Aggregate(function=function.SUM)}
+        ).failure
+
+    def test_group_by_min_max_agree_with_sum_on_numeric_strings(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        records: list[t.OracleWms.FilterRecord] = [
+            {"zone": "A", "qty": "9"},
+            {"zone": "A", "qty": "10"},
+            {"zone": "A", "qty": "2.5"},
+            {"zone": "B", "qty": "100"},
+            {"zone": "B", "qty": 20},
+        ]
+        function = c.OracleWms.AggregateFunction
+        aggregations = {
+            "total": m.OracleWms.Aggregate(function=function.SUM, field="qty"),
+            "low": m.OracleWms.Aggregate(function=function.MIN, field="qty"),
+            "high": m.OracleWms.Aggregate(function=function.MAX, field="qty"),
+        }
+        expected = [
+            {"zone": "A", "total": 21.5, "low": "2.5", "high": "10"},
+            {"zone": "B", "total": 120.0, "low": 20, "high": "100"},
+        ]
+        assert list(filter_engine.group_by(records, "zone", aggregations).value) == (
+            expected
+        )
+        assert list(filter_engine.iter_group_by(records, "zone", aggregations)) == (
+            expected
+        )
+
+    def test_iter_group_by_streams_clustered_groups(self) -> None:
+        filter_engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        pulled: list[int] = []
+
+        def upstream() -> Iterator[t.OracleWms.FilterRecord]:
+            for index in range(100):
+                pulled.append(index)
+                yield {"zone": index // 10, "qty": index}
+
+        total = m.OracleWms.Aggregate(
+            function=c.OracleWms.AggregateFunction.SUM, field="qty"
+        )
+        groups = filter_engine.iter_group_by(upstream(), "zone", {"total": total})
+        assert next(groups) == {"zone": 0, "total": 45}
+        assert pulled[-1] == 10
+        assert [row["zone"] for row in groups] == list(range(1, 10))
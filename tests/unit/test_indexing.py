@@ -0,0 +1,114 @@
+"""Unit tests for Oracle WMS indexed record sets.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from flext_oracle_wms import m
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesFiltering,
+    FlextOracleWmsUtilitiesIndexing,
+)
+from tests.constants import c
+from tests.typings import t
+
+_RECORDS: list[t.OracleWms.FilterRecord] = [
+    {"id": "3", "status": "Open", "qty": 12, "zone": {"code": "A"}},
+    {"id": "10", "status": "closed", "qty": 8, "zone": {"code": "B"}},
+    {"id": "1", "status": "open", "qty": 10.5, "zone_code": "A"},
+    {"id": "x7", "status": None, "qty": "10"},
+    {"id": "20", "qty": 30, "zone": {"code": "A"}},
+]
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsIndexing:
+    """Index-backed results must equal the linear filter engine."""
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {"status": "OPEN"},
+            {"status": None},
+            {"status": ["open", "closed"]},
+            {"zone.code": "a", "status": "open"},
+            {"qty": m.OracleWms.FlextOracleWmsOperatorFilter(operator="gte", value=10)},
+            {"qty": m.OracleWms.FlextOracleWmsOperatorFilter(operator="lt", value="9")},
+            {
+                "id": m.OracleWms.FlextOracleWmsOperatorFilter(
+                    operator="in", value=[1, 3]
+                ),
+            },
+            {
+                "status": m.OracleWms.FlextOracleWmsOperatorFilter(
+                    operator="ne", value="x"
+                ),
+            },
+            {
+                "status": m.OracleWms.FlextOracleWmsOperatorFilter(
+                    operator="contains", value="o"
+                ),
+                "qty": m.OracleWms.FlextOracleWmsOperatorFilter(operator="gt", value=9),
+            },
+        ],
+    )
+    def test_filter_records_matches_linear_scan(
+        self,
+        filters: t.MappingKV[
+            str,
+            t.OracleWms.FilterScalar
+            | t.OracleWms.FilterList
+            | m.OracleWms.FlextOracleWmsOperatorFilter,
+        ],
+    ) -> None:
+        engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        indexed = FlextOracleWmsUtilitiesIndexing.IndexedRecordSet(
+            _RECORDS, filter_engine=engine
+        )
+        for limit in (None, 0, 1):
+            expected = engine.filter_records(_RECORDS, filters, limit)
+            result = indexed.filter_records(filters, limit)
+            assert result.success
+            assert list(result.value) == list(expected.value)
+
+    def test_indexes_are_built_on_demand_and_reused(self) -> None:
+        indexed = FlextOracleWmsUtilitiesIndexing.IndexedRecordSet(_RECORDS)
+        assert len(indexed) == len(_RECORDS)
+        assert not indexed.indexes
+        _ = indexed.filter_by_field("status", "open")
+        _ = indexed.filter_by_field("qty", 10, c.OracleWms.WmsFilterOperator.GTE)
+        assert indexed.indexes == {("fold", "status"), ("typed", "qty", int)}
+        index = indexed._hash_indexes["fold", "status"]
+        _ = indexed.filter_by_field("status", "closed")
+        assert indexed._hash_indexes["fold", "status"] is index
+
+    @pytest.mark.parametrize(
+        ("min_id", "max_id"),
+        [(None, None), (2, 10), ("1", None), (None, "3"), ("a", "z")],
+    )
+    def test_filter_by_id_range_matches_linear_scan(
+        self,
+        min_id: t.OracleWms.FilterScalar,
+        max_id: t.OracleWms.FilterScalar,
+    ) -> None:
+        indexed = FlextOracleWmsUtilitiesIndexing.IndexedRecordSet(_RECORDS)
+        expected = FlextOracleWmsUtilitiesFiltering.Filter.filter_by_id_range(
+            _RECORDS, "id", min_id, max_id
+        )
+        assert list(indexed.filter_by_id_range("id", min_id, max_id).value) == list(
+            expected.value
+        )
+
+    def test_filter_records_rejects_too_many_conditions(self) -> None:
+        indexed = FlextOracleWmsUtilitiesIndexing.IndexedRecordSet(
+            _RECORDS,
+            filter_engine=FlextOracleWmsUtilitiesFiltering.Filter(max_conditions=1),
+        )
+        result = indexed.filter_records({"status": ["open", "closed"]})
+        assert result.failure
+        assert result.error is not None and "Too many" in result.error
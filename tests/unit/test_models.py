@@ -39,3 +39,20 @@ class TestsFlextOracleWmsModelsUnit:
         entity = m.OracleWms.Entity(name="item_master", endpoint="/api/items")
         result = entity.validate_entity()
         assert result.success
+
+    def test_calculate_inventory_values_batch(self) -> None:
+        """Batched inventory values match the per-item calculation."""
+        items = [
+            m.OracleWms.InventoryItem(sku="A", quantity=3),
+            m.OracleWms.InventoryItem(sku="B", quantity=0),
+            m.OracleWms.InventoryItem(sku="A", quantity=5),
+        ]
+        uniform = m.OracleWms.calculate_inventory_values(items, 2.5)
+        assert uniform.value == [
+            m.OracleWms.calculate_inventory_value(item, 2.5) for item in items
+        ]
+        per_sku = m.OracleWms.calculate_inventory_values(items, {"A": 2.0, "B": 9.0})
+        assert per_sku.value == [6.0, 0.0, 10.0]
+        missing = m.OracleWms.calculate_inventory_values(items, {"A": 2.0})
+        assert missing.failure
+        assert missing.error == "Missing price for SKU: B"
@@ -0,0 +1,242 @@
+"""Unit tests for Oracle WMS resilience policies.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesResilience,
+)
+from tests.constants import c
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.body = {}
+    return response
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsResilience:
+    """Retry policy decisions and backoff."""
+
+    @staticmethod
+    def _policy(
+        sleeps: list[float],
+        max_retries: int = 3,
+        budget: float = 60.0,
+    ) -> FlextOracleWmsUtilitiesResilience.RetryPolicy:
+        return FlextOracleWmsUtilitiesResilience.RetryPolicy(
+            max_retries=max_retries,
+            base_delay=0.1,
+            max_delay=1.0,
+            budget=budget,
+            sleep=sleeps.append,
+        )
+
+    def test_retries_throttled_then_succeeds(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(
+            side_effect=[
+                r[MagicMock].ok(_response(429)),
+                r[MagicMock].ok(_response(503)),
+                r[MagicMock].ok(_response(200)),
+            ]
+        )
+        result = self._policy(sleeps).execute("POST", send)
+        assert result.value.status_code == 200
+        assert send.call_count == 3
+        assert len(sleeps) == 2
+        assert all(0.1 <= delay <= 1.0 for delay in sleeps)
+
+    def test_gateway_errors_not_retried_for_post(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(return_value=r[MagicMock].ok(_response(502)))
+        result = self._policy(sleeps).execute("POST", send)
+        assert result.value.status_code == 502
+        assert send.call_count == 1
+
+    def test_stops_after_max_retries(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(return_value=r[MagicMock].ok(_response(504)))
+        result = self._policy(sleeps, max_retries=2).execute("GET", send)
+        assert result.value.status_code == 504
+        assert send.call_count == 3
+
+    def test_honors_retry_after(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(
+            side_effect=[
+                r[MagicMock].ok(_response(429, {"Retry-After": "5"})),
+                r[MagicMock].ok(_response(200)),
+            ]
+        )
+        result = self._policy(sleeps).execute("GET", send)
+        assert result.success
+        assert sleeps == [5.0]
+
+    def test_retry_after_beyond_budget_returns_immediately(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(
+            return_value=r[MagicMock].ok(_response(429, {"Retry-After": "90"}))
+        )
+        result = self._policy(sleeps, budget=10.0).execute("GET", send)
+        assert result.value.status_code == 429
+        assert sleeps == []
+
+    def test_connection_reset_retried_for_get_only(self) -> None:
+        sleeps: list[float] = []
+        reset = r[MagicMock].fail("Connection reset by peer")
+        get_send = MagicMock(side_effect=[reset, r[MagicMock].ok(_response(200))])
+        assert self._policy(sleeps).execute("GET", get_send).success
+        post_send = MagicMock(return_value=reset)
+        assert self._policy(sleeps).execute("POST", post_send).failure
+        assert post_send.call_count == 1
+
+    def test_other_transport_failures_not_retried(self) -> None:
+        sleeps: list[float] = []
+        send = MagicMock(return_value=r[MagicMock].fail("Network error"))
+        assert self._policy(sleeps).execute("GET", send).failure
+        assert send.call_count == 1
+
+    def test_client_retries_with_settings(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        client._retry_policy = self._policy([])
+        client._client = MagicMock()
+        client._client.request.side_effect = [
+            r[MagicMock].ok(_response(503)),
+            r[MagicMock].ok(_response(200)),
+        ]
+        assert client.get("/entities").success
+        assert client._client.request.call_count == 2
+
+    def test_rate_limiter_aimd(self) -> None:
+        limiter = FlextOracleWmsUtilitiesResilience.RateLimiter(
+            rate=10.0,
+            min_rate=1.0,
+            max_rate=20.0,
+            clock=lambda: 0.0,
+            sleep=lambda _: None,
+        )
+        limiter.record(r[MagicMock].ok(_response(429)))
+        assert limiter.rate == pytest.approx(5.0)
+        limiter.record(r[MagicMock].ok(_response(200)))
+        assert limiter.rate == pytest.approx(5.2)
+        stats = limiter.stats()
+        assert stats.throttled == 1
+        assert stats.rate == pytest.approx(5.2)
+
+    def test_rate_limiter_paces_after_burst(self) -> None:
+        now = [0.0]
+
+        def sleep(seconds: float) -> None:
+            now[0] += seconds
+
+        limiter = FlextOracleWmsUtilitiesResilience.RateLimiter(
+            rate=2.0,
+            burst=1.0,
+            clock=lambda: now[0],
+            sleep=sleep,
+        )
+        for _ in range(3):
+            limiter.acquire()
+        assert now[0] == pytest.approx(1.0)
+        assert limiter.stats().granted == 3
+
+    def test_client_shares_rate_limiter(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        limiter = FlextOracleWmsUtilitiesResilience.RateLimiter(rate=50.0)
+        client = FlextOracleWmsUtilitiesClient.Client(
+            mock_config,
+            rate_limiter=limiter,
+        )
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(_response(200))
+        assert client.get("/entities").success
+        assert client.rate_limiter_stats().granted == 1
+
+    def test_circuit_opens_and_recovers(self) -> None:
+        now = [0.0]
+        breaker = FlextOracleWmsUtilitiesResilience.CircuitBreaker(
+            window_size=4,
+            minimum_calls=4,
+            failure_rate_threshold=0.5,
+            open_seconds=10.0,
+            clock=lambda: now[0],
+        )
+        for status_code in (200, 500, 200, 503):
+            assert breaker.allow()
+            breaker.record(r[MagicMock].ok(_response(status_code)))
+        assert breaker.state == c.OracleWms.CircuitState.OPEN
+        assert not breaker.allow()
+        now[0] = 10.0
+        assert breaker.state == c.OracleWms.CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record(r[MagicMock].ok(_response(200)))
+        assert breaker.state == c.OracleWms.CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self) -> None:
+        now = [0.0]
+        breaker = FlextOracleWmsUtilitiesResilience.CircuitBreaker(
+            window_size=2,
+            minimum_calls=2,
+            open_seconds=5.0,
+            clock=lambda: now[0],
+        )
+        breaker.record_failure()
+        breaker.record_failure()
+        now[0] = 5.0
+        assert breaker.allow()
+        breaker.record(r[MagicMock].fail("Connection refused"))
+        assert breaker.state == c.OracleWms.CircuitState.OPEN
+
+    def test_registry_folds_paths_onto_templates(self) -> None:
+        registry = FlextOracleWmsUtilitiesResilience.CircuitBreakerRegistry()
+        assert registry.endpoint_key("get", "/entities/inventory?page=2") == (
+            "GET /entities/{name}"
+        )
+        assert registry.endpoint_key(
+            "PUT", "https://wms.example.com/lgfapi/v10/oblpn/42/tracking"
+        ) == ("PUT /oblpn/{oblpn_id}/tracking")
+        assert registry.endpoint_key("GET", "/health") == "GET /health"
+        _, first = registry.breaker_for("GET", "/entities/item")
+        _, second = registry.breaker_for("GET", "/entities/location")
+        assert first is second
+
+    def test_client_fails_fast_when_circuit_open(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        settings = mock_config.model_copy(
+            update={"circuit_window_size": 2, "retry_attempts": 0},
+        )
+        client = FlextOracleWmsUtilitiesClient.Client(settings)
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(_response(503))
+        for _ in range(2):
+            assert client.get_entity_data("inventory").failure
+        result = client.get_entity_data("allocation")
+        assert result.failure
+        assert result.error is not None and "Circuit open" in result.error
+        assert client._client.request.call_count == 2
+        assert client.circuit_states()["GET /entities/{name}"] == (
+            c.OracleWms.CircuitState.OPEN
+        )
@@ -0,0 +1,67 @@
+"""Unit tests for Oracle WMS compact rows.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import pickle  # ruff: ignore[suspicious-pickle-import]
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesFiltering,
+    FlextOracleWmsUtilitiesRows,
+)
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsRows:
+    """Shared schemas, Mapping behaviour and client wiring."""
+
+    def test_rows_share_one_schema_per_layout(self) -> None:
+        make_row = FlextOracleWmsUtilitiesRows.RowFactory[str]()
+        first = make_row({"id": "1", "status": "open"})
+        second = make_row({"id": "2", "status": "closed"})
+        assert first._schema is second._schema
+        assert make_row({"status": "x", "id": "3"})._schema is not first._schema
+        assert first == {"id": "1", "status": "open"}
+        assert dict(second) == {"id": "2", "status": "closed"}
+        assert second.get("missing") is None
+
+    def test_uncached_layouts_still_build_rows(self) -> None:
+        make_row = FlextOracleWmsUtilitiesRows.RowFactory[str](max_schemas=1)
+        _ = make_row({"a": "1"})
+        row = make_row({"b": "2"})
+        assert row["b"] == "2"
+        assert len(make_row._schemas) == 1
+
+    def test_rows_pickle_and_filter(self) -> None:
+        make_row = FlextOracleWmsUtilitiesRows.RowFactory[str]()
+        rows = [make_row({"id": "1", "zone": "A"}), make_row({"id": "2", "zone": "B"})]
+        payload = pickle.dumps(rows[0])
+        assert pickle.loads(payload) == rows[0]  # ruff: ignore[suspicious-pickle-usage]
+        engine = FlextOracleWmsUtilitiesFiltering.Filter()
+        assert engine.filter_records(rows, {"zone": "b"}).value == [rows[1]]
+
+    def test_client_returns_compact_rows(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {"data": [{"id": "1"}, {"id": "2"}]}
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        records = client.get_entity_data("inventory", compact_rows=True).value
+        assert all(isinstance(row, FlextOracleWmsUtilitiesRows.Row) for row in records)
+        assert records == ({"id": "1"}, {"id": "2"})
+        streamed = list(client.iter_entity_data("inventory", compact_rows=True))
+        assert streamed[0]._schema is records[0]._schema
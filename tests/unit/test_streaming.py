@@ -0,0 +1,89 @@
+"""Unit tests for the Oracle WMS incremental JSON decoder.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.errors import FlextOracleWmsError
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesStreaming,
+)
+
+_PAGE = {
+    "meta": {"source": "wms"},
+    "data": [{"id": "1", "name": "café"}, {"id": "22"}, {"id": "333"}],
+    "page_count": 1,
+}
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsStreaming:
+    """Incremental decoding across chunk boundaries and client wiring."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 16, 4096])
+    def test_decodes_items_across_chunk_boundaries(self, chunk_size: int) -> None:
+        decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder(
+            chunk_size=chunk_size
+        )
+        raw = json.dumps(_PAGE, ensure_ascii=False).encode()
+        assert list(decoder.iter_items(raw)) == _PAGE["data"]
+        assert decoder.fields == {"meta": {"source": "wms"}, "page_count": 1}
+
+    def test_accepts_chunk_streams_and_parsed_bodies(self) -> None:
+        decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder()
+        chunks = iter([b'{"da', b'ta": [12', b"3, 4]}"])
+        assert list(decoder.iter_items(chunks)) == [123, 4]
+        assert list(decoder.iter_items(_PAGE)) == _PAGE["data"]
+        assert decoder.fields["page_count"] == 1
+
+    def test_yields_before_reading_the_rest(self) -> None:
+        def chunks() -> Iterator[bytes]:
+            yield b'{"data": [{"id": "1"},'
+            raise AssertionError
+
+        decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder()
+        assert next(decoder.iter_items(chunks())) == {"id": "1"}
+
+    def test_truncated_payload_raises(self) -> None:
+        decoder = FlextOracleWmsUtilitiesStreaming.JsonArrayDecoder()
+        with pytest.raises(FlextOracleWmsError):
+            list(decoder.iter_items(b'{"data": [{"id": "1"}, {"id"'))
+
+    def test_client_streams_raw_page_bodies(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = json.dumps(_PAGE).encode()
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        records = list(client.iter_entity_data("inventory", page_size=2))
+        assert [record["id"] for record in records] == ["1", "22", "333"]
+        assert client._client.request.call_count == 1
+
+    def test_client_rejects_non_string_records(
+        self,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = b'{"data": [{"id": 1}]}'
+        client._client = MagicMock()
+        client._client.request.return_value = r[MagicMock].ok(mock_response)
+        with pytest.raises(FlextOracleWmsError):
+            list(client.iter_entity_data("inventory"))
@@ -0,0 +1,123 @@
+"""Unit tests for the pooled Oracle WMS transport.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import e, r
+
+from flext_oracle_wms import FlextOracleWmsSettings
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesClient,
+    FlextOracleWmsUtilitiesTransport,
+)
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsTransport:
+    """Connection pool reuse, limits and counters."""
+
+    @staticmethod
+    def _pool(
+        max_size: int = 2,
+        acquire_timeout: float = 0.05,
+    ) -> tuple[FlextOracleWmsUtilitiesTransport.ConnectionPool, list[MagicMock]]:
+        created: list[MagicMock] = []
+
+        def factory() -> MagicMock:
+            transport = MagicMock()
+            created.append(transport)
+            return transport
+
+        pool = FlextOracleWmsUtilitiesTransport.ConnectionPool(
+            factory,
+            max_size=max_size,
+            acquire_timeout=acquire_timeout,
+        )
+        return pool, created
+
+    def test_invalid_max_size(self) -> None:
+        with pytest.raises(e.BaseError, match="Invalid max_size"):
+            FlextOracleWmsUtilitiesTransport.ConnectionPool(MagicMock, max_size=0)
+
+    def test_released_transport_is_reused(self) -> None:
+        pool, created = self._pool()
+        first = pool.acquire("wms.example.com")
+        assert first.success
+        pool.release("wms.example.com", first.value)
+        second = pool.acquire("wms.example.com")
+        assert second.success
+        assert second.value is first.value
+        assert len(created) == 1
+        stats = pool.stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    def test_exhausted_pool_waits_then_times_out(self) -> None:
+        pool, _ = self._pool(max_size=1)
+        assert pool.acquire("wms.example.com").success
+        result = pool.acquire("wms.example.com")
+        assert result.failure
+        assert result.error is not None and "exhausted" in result.error
+        stats = pool.stats()
+        assert stats.waits == 1
+        assert stats.timeouts == 1
+
+    def test_hosts_are_pooled_independently(self) -> None:
+        pool, created = self._pool(max_size=1)
+        assert pool.acquire("a.example.com").success
+        assert pool.acquire("b.example.com").success
+        assert len(created) == 2
+
+    def test_request_releases_transport(self) -> None:
+        pool, created = self._pool()
+        request = MagicMock()
+        request.url = "https://wms.example.com/entities"
+        for _ in range(3):
+            assert pool.request(request) is not None
+        assert len(created) == 1
+        assert pool.stats().idle_connections == 1
+
+    def test_close_rejects_new_leases(self) -> None:
+        pool, created = self._pool()
+        lease = pool.acquire()
+        pool.release("", lease.value)
+        pool.close()
+        created[0].close.assert_called_once()
+        assert pool.acquire().failure
+
+    def test_client_uses_configured_pool_size(self) -> None:
+        settings = FlextOracleWmsSettings(
+            base_url="https://test.wms.com",
+            username="test_user",
+            password="test_pass",
+            connection_pool_size=4,
+        )
+        client = FlextOracleWmsUtilitiesClient.Client(settings)
+        assert client._client is not None
+        assert client._client.max_size == 4
+
+    def test_client_reports_pool_stats(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_config: FlextOracleWmsSettings,
+    ) -> None:
+        client = FlextOracleWmsUtilitiesClient.Client(mock_config)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.body = {}
+        transport = MagicMock()
+        transport.request.return_value = r[MagicMock].ok(mock_response)
+        assert client._client is not None
+        monkeypatch.setattr(client._client, "_factory", lambda: transport)
+        assert client.get("/health").success
+        assert client.get("/health").success
+        stats = client.pool_stats()
+        assert stats.misses == 1
+        assert stats.hits == 1
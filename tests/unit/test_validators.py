@@ -0,0 +1,94 @@
+"""Unit tests and benchmarks for the Oracle WMS validator registry.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_oracle_wms import m, p
+from flext_oracle_wms.utilities import FlextOracleWmsUtilitiesValidators
+from tests.constants import c
+from tests.typings import t
+from tests.utilities import u
+
+_RAW = b'{"data": [{"id": "1", "item": "A"}], "page_count": 1}'
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsValidators:
+    """Shared decoders and their per-response overhead."""
+
+    def test_registry_reuses_decoders(self) -> None:
+        registry = FlextOracleWmsUtilitiesValidators.Registry
+        assert registry.decoder(m.OracleWms.EntityDataResponse) is registry.decoder(
+            m.OracleWms.EntityDataResponse
+        )
+        assert registry.decoder(m.OracleWms.EntitiesResponse) is not (
+            registry.decoder(m.OracleWms.EntityDataResponse)
+        )
+        assert registry.json_mapping() is registry.json_mapping()
+
+    def test_model_decoder_results(self) -> None:
+        decoder = FlextOracleWmsUtilitiesValidators.Registry.decoder(
+            m.OracleWms.EntityDataResponse
+        )
+        assert decoder.decode(_RAW).value.data == ({"id": "1", "item": "A"},)
+        assert decoder.decode({"data": [{"id": "1"}]}).success
+        assert decoder.decode(b"{").failure
+        assert decoder.decode(None).error == "Empty response payload"
+        assert decoder.decode(1).error == "Unsupported response type"
+
+    def test_json_mapping_decoder_results(self) -> None:
+        decoder = FlextOracleWmsUtilitiesValidators.Registry.json_mapping()
+        assert decoder.decode(b'{"a": 1}').value == {"a": 1}
+        assert decoder.decode({"a": 1}).success
+        assert decoder.decode(b"[").failure
+        assert decoder.decode('{"a": 1}').value == {"a": 1}
+        assert decoder.decode("").error == (
+            "Unsupported response body type: <class 'str'>"
+        )
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark(group="entity-page-decode")
+    def test_benchmark_decode_per_call_setup(self, benchmark: BenchmarkFixture) -> None:
+        model = m.OracleWms.EntityDataResponse
+
+        def decode() -> p.Result[m.OracleWms.EntityDataResponse]:
+            return u.try_(
+                lambda: model.model_validate_json(_RAW),
+                catch=c.ValidationError,
+            ).map_error(lambda exc: f"Invalid JSON payload: {exc}")
+
+        assert benchmark(decode).success
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark(group="entity-page-decode")
+    def test_benchmark_decode_registry(self, benchmark: BenchmarkFixture) -> None:
+        registry = FlextOracleWmsUtilitiesValidators.Registry
+
+        def decode() -> p.Result[m.OracleWms.EntityDataResponse]:
+            return registry.decoder(m.OracleWms.EntityDataResponse).decode(_RAW)
+
+        assert benchmark(decode).success
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark(group="json-mapping-decode")
+    def test_benchmark_json_mapping_per_call_adapter(
+        self,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        assert benchmark(lambda: t.json_mapping_adapter().validate_json(_RAW))
+
+    @pytest.mark.performance
+    @pytest.mark.benchmark(group="json-mapping-decode")
+    def test_benchmark_json_mapping_registry(
+        self,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        registry = FlextOracleWmsUtilitiesValidators.Registry
+        assert benchmark(lambda: registry.json_mapping().decode(_RAW)).success
@@ -0,0 +1,83 @@
+"""Unit tests for the Oracle WMS NumPy filter backend.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from flext_oracle_wms import m
+from flext_oracle_wms.utilities import (
+    FlextOracleWmsUtilitiesColumnar,
+    FlextOracleWmsUtilitiesExpressions,
+    FlextOracleWmsUtilitiesFiltering,
+    FlextOracleWmsUtilitiesVectorized,
+)
+from tests.typings import t
+
+pytest.importorskip("numpy")
+
+_RECORDS: list[t.OracleWms.FilterRecord] = [
+    {"id": index, "zone": "ABc"[index % 3], "qty": index % 7 * 1.5, "lot": lot}
+    for index, lot in enumerate(["L1", 1, None, "l1", "L2", 2, "x", None, "L10"] * 4)
+]
+
+
+@pytest.mark.unit
+class TestsFlextOracleWmsVectorized:
+    """Vectorized masks agree with the Python filter path."""
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            "c",
+            None,
+            ["A", "c", 3],
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="ne", value="a"),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="gte", value="B"),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="in", value=["A", 1]),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="contains", value="l"),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="lt", value=4.5),
+            m.OracleWms.FlextOracleWmsOperatorFilter(operator="lte", value=None),
+        ],
+    )
+    def test_mask_matches_python_filter(
+        self,
+        entry: t.OracleWms.FilterScalar
+        | t.OracleWms.FilterList
+        | m.OracleWms.FlextOracleWmsOperatorFilter,
+    ) -> None:
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(_RECORDS)[1:]
+        python_filter = FlextOracleWmsUtilitiesFiltering.Filter()
+        vectorized = FlextOracleWmsUtilitiesVectorized.VectorizedFilter()
+        for field in ("zone", "qty", "lot", "id", "missing"):
+            compiled = python_filter.compile({field: entry})
+            assert vectorized.mask(batch, {field: entry}).tolist() == [
+                compiled(row) for row in batch
+            ]
+
+    def test_filter_batch_and_expressions(self) -> None:
+        filtering = FlextOracleWmsUtilitiesFiltering
+        expressions = FlextOracleWmsUtilitiesExpressions
+        batch = FlextOracleWmsUtilitiesColumnar.RecordBatch.from_records(_RECORDS)
+        vectorized = FlextOracleWmsUtilitiesVectorized.VectorizedFilter()
+        filters = {
+            "zone": "a",
+            "qty": m.OracleWms.FlextOracleWmsOperatorFilter(operator="gt", value=1.0),
+        }
+        expected = filtering.Filter().filter_batch(batch, filters, 3)
+        result = vectorized.filter_batch(batch, filters, 3)
+        assert result.success
+        assert result.value.to_records() == expected.value.to_records()
+        zone_or_first = expressions.Condition("zone", "c") | expressions.Condition(
+            "id", 0
+        )
+        expression = zone_or_first & ~expressions.Condition("lot", [None, "x"])
+        compiled = filtering.Filter().compile_expression(expression)
+        assert vectorized.mask(batch, expression).tolist() == [
+            compiled(row) for row in batch
+        ]
+        assert FlextOracleWmsUtilitiesVectorized.VectorizedFilter.available()